@@ -5,7 +5,9 @@ Connects to OpenClaw gateway via WebSocket for real-time data.
 No legacy Clawdbot/Watchtower dependencies.
 """
 
+import atexit
 import json
+import mmap
 import os
 import re
 import subprocess
@@ -16,12 +18,49 @@ import traceback
 import urllib.request
 import urllib.error
 import sys
+from collections import Counter, OrderedDict
+from copy import deepcopy
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
-from flask import Flask, jsonify, render_template, request, send_from_directory
+from flask import (
+    Flask, Response, g, has_request_context, jsonify, render_template, request,
+    send_file, send_from_directory, stream_with_context,
+)
 from flask_cors import CORS
 
+# Fast JSON for hot load/dump paths (orjson optional; stdlib fallback)
+try:
+    import orjson
+
+    def _json_dumps(obj, pretty=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+
+    def _json_dumps(obj, pretty=False):
+        return json.dumps(obj, indent=2 if pretty else None).encode()
+
+    _json_loads = json.loads
+
+
+def ojsonify(obj):
+    """jsonify() for large response payloads, encoded with orjson when available.
+
+    Keys are sorted to match Flask's default provider; anything orjson
+    cannot encode falls back to the regular jsonify path.
+    """
+    if orjson is not None:
+        try:
+            body = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+        else:
+            return app.response_class(body, mimetype="application/json")
+    return jsonify(obj)
+
 # Derive repo root from this script's location (works for any clone name)
 _DASHBOARD_SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = _DASHBOARD_SCRIPT_DIR.parent  # <repo>/dashboard/../ = <repo>
@@ -55,6 +94,7 @@ WORKSPACE = OPENCLAW_HOME / "workspace"
 _ssot_candidate = REPO_ROOT / "ssot"
 SSOT_ROOT = _ssot_candidate if _ssot_candidate.exists() else REPO_ROOT / "ssot-template"
 AGENTS_DIR = OPENCLAW_HOME / "agents"
+AUTH_PROFILES_FILE = AGENTS_DIR / "main" / "agent" / "auth-profiles.json"
 EXTENSIONS_DIR = OPENCLAW_HOME / "extensions"
 RMEMORY_DIR = WORKSPACE / "r-memory"
 RMEMORY_LOG = RMEMORY_DIR / "r-memory.log"
@@ -430,6 +470,41 @@ gw = GatewayClient()
 # Flask App
 # ---------------------------------------------------------------------------
 
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class _OrjsonProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson (jsonify, request.get_json).
+
+        Keeps Flask's key sorting and default() conversions; anything orjson
+        cannot handle goes through the stdlib implementation.
+        """
+
+        _ORJSON_KWARGS = {"indent", "separators", "sort_keys", "default"}
+
+        def dumps(self, obj, **kwargs):
+            if kwargs.keys() <= self._ORJSON_KWARGS and kwargs.get("indent") in (None, 2):
+                option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                if kwargs.get("sort_keys", self.sort_keys):
+                    option |= orjson.OPT_SORT_KEYS
+                if kwargs.get("indent"):
+                    option |= orjson.OPT_INDENT_2
+                try:
+                    return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option).decode()
+                except TypeError:
+                    pass
+            return super().dumps(obj, **kwargs)
+
+        def loads(self, s, **kwargs):
+            if not kwargs:
+                try:
+                    return orjson.loads(s)
+                except orjson.JSONDecodeError:
+                    pass
+            return super().loads(s, **kwargs)
+
+    Flask.json_provider_class = _OrjsonProvider
+
 app = Flask(__name__)
 app.config['TEMPLATES_AUTO_RELOAD'] = True
 app.jinja_env.auto_reload = True
@@ -461,17 +536,41 @@ def inject_version():
 import re as _re
 import glob as _glob
 
+# Log parsing patterns (compiled once; used on every dashboard poll)
+_RMEM_LOG_LINE_RE = _re.compile(
+    r'\[(\d{4}-\d{2}-\d{2}T[\d:.]+Z)\]\s+\[(\w+)\]\s+(.*)'
+)
+_RMEM_HISTORY_SID_RE = _re.compile(r'history-([a-f0-9]+)\.json')
+_RE_INJECT_COUNTS = _re.compile(r'"docs":(\d+),"tokens":(\d+)')
+_RE_INJECT_DOCS = _re.compile(r'"docs":\[([^\]]*)\]')
+# Matched per line (after a substring prefilter), so no MULTILINE scan of the whole log
+_HUMAN_KW_RE = _re.compile(
+    r'\[(\d{4}-\d{2}-\d{2}T[\d:.]+Z)\]\s+\[INFO\]\s+Human keywords matched\s+(\{.*\})'
+)
+
+def _read_log_tail(path, max_bytes=131072):
+    """Return the last max_bytes of a log as text, dropping the leading partial line."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        start = max(0, size - max_bytes)
+        f.seek(start)
+        tail = f.read().decode("utf-8", "ignore")
+    if start > 0:
+        tail = tail.split("\n", 1)[1] if "\n" in tail else ""
+    return tail
+
 def _rmem_config():
     """Read r-memory/config.json."""
     try:
-        return json.loads(RMEMORY_CONFIG.read_text())
+        return _json_loads(RMEMORY_CONFIG.read_bytes())
     except Exception:
         return {"compressTrigger": 36000, "evictTrigger": 80000, "blockSize": 4000}
 
 def _rmem_camouflage():
     """Read r-memory/camouflage.json."""
     try:
-        return json.loads((RMEMORY_DIR / "camouflage.json").read_text())
+        return _json_loads((RMEMORY_DIR / "camouflage.json").read_bytes())
     except Exception:
         return {"enabled": False}
 
@@ -499,25 +598,60 @@ def _rmem_effective_models():
         "narrative": narrative_model,
     }
 
-def _rmem_history_blocks(session_id=None):
-    """Read compressed blocks from history-{sessionId}.json files.
-    If session_id given, only that file. Otherwise aggregate all.
-    Returns list of block dicts with compressed, tokensRaw, tokensCompressed, timestamp."""
-    pattern = str(RMEMORY_DIR / "history-*.json")
+_RMEM_HISTORY_CACHE = {"key": None, "index": None}
+
+def _rmem_history_index():
+    """Load compressed blocks from all history-{sessionId}.json files, bucketed by session.
+    Returns {"all": [...], "by_session": {sid: [...]}, "raw": {sid: n}, "comp": {sid: n},
+    "total_raw": n, "total_comp": n}. Cached until any history file changes."""
+    files = sorted(_glob.glob(str(RMEMORY_DIR / "history-*.json")))
+    key = tuple((f, _stat_sig(f)) for f in files)
+    if _RMEM_HISTORY_CACHE["key"] == key:
+        return _RMEM_HISTORY_CACHE["index"]
+
     all_blocks = []
-    files = _glob.glob(pattern)
+    by_session = {}
+    raw = {}
+    comp = {}
     for f in files:
-        if session_id and session_id not in f:
-            continue
+        name = os.path.basename(f)
+        m = _RMEM_HISTORY_SID_RE.search(name)
+        sid = m.group(1) if m else name[len("history-"):-len(".json")]
         try:
-            data = json.loads(Path(f).read_text())
-            if isinstance(data, list):
-                for b in data:
-                    b["_file"] = Path(f).name
-                    all_blocks.append(b)
+            data = _json_loads(Path(f).read_bytes())
         except Exception:
-            pass
-    return all_blocks
+            continue
+        if not isinstance(data, list):
+            continue
+        bucket = by_session.setdefault(sid, [])
+        for b in data:
+            b["_file"] = name
+            b["_session_id"] = sid
+            bucket.append(b)
+            all_blocks.append(b)
+        raw[sid] = raw.get(sid, 0) + sum(b.get("tokensRaw", 0) for b in data)
+        comp[sid] = comp.get(sid, 0) + sum(b.get("tokensCompressed", 0) for b in data)
+
+    index = {
+        "all": all_blocks,
+        "by_session": by_session,
+        "raw": raw,
+        "comp": comp,
+        "total_raw": sum(raw.values()),
+        "total_comp": sum(comp.values()),
+    }
+    _RMEM_HISTORY_CACHE["key"] = key
+    _RMEM_HISTORY_CACHE["index"] = index
+    return index
+
+def _rmem_history_blocks(session_id=None):
+    """Read compressed blocks from history-{sessionId}.json files.
+    If session_id given, only that session. Otherwise aggregate all.
+    Returns list of block dicts with compressed, tokensRaw, tokensCompressed, timestamp."""
+    index = _rmem_history_index()
+    if session_id:
+        return index["by_session"].get(session_id, [])
+    return index["all"]
 
 def _rmem_current_session_id():
     """Get the current main session ID (short hash) from the most recently modified history file."""
@@ -526,7 +660,7 @@ def _rmem_current_session_id():
     if not files:
         return None
     newest = max(files, key=lambda f: Path(f).stat().st_mtime)
-    m = _re.search(r'history-([a-f0-9]+)\.json', newest)
+    m = _RMEM_HISTORY_SID_RE.search(newest)
     return m.group(1) if m else None
 
 def _rmem_parse_log():
@@ -542,66 +676,78 @@ def _rmem_parse_log():
     except Exception:
         return events
 
-    line_re = _re.compile(
-        r'^\[(\d{4}-\d{2}-\d{2}T[\d:.]+Z)\]\s+\[(\w+)\]\s+(.*)', _re.MULTILINE
-    )
-    for m in line_re.finditer(text):
+    # One pass over the lines: cheap first-char check, anchored match, then
+    # substring dispatch. Inline JSON is only parsed for classified events.
+    for line in text.split("\n"):
+        if line[:1] != "[":
+            continue
+        m = _RMEM_LOG_LINE_RE.match(line)
+        if not m:
+            continue
         ts, level, body = m.group(1), m.group(2), m.group(3)
         evt = {"ts": ts, "level": level, "raw": body}
 
-        # Try to extract inline JSON
-        json_match = _re.search(r'\{.*\}', body)
-        payload = {}
-        if json_match:
-            try:
-                payload = json.loads(json_match.group())
-            except Exception:
-                pass
-
         if "=== COMPACTION ===" in body:
-            evt["event"] = "compaction_start"
-            evt.update(payload)
+            etype = "compaction_start"
         elif "=== DONE ===" in body:
-            evt["event"] = "compaction_done"
-            evt.update(payload)
+            etype = "compaction_done"
         elif "Swap plan" in body:
-            evt["event"] = "swap_plan"
-            evt.update(payload)
+            etype = "swap_plan"
         elif "Block compressed" in body:
-            evt["event"] = "block_compressed"
-            evt.update(payload)
+            etype = "block_compressed"
         elif "FIFO evicted" in body:
-            evt["event"] = "fifo_evicted"
-            evt.update(payload)
+            etype = "fifo_evicted"
         elif "FIFO done" in body:
-            evt["event"] = "fifo_done"
-            evt.update(payload)
+            etype = "fifo_done"
         elif body.startswith("Session "):
-            evt["event"] = "session"
-            evt.update(payload)
+            etype = "session"
         elif "init" in body and ("R-Memory" in body or "r-memory" in body.lower()):
-            evt["event"] = "init"
-            evt.update(payload)
+            etype = "init"
         elif "Config loaded" in body:
-            evt["event"] = "config_loaded"
-            evt.update(payload)
+            etype = "config_loaded"
         else:
-            evt["event"] = "info"
+            etype = "info"
+        evt["event"] = etype
+
+        if etype != "info":
+            # Inline JSON spans the first "{" to the last "}"
+            start = body.find("{")
+            end = body.rfind("}")
+            if start != -1 and end > start:
+                try:
+                    evt.update(_json_loads(body[start:end + 1]))
+                except Exception:
+                    pass
 
         events.append(evt)
     return events
 
+_WORKSPACE_FILES = ("AGENTS.md", "SOUL.md", "USER.md", "TOOLS.md", "IDENTITY.md",
+                    "HEARTBEAT.md", "MEMORY.md")
+
+def _workspace_token_map():
+    """{name: token_estimate} for the workspace files injected into every prompt.
+    Uses the ~4 bytes/token heuristic on st_size, so no file is read."""
+    tokens = {}
+    for fname in _WORKSPACE_FILES:
+        try:
+            tokens[fname] = os.stat(WORKSPACE / fname).st_size // 4
+        except OSError:
+            pass
+    return tokens
+
+_RMEM_SESSION_PATHS = [
+    Path.home() / ".openclaw" / "agents" / "main" / "sessions" / "sessions.json",
+    Path.home() / ".openclaw" / "memory" / "agents" / "main" / "sessions" / "sessions.json",
+]
+
 def _rmem_gateway_session():
     """Get main session data from sessions.json file directly."""
-    session_paths = [
-        Path.home() / ".openclaw" / "agents" / "main" / "sessions" / "sessions.json",
-        Path.home() / ".openclaw" / "memory" / "agents" / "main" / "sessions" / "sessions.json",
-    ]
-    for sessions_path in session_paths:
+    for sessions_path in _RMEM_SESSION_PATHS:
         if not sessions_path.exists():
             continue
         try:
-            data = json.loads(sessions_path.read_text())
+            data = _json_loads(sessions_path.read_bytes())
             # sessions.json is a dict keyed by session key
             if isinstance(data, dict) and "agent:main:main" in data:
                 return data["agent:main:main"]
@@ -1216,7 +1362,7 @@ def api_wallet_build_transfer_tx():
         from solders.instruction import Instruction as _Ix, AccountMeta as _AM
         from solders.transaction import Transaction as _Tx
         from solders.message import Message as _Msg
-        from solana.rpc.api import Client as _Client
+        from wallet import rpc_client as _rpc_client
 
         data = request.get_json(force=True)
         network = data.get("network", "devnet")
@@ -1288,7 +1434,7 @@ def api_wallet_build_transfer_tx():
 
         # Optionally create recipient ATA if it doesn't exist
         rpcs = {"devnet": "https://api.devnet.solana.com", "testnet": "https://api.testnet.solana.com", "mainnet-beta": "https://api.mainnet-beta.com"}
-        client = _Client(rpcs.get(network, network))
+        client = _rpc_client(rpcs.get(network, network))
 
         instructions = []
 
@@ -1340,7 +1486,7 @@ def api_wallet_build_sol_transfer():
         from solders.instruction import Instruction as _Ix, AccountMeta as _AM
         from solders.transaction import Transaction as _Tx
         from solders.message import Message as _Msg
-        from solana.rpc.api import Client as _Client
+        from wallet import rpc_client as _rpc_client
 
         data = request.get_json(force=True)
         network = data.get("network", "devnet")
@@ -1375,7 +1521,7 @@ def api_wallet_build_sol_transfer():
             ix = _Ix(system_prog, ix_data, accounts)
 
         rpcs = {"devnet": "https://api.devnet.solana.com", "testnet": "https://api.testnet.solana.com", "mainnet-beta": "https://api.mainnet-beta.com"}
-        client = _Client(rpcs.get(network, network))
+        client = _rpc_client(rpcs.get(network, network))
         blockhash_resp = client.get_latest_blockhash()
         blockhash = blockhash_resp.value.blockhash
 
@@ -2452,7 +2598,7 @@ def symbiotic_build_init_tx():
         from solders.system_program import ID as _SYS
         from solders.transaction import Transaction as _Tx
         from solders.message import Message as _Msg
-        from solana.rpc.api import Client as _Client
+        from wallet import rpc_client as _rpc_client
 
         program_id = _Pubkey.from_string(_SYMBIOTIC_PROGRAM_ID)
         human = _Pubkey.from_string(human_str)
@@ -2478,7 +2624,7 @@ def symbiotic_build_init_tx():
 
         # Get recent blockhash
         rpc_url = _SOLANA_RPCS.get(network, _SOLANA_RPCS["devnet"])
-        client = _Client(rpc_url)
+        client = _rpc_client(rpc_url)
         bh_resp = client.get_latest_blockhash()
         blockhash = bh_resp.value.blockhash
 
@@ -2888,7 +3034,7 @@ def api_agent_model(agent_id):
     if not cfg_path.exists():
         return jsonify({"error": "openclaw.json not found"}), 500
     try:
-        cfg = json.loads(cfg_path.read_text())
+        cfg = _json_loads(cfg_path.read_bytes())
     except Exception as e:
         return jsonify({"error": f"Failed to read config: {e}"}), 500
 
@@ -2901,7 +3047,7 @@ def api_agent_model(agent_id):
     cfg["agents"][agent_id]["model"] = model
 
     try:
-        cfg_path.write_text(json.dumps(cfg, indent=2))
+        cfg_path.write_bytes(_json_dumps(cfg, pretty=True))
     except Exception as e:
         return jsonify({"error": f"Failed to write config: {e}"}), 500
 
@@ -2912,85 +3058,213 @@ def api_agent_model(agent_id):
 # API: R-Memory (SSoT documents)
 # ---------------------------------------------------------------------------
 
-def _scan_ssot_layer(layer_dir, layer_name):
-    """Scan a layer directory (recursively) for SSoT documents."""
-    docs = []
-    if not layer_dir.exists():
-        return docs
-
-    for f in sorted(layer_dir.rglob("*.md")):
-        if f.name.startswith("."):
+def _iter_md_files(root):
+    """Yield str paths of non-hidden .md files under root (iterative scandir walk)."""
+    stack = [str(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.name.startswith("."):
+                        continue
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    elif e.name.endswith(".md"):
+                        yield e.path
+        except OSError:
             continue
-        # Skip .ai.md files only if the full version exists (shown via hasCompressed toggle)
-        if f.name.endswith(".ai.md"):
-            full_version = f.parent / (f.name[:-len(".ai.md")] + ".md")
-            if full_version.exists():
+
+
+def _etag(components):
+    """Cheap ETag from a tuple of stat signatures."""
+    return hashlib.blake2b(repr(components).encode(), digest_size=8).hexdigest()
+
+
+def _stat_sig(path):
+    """(mtime_ns, size) for a path, or None if missing."""
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _not_modified(etag):
+    """Return a 304 response if the client already holds this ETag, else None."""
+    if request.if_none_match.contains(etag):
+        resp = app.response_class(status=304)
+        resp.set_etag(etag)
+        return resp
+    return None
+
+
+_SSOT_ROOT_PREFIX = str(SSOT_ROOT.resolve()) + os.sep
+
+def _safe_ssot_path(rel_path):
+    """Resolve a client-supplied path under SSOT_ROOT. Raises ValueError if it escapes."""
+    if not rel_path:
+        raise ValueError("empty path")
+    p = (SSOT_ROOT / rel_path).resolve()
+    if not str(p).startswith(_SSOT_ROOT_PREFIX):
+        raise ValueError("path outside SSoT root")
+    return p
+
+
+_SSOT_LAYERS = ("L0", "L1", "L2", "L3", "L4")
+
+
+def _ssot_stats():
+    """(layer, path, stat) of every SSoT document, one stat per file.
+    Taken once per request; later calls in the same request reuse it."""
+    stats = g.get("_ssot_stats") if has_request_context() else None
+    if stats is not None:
+        return stats
+    stats = []
+    for layer in _SSOT_LAYERS:
+        for p in _iter_md_files(SSOT_ROOT / layer):
+            try:
+                st = os.stat(p)
+            except OSError:
                 continue
+            stats.append((layer, p, st))
+    if has_request_context():
+        g._ssot_stats = stats
+    return stats
 
-        st = f.stat()
-        # Check if compressed version exists
-        ai_path = f.with_suffix(".ai.md")
-        has_compressed = ai_path.exists()
 
-        # Check lock status (macOS chflags uchg or schg)
-        locked = False
-        try:
-            flags = st.st_flags
-            locked = bool(flags & (0x02 | 0x00020000))  # UF_IMMUTABLE | SF_IMMUTABLE
-        except AttributeError:
-            pass
+def _ssot_etag(stats):
+    """ETag over path, mtime, size and lock flags of every SSoT document."""
+    return _etag([(p, st.st_mtime_ns, st.st_size, getattr(st, "st_flags", 0))
+                  for _, p, st in stats])
 
-        # Token estimate (~4 chars per token)
-        raw_tokens = st.st_size // 4
-        compressed_tokens = None
-        if has_compressed:
-            compressed_tokens = ai_path.stat().st_size // 4
-
-        docs.append({
-            "path": str(f.relative_to(SSOT_ROOT)),
-            "name": f.stem,
-            "layer": layer_name,
-            "size": st.st_size,
-            "rawTokens": raw_tokens,
-            "compressedTokens": compressed_tokens,
-            "hasCompressed": has_compressed,
-            "locked": locked,
-            "modified": st.st_mtime,
-        })
 
+def _ssot_layer_docs(layer_name, entries):
+    """Document records for one layer from its (path, stat) entries."""
+    docs = []
+    root = str(SSOT_ROOT)
+    by_dir = {}
+    for p, st in entries:
+        dirpath, name = os.path.split(p)
+        by_dir.setdefault(dirpath, {})[name] = st
+
+    for dirpath, md_stats in by_dir.items():
+        rel_dir = os.path.relpath(dirpath, root)
+        for name, st in md_stats.items():
+            # Skip .ai.md files only if the full version exists (shown via hasCompressed toggle)
+            if name.endswith(".ai.md") and name[:-len(".ai.md")] + ".md" in md_stats:
+                continue
+
+            # Check if compressed version exists
+            ai_st = md_stats.get(name[:-len(".md")] + ".ai.md")
+            has_compressed = ai_st is not None
+
+            # Check lock status (macOS chflags uchg or schg)
+            locked = False
+            try:
+                flags = st.st_flags
+                locked = bool(flags & (0x02 | 0x00020000))  # UF_IMMUTABLE | SF_IMMUTABLE
+            except AttributeError:
+                pass
+
+            # Token estimate (~4 chars per token)
+            raw_tokens = st.st_size // 4
+            compressed_tokens = ai_st.st_size // 4 if has_compressed else None
+
+            docs.append({
+                "path": os.path.join(rel_dir, name),
+                "name": name[:-len(".md")],
+                "layer": layer_name,
+                "size": st.st_size,
+                "rawTokens": raw_tokens,
+                "compressedTokens": compressed_tokens,
+                "hasCompressed": has_compressed,
+                "locked": locked,
+                "modified": st.st_mtime,
+            })
+
+    docs.sort(key=lambda d: d["path"])
     return docs
 
+
+_SSOT_DOCS_CACHE = {}  # etag -> document list for that signature
+
+def _ssot_documents(stats):
+    """(etag, documents) for all layers. The list is built from the stats the
+    ETag already took, and only when the ETag changes."""
+    etag = _ssot_etag(stats)
+    docs = _SSOT_DOCS_CACHE.get(etag)
+    if docs is None:
+        per_layer = {layer: [] for layer in _SSOT_LAYERS}
+        for layer, p, st in stats:
+            per_layer[layer].append((p, st))
+        docs = []
+        for layer in _SSOT_LAYERS:
+            docs.extend(_ssot_layer_docs(layer, per_layer[layer]))
+        _SSOT_DOCS_CACHE.clear()
+        _SSOT_DOCS_CACHE[etag] = docs
+    return etag, docs
+
 @app.route("/api/r-memory/documents")
 def api_rmemory_documents():
     """List all SSoT documents across layers."""
-    all_docs = []
-    for layer in ["L0", "L1", "L2", "L3", "L4"]:
-        layer_dir = SSOT_ROOT / layer
-        all_docs.extend(_scan_ssot_layer(layer_dir, layer))
-    return jsonify(all_docs)
+    stats = _ssot_stats()
+    etag = _ssot_etag(stats)
+    cached = _not_modified(etag)
+    if cached is not None:
+        return cached
+
+    etag, all_docs = _ssot_documents(stats)
+    resp = jsonify(all_docs)
+    resp.set_etag(etag)
+    return resp
 
 @app.route("/api/r-memory/document", methods=["GET"])
 def api_rmemory_document():
-    """Read a single SSoT document. ?path=L1/FOO.md&compressed=true"""
+    """Read a single SSoT document. ?path=L1/FOO.md&compressed=true
+    Add ?raw=1 (or Accept: text/markdown) to get the file body without JSON wrapping."""
     rel_path = request.args.get("path", "")
     use_compressed = request.args.get("compressed", "false").lower() == "true"
 
-    if not rel_path or ".." in rel_path:
+    try:
+        doc_path = _safe_ssot_path(rel_path)
+    except ValueError:
         return jsonify({"error": "invalid path"}), 400
+    candidates = [doc_path.with_suffix(".ai.md"), doc_path] if use_compressed else [doc_path]
 
-    doc_path = SSOT_ROOT / rel_path
-    if use_compressed:
-        ai_path = doc_path.with_suffix(".ai.md")
-        if ai_path.exists():
-            doc_path = ai_path
-
-    if not doc_path.exists():
+    # One open + fstat instead of exists/read/stat on the path
+    fd = None
+    for cand in candidates:
+        try:
+            fd = os.open(cand, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+            doc_path = cand
+            break
+        except FileNotFoundError:
+            continue
+    if fd is None:
         return jsonify({"error": "not found"}), 404
 
+    if request.args.get("raw") == "1" or request.accept_mimetypes.best == "text/markdown":
+        os.close(fd)
+        return send_file(doc_path, mimetype="text/markdown", conditional=True)
+
+    try:
+        st = os.fstat(fd)
+        chunks = []
+        remaining = st.st_size
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    finally:
+        os.close(fd)
+
     return jsonify({
         "path": rel_path,
-        "content": doc_path.read_text(),
-        "size": doc_path.stat().st_size,
+        "content": b"".join(chunks).decode("utf-8"),
+        "size": st.st_size,
     })
 
 @app.route("/api/r-memory/available-models", methods=["GET"])
@@ -3017,9 +3291,8 @@ def api_rmemory_available_models():
     }
     available = []
     try:
-        auth_path = Path.home() / ".openclaw" / "agents" / "main" / "agent" / "auth-profiles.json"
-        if auth_path.exists():
-            data = json.loads(auth_path.read_text())
+        if AUTH_PROFILES_FILE.exists():
+            data = _load_auth_profiles()
             seen_providers = set()
             for key, profile in data.get("profiles", {}).items():
                 if profile.get("token"):
@@ -3058,7 +3331,7 @@ def api_rmemory_config():
     cfg = _rmem_config()
     cfg.update(patch)
     try:
-        RMEMORY_CONFIG.write_text(json.dumps(cfg, indent=2))
+        RMEMORY_CONFIG.write_bytes(_json_dumps(cfg, pretty=True))
         return jsonify({"ok": True, "config": cfg})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -3079,27 +3352,39 @@ def api_rmemory_narrative_model():
         return jsonify({"error": "model required"}), 400
     camo_path = RMEMORY_DIR / "camouflage.json"
     try:
-        camo = json.loads(camo_path.read_text()) if camo_path.exists() else {}
+        camo = _json_loads(camo_path.read_bytes()) if camo_path.exists() else {}
         pref = camo.get("preferredBackgroundProvider", "openai")
         bg = camo.get("backgroundModels", {})
         bg[f"{pref}-narrative"] = model
         camo["backgroundModels"] = bg
-        camo_path.write_text(json.dumps(camo, indent=2))
+        camo_path.write_bytes(_json_dumps(camo, pretty=True))
         return jsonify({"ok": True, "narrativeModel": model})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+_OPEN_LOG_SCRIPT = RMEMORY_DIR / "open-log.applescript"
+_OPEN_LOG_SCRIPT_SRC = 'tell application "Terminal" to do script "tail -f ~/.openclaw/workspace/r-memory/r-memory.log"\n'
+
+def _open_log_script():
+    """Write the Terminal AppleScript once; later calls just return its path."""
+    try:
+        if _OPEN_LOG_SCRIPT.read_text() == _OPEN_LOG_SCRIPT_SRC:
+            return _OPEN_LOG_SCRIPT
+    except OSError:
+        pass
+    _OPEN_LOG_SCRIPT.parent.mkdir(parents=True, exist_ok=True)
+    _OPEN_LOG_SCRIPT.write_text(_OPEN_LOG_SCRIPT_SRC)
+    return _OPEN_LOG_SCRIPT
+
 @app.route("/api/r-memory/open-log", methods=["POST"])
 def api_rmemory_open_log():
     """Open R-Memory log in Terminal.app."""
-    import subprocess
-    # PLACEHOLDER: replace command with user-provided string
-    cmd = "tail -f ~/.openclaw/workspace/r-memory/r-memory.log"
-    subprocess.Popen([
-        "osascript", "-e",
-        f'tell application "Terminal" to do script "{cmd}"'
-    ])
+    try:
+        script = _open_log_script()
+        subprocess.Popen(["osascript", str(script)], close_fds=True, start_new_session=True)
+    except Exception as e:
+        return jsonify({"ok": False, "error": str(e)}), 500
     return jsonify({"ok": True})
 
 
@@ -3107,13 +3392,14 @@ def api_rmemory_open_log():
 def api_rmemory_stats():
     """R-Memory runtime stats: blocks from history files, log events."""
     # Get all history blocks (all sessions)
-    all_blocks = _rmem_history_blocks()
-    total_raw = sum(b.get("tokensRaw", 0) for b in all_blocks)
-    total_comp = sum(b.get("tokensCompressed", 0) for b in all_blocks)
+    hist = _rmem_history_index()
+    all_blocks = hist["all"]
+    total_raw = hist["total_raw"]
+    total_comp = hist["total_comp"]
 
     # Current session blocks (stored in history file)
     cur_sid = _rmem_current_session_id()
-    cur_blocks = [b for b in all_blocks if cur_sid and cur_sid in b.get("_file", "")]
+    cur_blocks = hist["by_session"].get(cur_sid, []) if cur_sid else []
 
     # Parse log to determine what's actually in context RIGHT NOW.
     # After a gateway restart (init), context is empty until first compaction.
@@ -3132,8 +3418,8 @@ def api_rmemory_stats():
     stats = {
         "blockCount": in_context_blocks,
         "contentTokens": in_context_tokens,
-        "totalRawTokens": sum(b.get("tokensRaw", 0) for b in cur_blocks),
-        "totalCompressedTokens": sum(b.get("tokensCompressed", 0) for b in cur_blocks),
+        "totalRawTokens": hist["raw"].get(cur_sid, 0),
+        "totalCompressedTokens": hist["comp"].get(cur_sid, 0),
         "compressionRatio": None,
         "storedBlockCount": len(cur_blocks),
         "allSessionsBlockCount": len(all_blocks),
@@ -3158,14 +3444,13 @@ def api_rmemory_stats():
 @app.route("/api/token-savings")
 def api_token_savings():
     """Token savings & cost tracker. Uses R-Memory history data."""
-    all_blocks = _rmem_history_blocks()
-    total_raw = sum(b.get("tokensRaw", 0) for b in all_blocks)
-    total_comp = sum(b.get("tokensCompressed", 0) for b in all_blocks)
+    hist = _rmem_history_index()
+    total_raw = hist["total_raw"]
+    total_comp = hist["total_comp"]
 
     cur_sid = _rmem_current_session_id()
-    cur_blocks = [b for b in all_blocks if cur_sid and cur_sid in b.get("_file", "")]
-    sess_raw = sum(b.get("tokensRaw", 0) for b in cur_blocks)
-    sess_comp = sum(b.get("tokensCompressed", 0) for b in cur_blocks)
+    sess_raw = hist["raw"].get(cur_sid, 0)
+    sess_comp = hist["comp"].get(cur_sid, 0)
 
     def _calc(raw, comp):
         saved = raw - comp
@@ -3187,17 +3472,13 @@ def api_token_savings():
     # Estimate non-block tokens (system prompt, workspace, SSoT, conversation)
     # These are NOT compressed — they represent fixed overhead
     overhead_tokens = 12000  # system prompt
-    for fname in ["AGENTS.md","SOUL.md","USER.md","TOOLS.md","IDENTITY.md","HEARTBEAT.md","MEMORY.md"]:
-        fp = WORKSPACE / fname
-        if fp.exists():
-            try: overhead_tokens += len(fp.read_text()) // 4
-            except: pass
+    overhead_tokens += sum(_workspace_token_map().values())
 
     return jsonify({
         "session": _calc(sess_raw, sess_comp),
         "lifetime": _calc(total_raw, total_comp),
-        "sessionBlocks": len(cur_blocks),
-        "lifetimeBlocks": len(all_blocks),
+        "sessionBlocks": len(hist["by_session"].get(cur_sid, [])),
+        "lifetimeBlocks": len(hist["all"]),
         "overheadTokens": overhead_tokens,
     })
 
@@ -3257,9 +3538,10 @@ def api_rmemory_document_save():
     body = request.get_json(force=True) or {}
     rel_path = body.get("path", "")
     content = body.get("content", "")
-    if not rel_path or ".." in rel_path:
+    try:
+        full_path = _safe_ssot_path(rel_path)
+    except ValueError:
         return jsonify({"ok": False, "error": "invalid path"}), 400
-    full_path = SSOT_ROOT / rel_path
     if not full_path.exists():
         return jsonify({"ok": False, "error": "not found"}), 404
     # Check lock
@@ -3342,6 +3624,35 @@ def api_ssot_keywords_put():
     return jsonify({"ok": True})
 
 
+def _chflags_layer(layer_dir, flag, password):
+    """Apply chflags to every .md in a layer with one sudo call.
+    Returns (count, errors)."""
+    paths = list(_iter_md_files(layer_dir))
+    if not paths:
+        return 0, []
+    try:
+        proc = subprocess.run(
+            ["sudo", "-S", "chflags", flag, *paths],
+            input=password.encode() + b"\n",
+            capture_output=True, timeout=30
+        )
+    except Exception as e:
+        return 0, [str(e)]
+    if proc.returncode == 0:
+        return len(paths), []
+    action = "unlock" if flag.startswith("no") else "lock"
+    # chflags keeps going after a per-file failure and reports "chflags: <path>: <reason>"
+    failed = set()
+    for line in proc.stderr.decode(errors="ignore").splitlines():
+        for p in paths:
+            if line.startswith(f"chflags: {p}:"):
+                failed.add(p)
+                break
+    if not failed:
+        return 0, [f"{os.path.basename(p)}: {action} failed" for p in paths]
+    return len(paths) - len(failed), [f"{os.path.basename(p)}: {action} failed" for p in sorted(failed)]
+
+
 @app.route("/api/r-memory/lock-layer/<layer>", methods=["POST"])
 def api_rmemory_lock_layer(layer):
     """Lock all documents in a layer."""
@@ -3352,23 +3663,7 @@ def api_rmemory_lock_layer(layer):
     password = body.get("password", "")
     if not password:
         return jsonify({"ok": False, "error": "password required — schg needs root"}), 403
-    count = 0
-    errors = []
-    for f in layer_dir.rglob("*.md"):
-        if f.name.startswith("."):
-            continue
-        try:
-            proc = subprocess.run(
-                ["sudo", "-S", "chflags", "schg", str(f)],
-                input=password.encode() + b"\n",
-                capture_output=True, timeout=10
-            )
-            if proc.returncode == 0:
-                count += 1
-            else:
-                errors.append(f"{f.name}: lock failed")
-        except Exception as e:
-            errors.append(f"{f.name}: {e}")
+    count, errors = _chflags_layer(layer_dir, "schg", password)
     if errors and count == 0:
         return jsonify({"ok": False, "error": "lock failed (wrong password?)", "errors": errors}), 403
     return jsonify({"ok": True, "count": count, "errors": errors})
@@ -3384,23 +3679,7 @@ def api_rmemory_unlock_layer(layer):
     password = body.get("password", "")
     if not password:
         return jsonify({"ok": False, "error": "password required"}), 400
-    count = 0
-    errors = []
-    for f in layer_dir.rglob("*.md"):
-        if f.name.startswith("."):
-            continue
-        try:
-            proc = subprocess.run(
-                ["sudo", "-S", "chflags", "noschg", str(f)],
-                input=password.encode() + b"\n",
-                capture_output=True, timeout=10
-            )
-            if proc.returncode == 0:
-                count += 1
-            else:
-                errors.append(f"{f.name}: unlock failed")
-        except Exception as e:
-            errors.append(f"{f.name}: {e}")
+    count, errors = _chflags_layer(layer_dir, "noschg", password)
     if errors and count == 0:
         return jsonify({"ok": False, "error": "unlock failed (wrong password?)", "errors": errors}), 403
     return jsonify({"ok": True, "count": count, "errors": errors})
@@ -3410,6 +3689,60 @@ def api_rmemory_unlock_layer(layer):
 # API: Memory Health (context window + subsystem status)
 # ---------------------------------------------------------------------------
 
+_KW_CACHE = {}  # {(mtime_ns, size): kw_events} — single entry for the current log
+
+def _ra_keyword_events():
+    """Parse 'Human keywords matched' events from the R-Awareness log tail.
+    Cached on the log's (mtime_ns, size) so unchanged logs are not re-scanned."""
+    try:
+        st = os.stat(R_AWARENESS_LOG)
+    except OSError:
+        return []
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _KW_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    kw_events = []
+    try:
+        # Only the latest event is shown, so the log tail is enough
+        ra_text = _read_log_tail(R_AWARENESS_LOG)
+        # Cheap substring check first: skip the regex scan when no event exists
+        if "Human keywords matched" in ra_text:
+            for line in ra_text.splitlines():
+                if "Human keywords matched" not in line:
+                    continue
+                m = _HUMAN_KW_RE.match(line)
+                if not m:
+                    continue
+                try:
+                    payload = json.loads(m.group(2))
+                    kw_events.append({"ts": m.group(1), "keywords": payload.get("keywords", [])})
+                except Exception:
+                    pass
+    except Exception:
+        pass
+    _KW_CACHE.clear()
+    _KW_CACHE[key] = kw_events
+    return kw_events
+
+def _memory_health_etag():
+    """ETag over every file api_memory_health reads, or None when the session
+    has to come from the gateway WS (not cacheable by stat)."""
+    session_sigs = [_stat_sig(p) for p in _RMEM_SESSION_PATHS]
+    if not any(session_sigs):
+        return None
+    history = sorted(_glob.glob(str(RMEMORY_DIR / "history-*.json")))
+    return _etag((
+        session_sigs,
+        [(f, _stat_sig(f)) for f in history],
+        _stat_sig(RMEMORY_CONFIG),
+        _stat_sig(RMEMORY_LOG),
+        _stat_sig(R_AWARENESS_LOG),
+        [_stat_sig(WORKSPACE / f) for f in _WORKSPACE_FILES],
+        _ssot_etag(_ssot_stats()),
+    ))
+
 @app.route("/api/memory/health")
 def api_memory_health():
     """Memory subsystem health: context window, compression, FIFO status.
@@ -3420,18 +3753,23 @@ def api_memory_health():
     - r-memory.log → compaction events, FIFO events, session events
     - Gateway WS → actual totalTokens for the session
     """
+    etag = _memory_health_etag()
+    if etag is not None:
+        cached = _not_modified(etag)
+        if cached is not None:
+            return cached
+
     config = _rmem_config()
     compress_trigger = config.get("compressTrigger", 36000)
     evict_trigger = config.get("evictTrigger", 80000)
 
     # --- Get current session blocks from history files ---
     cur_sid = _rmem_current_session_id()
-    cur_blocks = _rmem_history_blocks(cur_sid) if cur_sid else []
-    all_blocks = _rmem_history_blocks()
+    hist = _rmem_history_index()
 
-    stored_blocks_raw = sum(b.get("tokensRaw", 0) for b in cur_blocks)
-    stored_blocks_comp = sum(b.get("tokensCompressed", 0) for b in cur_blocks)
-    stored_blocks_count = len(cur_blocks)
+    stored_blocks_raw = hist["raw"].get(cur_sid, 0)
+    stored_blocks_comp = hist["comp"].get(cur_sid, 0)
+    stored_blocks_count = len(hist["by_session"].get(cur_sid, []))
 
     # --- Parse log events ---
     log_events = _rmem_parse_log()
@@ -3479,15 +3817,7 @@ def api_memory_health():
     model = gw_session.get("model") if gw_session else None
 
     # --- Estimate workspace file sizes ---
-    workspace_tokens = 0
-    for fname in ["AGENTS.md", "SOUL.md", "TOOLS.md", "USER.md", "MEMORY.md",
-                   "IDENTITY.md", "HEARTBEAT.md"]:
-        fpath = WORKSPACE / fname
-        if fpath.exists():
-            try:
-                workspace_tokens += len(fpath.read_text()) // 4
-            except Exception:
-                pass
+    workspace_tokens = sum(_workspace_token_map().values())
 
     # OpenClaw system prompt includes: core instructions, tool schemas, skill list,
     # runtime context, formatting rules, safety rules — typically 12-15k tokens.
@@ -3501,12 +3831,11 @@ def api_memory_health():
     try:
         ra_log = WORKSPACE / "r-awareness" / "r-awareness.log"
         if ra_log.exists():
-            import re
             lines = ra_log.read_text().splitlines()
             # Find last injection event for count/tokens
             for line in reversed(lines):
                 if "Injecting into system prompt" in line:
-                    m = re.search(r'"docs":(\d+),"tokens":(\d+)', line)
+                    m = _RE_INJECT_COUNTS.search(line)
                     if m:
                         ssot_count = int(m.group(1))
                         ssot_tokens = int(m.group(2))
@@ -3529,7 +3858,7 @@ def api_memory_health():
                         break
                 start = (prev_inject_idx + 1) if prev_inject_idx is not None else 0
                 for i in range(start, last_inject_idx + 1):
-                    m = re.search(r'"docs":\[([^\]]*)\]', lines[i])
+                    m = _RE_INJECT_DOCS.search(lines[i])
                     if m and m.group(1):
                         for d in m.group(1).split(","):
                             d = d.strip().strip('"')
@@ -3541,9 +3870,7 @@ def api_memory_health():
     # Fallback: scan all docs if no log data
     if ssot_count == 0:
         try:
-            docs = []
-            for layer in ["L0", "L1", "L2", "L3", "L4"]:
-                docs.extend(_scan_ssot_layer(SSOT_ROOT / layer, layer))
+            _, docs = _ssot_documents(_ssot_stats())
             ssot_count = len(docs)
             ssot_tokens = sum(d.get("tokens", 0) for d in docs)
         except Exception:
@@ -3622,22 +3949,7 @@ def api_memory_health():
         }
 
     # --- Subsystem: Keyword Detection (from R-Awareness log) ---
-    kw_events = []
-    if R_AWARENESS_LOG.exists():
-        try:
-            ra_text = R_AWARENESS_LOG.read_text(errors="ignore")
-            kw_re = re.compile(
-                r'^\[(\d{4}-\d{2}-\d{2}T[\d:.]+Z)\]\s+\[INFO\]\s+Human keywords matched\s+(\{.*\})',
-                re.MULTILINE,
-            )
-            for m in kw_re.finditer(ra_text):
-                try:
-                    payload = json.loads(m.group(2))
-                    kw_events.append({"ts": m.group(1), "keywords": payload.get("keywords", [])})
-                except Exception:
-                    pass
-        except Exception:
-            pass
+    kw_events = _ra_keyword_events()
     if kw_events:
         last_kw = kw_events[-1]
         result["subsystems"]["keywords"] = {
@@ -3714,7 +4026,10 @@ def api_memory_health():
     if log_events:
         result["lastEventTs"] = log_events[-1].get("ts")
 
-    return jsonify(result)
+    resp = ojsonify(result)
+    if etag is not None:
+        resp.set_etag(etag)
+    return resp
 
 # ---------------------------------------------------------------------------
 # API: Chatbots (SQLite-backed)
@@ -3724,9 +4039,14 @@ import sqlite3
 
 CHATBOTS_DB = Path(__file__).parent / "chatbots.db"
 
-def _get_db():
-    db = sqlite3.connect(str(CHATBOTS_DB))
-    db.row_factory = sqlite3.Row
+_DB_MIGRATED = False
+_DB_WAL = False
+
+def _migrate_db(db):
+    """One-time schema migrations (icon columns, lookup indexes)."""
+    global _DB_MIGRATED
+    if not db.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='chatbots'").fetchone():
+        return  # DB not initialised yet — retry on a later request
     # Auto-migrate icon columns
     try:
         db.execute("ALTER TABLE chatbots ADD COLUMN icon TEXT DEFAULT '💬'")
@@ -3736,8 +4056,50 @@ def _get_db():
         db.execute("ALTER TABLE chatbots ADD COLUMN icon_type TEXT DEFAULT 'emoji'")
     except Exception:
         pass
+    # Indexes for the per-bot / per-conversation COUNT and DELETE lookups
+    for stmt in (
+        "CREATE INDEX IF NOT EXISTS idx_convos_chatbot ON chatbot_conversations(chatbot_id)",
+        "CREATE INDEX IF NOT EXISTS idx_msgs_conv ON chatbot_messages(conversation_id)",
+        "CREATE INDEX IF NOT EXISTS idx_msgs_chatbot ON chatbot_messages(chatbot_id)",
+    ):
+        try:
+            db.execute(stmt)
+        except Exception:
+            pass
+    db.commit()
+    _DB_MIGRATED = True
+
+def _tune_db(db):
+    """WAL journal (persisted in the file, so set once per process) plus per-connection pragmas."""
+    global _DB_WAL
+    if not _DB_WAL:
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            _DB_WAL = True
+        except Exception:
+            pass
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("PRAGMA temp_store=MEMORY")
+    db.execute("PRAGMA mmap_size=134217728")
+
+def _get_db():
+    """Request-scoped chatbots DB connection (closed in teardown)."""
+    db = g.get("_chatbots_db")
+    if db is None:
+        db = sqlite3.connect(str(CHATBOTS_DB))
+        db.row_factory = sqlite3.Row
+        _tune_db(db)
+        if not _DB_MIGRATED:
+            _migrate_db(db)
+        g._chatbots_db = db
     return db
 
+@app.teardown_appcontext
+def _close_db(exc):
+    db = g.pop("_chatbots_db", None)
+    if db is not None:
+        db.close()
+
 @app.route("/api/chatbots")
 def api_chatbots():
     """List all chatbots."""
@@ -3745,15 +4107,16 @@ def api_chatbots():
         return jsonify([])
     db = _get_db()
     bots = [dict(r) for r in db.execute("SELECT * FROM chatbots ORDER BY created_at DESC").fetchall()]
-    # Get conversation counts
+    # Get conversation counts (one grouped query for all bots)
+    counts = dict(db.execute(
+        "SELECT chatbot_id, COUNT(*) FROM chatbot_conversations GROUP BY chatbot_id"
+    ).fetchall())
     total_convos = 0
     for bot in bots:
-        count = db.execute("SELECT COUNT(*) FROM chatbot_conversations WHERE chatbot_id=?", (bot["id"],)).fetchone()[0]
-        bot["conversation_count"] = count
-        total_convos += count
-    db.close()
+        bot["conversation_count"] = counts.get(bot["id"], 0)
+        total_convos += bot["conversation_count"]
     active = sum(1 for b in bots if b.get("status") == "active")
-    return jsonify({
+    return ojsonify({
         "chatbots": bots,
         "total": len(bots),
         "active": active,
@@ -3765,15 +4128,14 @@ def api_chatbots():
 def api_chatbot_detail(bot_id):
     """Get a single chatbot."""
     db = _get_db()
-    bot = db.execute("SELECT * FROM chatbots WHERE id=?", (bot_id,)).fetchone()
+    bot = db.execute("""SELECT b.*,
+        (SELECT COUNT(*) FROM chatbot_conversations c WHERE c.chatbot_id=b.id) AS conversation_count,
+        (SELECT COUNT(*) FROM chatbot_messages m JOIN chatbot_conversations c2 ON m.conversation_id=c2.id
+            WHERE c2.chatbot_id=b.id) AS message_count
+        FROM chatbots b WHERE b.id=?""", (bot_id,)).fetchone()
     if not bot:
-        db.close()
         return jsonify({"error": "not found"}), 404
-    result = dict(bot)
-    result["conversation_count"] = db.execute("SELECT COUNT(*) FROM chatbot_conversations WHERE chatbot_id=?", (bot_id,)).fetchone()[0]
-    result["message_count"] = db.execute("SELECT COUNT(*) FROM chatbot_messages WHERE conversation_id IN (SELECT id FROM chatbot_conversations WHERE chatbot_id=?)", (bot_id,)).fetchone()[0]
-    db.close()
-    return jsonify(result)
+    return jsonify(dict(bot))
 
 @app.route("/api/chatbots", methods=["POST"])
 def api_chatbot_create():
@@ -3800,7 +4162,6 @@ def api_chatbot_create():
          body.get("api_type", "internal"), body.get("model_id", "claude-haiku"),
          body.get("icon", "💬"), body.get("iconType", "emoji")))
     db.commit()
-    db.close()
     return jsonify({"ok": True, "id": bot_id})
 
 @app.route("/api/chatbots/<bot_id>", methods=["PUT"])
@@ -3811,7 +4172,6 @@ def api_chatbot_update(bot_id):
     db = _get_db()
     bot = db.execute("SELECT id FROM chatbots WHERE id=?", (bot_id,)).fetchone()
     if not bot:
-        db.close()
         return jsonify({"error": "not found"}), 404
     fields = ["name", "system_prompt", "greeting", "position", "theme",
               "primary_color", "bg_color", "text_color", "allowed_domains",
@@ -3832,7 +4192,7 @@ def api_chatbot_update(bot_id):
         values.append(bot_id)
         db.execute(f"UPDATE chatbots SET {','.join(updates)} WHERE id=?", values)
         db.commit()
-    db.close()
+        _BOT_CACHE.pop(bot_id, None)
     return jsonify({"ok": True})
 
 @app.route("/api/chatbots/<bot_id>", methods=["DELETE"])
@@ -3843,7 +4203,7 @@ def api_chatbot_delete(bot_id):
     db.execute("DELETE FROM chatbot_conversations WHERE chatbot_id=?", (bot_id,))
     db.execute("DELETE FROM chatbots WHERE id=?", (bot_id,))
     db.commit()
-    db.close()
+    _BOT_CACHE.pop(bot_id, None)
     return jsonify({"ok": True})
 
 @app.route("/api/chatbots/<bot_id>/conversations")
@@ -3853,13 +4213,120 @@ def api_chatbot_conversations(bot_id):
     convs = [dict(r) for r in db.execute(
         "SELECT * FROM chatbot_conversations WHERE chatbot_id=? ORDER BY started_at DESC LIMIT 50",
         (bot_id,)).fetchall()]
-    db.close()
     return jsonify(convs)
 
 # ---------------------------------------------------------------------------
 # API: Widget Chat
 # ---------------------------------------------------------------------------
 
+_BOT_CACHE = {}     # bot_id -> (chatbots.db + WAL signature, row dict)
+_AUTH_CACHE = None  # (auth-profiles.json mtime, parsed dict)
+
+def _load_auth_profiles():
+    """Parsed auth-profiles.json, re-read only when the file changes. Raises OSError if missing."""
+    global _AUTH_CACHE
+    mtime = os.stat(AUTH_PROFILES_FILE).st_mtime
+    if _AUTH_CACHE is None or _AUTH_CACHE[0] != mtime:
+        _AUTH_CACHE = (mtime, _json_loads(AUTH_PROFILES_FILE.read_bytes()))
+    return _AUTH_CACHE[1]
+
+def _widget_bot(bot_id):
+    """Chatbot row for the widget, cached until chatbots.db changes or the bot is edited."""
+    try:
+        mtime = os.stat(CHATBOTS_DB).st_mtime
+    except OSError:
+        return None
+    # In WAL mode commits land in the -wal file until a checkpoint
+    mtime = (mtime, _stat_sig(str(CHATBOTS_DB) + "-wal"))
+    cached = _BOT_CACHE.get(bot_id)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    row = _get_db().execute("SELECT * FROM chatbots WHERE id=?", (bot_id,)).fetchone()
+    if not row:
+        _BOT_CACHE.pop(bot_id, None)
+        return None
+    bot = dict(row)
+    _BOT_CACHE[bot_id] = (mtime, bot)
+    return bot
+
+# Pooled keep-alive HTTPS for provider calls (requests optional; urllib fallback)
+try:
+    import requests as _requests
+    _HTTP = _requests.Session()
+except ImportError:
+    _HTTP = None
+
+def _provider_post(url, payload, headers, timeout=30):
+    """POST a JSON payload to an LLM provider and return the parsed JSON reply."""
+    if _HTTP is not None:
+        resp = _HTTP.post(url, json=payload, headers=headers, timeout=timeout)
+        resp.raise_for_status()
+        return resp.json()
+    req = urllib.request.Request(
+        url, data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json", **headers},
+    )
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read())
+
+def _provider_stream(url, payload, headers, timeout=30):
+    """POST a streaming request and return an iterator over the parsed SSE ``data:`` events.
+
+    The connection is opened (and HTTP errors raised) before returning, so
+    callers can still answer with a normal error response.
+    """
+    payload = dict(payload, stream=True)
+    if _HTTP is not None:
+        resp = _HTTP.post(url, json=payload, headers=headers, timeout=timeout, stream=True)
+        resp.raise_for_status()
+        lines = resp.iter_lines(chunk_size=None)
+    else:
+        req = urllib.request.Request(
+            url, data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json", **headers},
+        )
+        resp = urllib.request.urlopen(req, timeout=timeout)
+        lines = resp
+
+    def events():
+        try:
+            for line in lines:
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    break
+                yield _json_loads(data)
+        finally:
+            resp.close()
+
+    return events()
+
+def _stream_text(event):
+    """Text delta carried by an Anthropic or OpenAI streaming event ("" for other events)."""
+    if event.get("type") == "content_block_delta":
+        return event.get("delta", {}).get("text", "")
+    if event.get("type") == "error":
+        raise RuntimeError(event.get("error", {}).get("message", "provider error"))
+    choices = event.get("choices")
+    if choices:
+        return (choices[0].get("delta") or {}).get("content") or ""
+    return ""
+
+def _widget_sse(events):
+    """Relay provider text deltas to the widget as SSE, ending with the full reply."""
+    parts = []
+    try:
+        for event in events:
+            text = _stream_text(event)
+            if text:
+                parts.append(text)
+                yield f"data: {json.dumps({'delta': text})}\n\n"
+    except Exception as e:
+        yield f"data: {json.dumps({'error': str(e)})}\n\n"
+        return
+    yield f"data: {json.dumps({'done': True, 'reply': ''.join(parts)})}\n\n"
+
 @app.route("/api/widget/chat", methods=["POST"])
 def api_widget_chat():
     """Handle chat messages from the embeddable widget."""
@@ -3869,21 +4336,15 @@ def api_widget_chat():
     if not bot_id or not messages:
         return jsonify({"error": "botId and messages required"}), 400
 
-    db = _get_db()
-    bot = db.execute("SELECT * FROM chatbots WHERE id=?", (bot_id,)).fetchone()
-    db.close()
+    bot = _widget_bot(bot_id)
     if not bot:
         return jsonify({"error": "chatbot not found"}), 404
 
-    bot = dict(bot)
     system_prompt = bot.get("system_prompt", "")
 
     # Load API keys
     try:
-        import json as _json
-        auth_path = os.path.expanduser("~/.openclaw/agents/main/agent/auth-profiles.json")
-        with open(auth_path) as f:
-            auth = _json.load(f)
+        auth = _load_auth_profiles()
     except Exception as e:
         return jsonify({"error": f"Auth config not found: {e}"}), 500
 
@@ -3895,25 +4356,18 @@ def api_widget_chat():
             api_messages.append({"role": role, "content": m.get("content", "")})
 
     model_id = bot.get("model_id", "claude-sonnet")
+    is_openai = model_id.startswith("gpt")
 
     try:
-        import urllib.request
-
         # Route to appropriate provider
-        if model_id.startswith("gpt"):
+        if is_openai:
             # OpenAI
             api_key = auth["profiles"]["openai:manual"]["token"]
             oai_model = {"gpt-4o": "gpt-4o", "gpt-4": "gpt-4"}.get(model_id, "gpt-4o")
             oai_messages = [{"role": "system", "content": system_prompt}] + api_messages
-            req_body = _json.dumps({"model": oai_model, "max_tokens": 1024, "messages": oai_messages}).encode()
-            req = urllib.request.Request(
-                "https://api.openai.com/v1/chat/completions",
-                data=req_body,
-                headers={"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"},
-            )
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                result = _json.loads(resp.read())
-            reply = result["choices"][0]["message"]["content"]
+            url = "https://api.openai.com/v1/chat/completions"
+            payload = {"model": oai_model, "max_tokens": 1024, "messages": oai_messages}
+            headers = {"Authorization": f"Bearer {api_key}"}
         else:
             # Anthropic (default for claude-*)
             api_key = auth["profiles"]["anthropic:manual"]["token"]
@@ -3922,21 +4376,26 @@ def api_widget_chat():
                 "claude-opus": "claude-opus-4-20250514",
                 "claude-haiku": "claude-haiku-4-20250514",
             }.get(model_id, "claude-sonnet-4-20250514")
-            req_body = _json.dumps({
+            url = "https://api.anthropic.com/v1/messages"
+            payload = {
                 "model": ant_model, "max_tokens": 1024,
                 "system": system_prompt, "messages": api_messages,
-            }).encode()
-            req = urllib.request.Request(
-                "https://api.anthropic.com/v1/messages",
-                data=req_body,
-                headers={
-                    "Content-Type": "application/json",
-                    "x-api-key": api_key,
-                    "anthropic-version": "2023-06-01",
-                },
+            }
+            headers = {"x-api-key": api_key, "anthropic-version": "2023-06-01"}
+
+        # Streaming clients get text deltas as Server-Sent Events
+        if data.get("stream"):
+            events = _provider_stream(url, payload, headers)
+            return Response(
+                stream_with_context(_widget_sse(events)),
+                mimetype="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
             )
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                result = _json.loads(resp.read())
+
+        result = _provider_post(url, payload, headers)
+        if is_openai:
+            reply = result["choices"][0]["message"]["content"]
+        else:
             reply = result.get("content", [{}])[0].get("text", "Sorry, I couldn't generate a response.")
 
         return jsonify({"reply": reply})
@@ -3957,10 +4416,12 @@ def widget_js():
 # API: Shield Status
 # ---------------------------------------------------------------------------
 
-@app.route("/api/shield/status")
-def api_shield_status():
-    """Shield status including file guard."""
-    try:
+_FG = None
+
+def _load_fg():
+    """Load shield/file_guard.py once and reuse the module."""
+    global _FG
+    if _FG is None:
         import importlib.util
         spec = importlib.util.spec_from_file_location(
             "file_guard",
@@ -3968,12 +4429,20 @@ def api_shield_status():
         )
         fg = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(fg)
+        _FG = fg
+    return _FG
+
+@app.route("/api/shield/status")
+def api_shield_status():
+    """Shield status including file guard."""
+    try:
+        fg = _load_fg()
         guard_status = fg.get_status()
         total_groups = len(guard_status)
         total_files = sum(g["total"] for g in guard_status.values())
         locked_files = sum(g["locked_count"] for g in guard_status.values())
         mode = "protected" if locked_files > 0 else "unlocked"
-        return jsonify({
+        return ojsonify({
             "active": locked_files > 0,
             "available": True,
             "mode": mode,
@@ -4002,18 +4471,35 @@ def api_shield_status():
 def api_shield_guard_status():
     """File guard status for all groups."""
     try:
-        import importlib.util
-        spec = importlib.util.spec_from_file_location(
-            "file_guard",
-            os.path.join(os.path.dirname(__file__), "..", "shield", "file_guard.py"),
-        )
-        fg = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(fg)
-        return jsonify(fg.get_status())
+        fg = _load_fg()
+        return ojsonify(fg.get_status())
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+_SUDO_OK = {}  # salted sha256 of a verified password -> expiry (time.time())
+_SUDO_SALT = os.urandom(16)
+_SUDO_TTL = 60
+
+def _sudo_password_ok(password):
+    """Check a sudo password, reusing a successful check for _SUDO_TTL seconds."""
+    key = hashlib.sha256(_SUDO_SALT + password.encode()).hexdigest()
+    now = time.time()
+    if _SUDO_OK.get(key, 0) > now:
+        return True
+    check = subprocess.run(
+        ["sudo", "-S", "echo", "ok"],
+        input=password + "\n", capture_output=True, text=True, timeout=10,
+    )
+    if check.returncode != 0:
+        _SUDO_OK.pop(key, None)
+        return False
+    for k in [k for k, exp in _SUDO_OK.items() if exp <= now]:
+        del _SUDO_OK[k]
+    _SUDO_OK[key] = now + _SUDO_TTL
+    return True
+
+
 @app.route("/api/shield/guard/lock", methods=["POST"])
 def api_shield_guard_lock():
     """Lock a file group (requires password for schg). Body: {group: 'group_id', password: '...'} or {file: '/path', password: '...'}"""
@@ -4022,24 +4508,14 @@ def api_shield_guard_lock():
     if not password:
         return jsonify({"error": "Password required — schg needs root"}), 403
     # Validate password
-    check = subprocess.run(
-        ["sudo", "-S", "echo", "ok"],
-        input=password + "\n", capture_output=True, text=True, timeout=10,
-    )
-    if check.returncode != 0:
+    if not _sudo_password_ok(password):
         return jsonify({"error": "Invalid password"}), 403
     try:
-        import importlib.util
-        spec = importlib.util.spec_from_file_location(
-            "file_guard",
-            os.path.join(os.path.dirname(__file__), "..", "shield", "file_guard.py"),
-        )
-        fg = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(fg)
+        fg = _load_fg()
         if "group" in data:
-            return jsonify(fg.lock_group(data["group"], password=password))
+            return ojsonify(fg.lock_group(data["group"], password=password))
         elif "file" in data:
-            return jsonify(fg.lock_file(data["file"], password=password))
+            return ojsonify(fg.lock_file(data["file"], password=password))
         return jsonify({"error": "Provide 'group' or 'file'"}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -4053,24 +4529,14 @@ def api_shield_guard_unlock():
     if not password:
         return jsonify({"error": "Password required to unlock"}), 403
     # Validate password by attempting sudo -S with it
-    check = subprocess.run(
-        ["sudo", "-S", "echo", "ok"],
-        input=password + "\n", capture_output=True, text=True, timeout=10,
-    )
-    if check.returncode != 0:
+    if not _sudo_password_ok(password):
         return jsonify({"error": "Invalid password"}), 403
     try:
-        import importlib.util
-        spec = importlib.util.spec_from_file_location(
-            "file_guard",
-            os.path.join(os.path.dirname(__file__), "..", "shield", "file_guard.py"),
-        )
-        fg = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(fg)
+        fg = _load_fg()
         if "group" in data:
-            return jsonify(fg.unlock_group(data["group"], password=password))
+            return ojsonify(fg.unlock_group(data["group"], password=password))
         elif "file" in data:
-            return jsonify(fg.unlock_file(data["file"], password=password))
+            return ojsonify(fg.unlock_file(data["file"], password=password))
         return jsonify({"error": "Provide 'group' or 'file'"}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -4079,11 +4545,13 @@ def api_shield_guard_unlock():
 # API: Logician Status
 # ---------------------------------------------------------------------------
 
+_SAFE_FN_RE = re.compile(r"[A-Za-z0-9_.-]+")
+
 def _safe_logician_filename(filename):
     name = Path(filename).name
     if name != filename:
         return None
-    if not re.fullmatch(r"[A-Za-z0-9_.-]+", name):
+    if not _SAFE_FN_RE.fullmatch(name):
         return None
     return name
 
@@ -4117,25 +4585,40 @@ def _logician_rule_summary(text):
     description = ""
     rules_count = 0
     facts_count = 0
+    # One strip per line, then classify on the first/last char
     for raw_line in text.splitlines():
         line = raw_line.strip()
         if not line:
             continue
-        if line.startswith("%"):
+        if line[0] == "%":
             if not description:
                 desc = line.lstrip("%").strip()
-                if desc and not set(desc).issubset(set("=-_ ")):
+                # Skip banner lines made only of =, -, _ and spaces
+                if desc.strip("=-_ "):
                     description = desc
             continue
         if ":-" in line:
             rules_count += 1
-        elif line.endswith("."):
+        elif line[-1] == ".":
             facts_count += 1
     if not description:
         description = "Logician rules"
     return description, rules_count, facts_count
 
 
+_RULE_SUMMARY_CACHE = {}  # Path -> (st_mtime_ns, (description, rules, facts))
+
+def _cached_rule_summary(fpath):
+    """_logician_rule_summary for a file, re-read only when its mtime changes."""
+    mtime = fpath.stat().st_mtime_ns
+    cached = _RULE_SUMMARY_CACHE.get(fpath)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    summary = _logician_rule_summary(fpath.read_text())
+    _RULE_SUMMARY_CACHE[fpath] = (mtime, summary)
+    return summary
+
+
 @app.route("/api/logician/rules")
 def api_logician_rules():
     """List available Logician rule files and enabled/locked state."""
@@ -4151,10 +4634,8 @@ def api_logician_rules():
         if not fpath.is_file() or fpath.suffix.lower() not in {".mg", ".mangle"}:
             continue
         try:
-            content = fpath.read_text()
-            description, rules_count, facts_count = _logician_rule_summary(content)
+            description, rules_count, facts_count = _cached_rule_summary(fpath)
         except Exception:
-            content = ""
             description, rules_count, facts_count = ("Unreadable rule file", 0, 0)
         rules.append({
             "filename": fpath.name,
@@ -4318,33 +4799,219 @@ PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
 
 import uuid as _uuid
 
+def _now_iso():
+    """Current UTC time as YYYY-MM-DDTHH:MM:SSZ (call once per handler and reuse)."""
+    tm = time.gmtime()
+    return (f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+            f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}Z")
+
+_PROJECTS_CACHE = OrderedDict()  # filename -> ((st_mtime_ns, st_size), parsed project); sig None = unflushed
+_PROJECT_CACHE_MAX = int(os.environ.get("PROJECT_CACHE_MAX", "0"))  # 0 = unbounded
+
+# Saved projects waiting for the background flush (filename -> project).
+# Reads consult this first, so a save is visible before it reaches disk.
+_PROJECTS_DIRTY = {}
+_PROJECTS_LOCK = threading.Lock()
+# Bumped whenever cached project/todo data changes; keys the /api/todo view cache
+_DATA_VERSION = 0
+_PROJECTS_TIMER = None
+_PROJECTS_FLUSH_DELAY = 0.1
+
+def _atomic_write_bytes(path, data):
+    """Write data next to path and swap it in with os.replace (readers never see a partial file)."""
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.tmp.{os.urandom(4).hex()}")
+    try:
+        with open(tmp, "wb", buffering=1 << 20) as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+_MMAP_MIN_BYTES = 1 << 20  # below this a plain read() is as fast
+
+def _read_json_file(path, size):
+    """Parse a JSON file; large files are mapped and handed to orjson without a read() copy."""
+    if orjson is None or size < _MMAP_MIN_BYTES:
+        return _json_loads(Path(path).read_bytes())
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+    finally:
+        os.close(fd)
+
+def _project_from_cache(name, path, sig):
+    """Parsed project for a file signature; the file is re-read only when it changed."""
+    dirty = _PROJECTS_DIRTY.get(name)
+    if dirty is not None:
+        return dirty
+    with _PROJECTS_LOCK:
+        cached = _PROJECTS_CACHE.get(name)
+        if cached and cached[0] == sig:
+            _PROJECTS_CACHE.move_to_end(name)
+            return cached[1]
+    global _DATA_VERSION
+    project = _read_json_file(path, sig[1])
+    if "metrics" not in project:  # written before metrics were persisted
+        _compute_metrics(project)
+    # Request threads and the flush timer share the cache; store and evict under the lock
+    with _PROJECTS_LOCK:
+        _PROJECTS_CACHE[name] = (sig, project)
+        _DATA_VERSION += 1
+        if _PROJECT_CACHE_MAX and len(_PROJECTS_CACHE) > _PROJECT_CACHE_MAX:
+            for old in _PROJECTS_CACHE:
+                if old not in _PROJECTS_DIRTY:
+                    del _PROJECTS_CACHE[old]
+                    break
+    return project
+
+def _load_project_cached(project_id, copy=False):
+    """One project by id, or None if it does not exist.
+    The cached dict is shared; pass copy=True before mutating it."""
+    path = PROJECTS_DIR / f"{project_id}.json"
+    project = _PROJECTS_DIRTY.get(path.name)
+    if project is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        project = _project_from_cache(path.name, path, (st.st_mtime_ns, st.st_size))
+    return deepcopy(project) if copy else project
+
+_TASK_INDEX = {}  # filename -> (file signature, {task_id: position in project["tasks"]})
+
+def _index_tasks(name, sig, project):
+    index = {}
+    for i, t in enumerate(project.get("tasks", [])):
+        index.setdefault(t.get("id"), i)
+    _TASK_INDEX[name] = (sig, index)
+    return index
+
+def _task_position(project_id, task_id):
+    """Position of task_id in a cached project's task list, or None.
+    Call after _load_project_cached(); the index is rebuilt only when the file changed."""
+    name = f"{project_id}.json"
+    cached = _PROJECTS_CACHE.get(name)
+    if cached is None:
+        return None
+    entry = _TASK_INDEX.get(name)
+    index = entry[1] if entry and entry[0] == cached[0] else _index_tasks(name, *cached)
+    return index.get(task_id)
+
+def _project_files():
+    """(name, path, (mtime_ns, size)) of every project file, sorted by name.
+    Listed once per request; later calls in the same request reuse it."""
+    listing = g.get("_project_files") if has_request_context() else None
+    if listing is not None:
+        return listing
+    listing = []
+    with os.scandir(PROJECTS_DIR) as it:
+        for e in it:
+            if e.name.endswith(".json") and not e.name.startswith("_") and e.is_file():
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                listing.append((e.name, e.path, (st.st_mtime_ns, st.st_size)))
+    listing.sort()
+    if has_request_context():
+        g._project_files = listing
+    return listing
+
 def _load_projects():
-    """Load all project JSON files."""
-    projects = []
-    for f in sorted(PROJECTS_DIR.glob("*.json")):
-        if f.name.startswith("_"):
-            continue
+    """Load all project JSON files. Files whose mtime/size are unchanged
+    since the last call reuse their cached parse."""
+    found = {}
+    for name, path, sig in _project_files():
         try:
-            projects.append(json.loads(f.read_text()))
+            found[name] = _project_from_cache(name, path, sig)
         except Exception:
             pass
-    return projects
+    # Projects created since the last flush are not on disk yet
+    for name, project in list(_PROJECTS_DIRTY.items()):
+        found.setdefault(name, project)
+    global _DATA_VERSION
+    with _PROJECTS_LOCK:
+        for name in list(_PROJECTS_CACHE):
+            if name not in found and name not in _PROJECTS_DIRTY:
+                del _PROJECTS_CACHE[name]
+                _TASK_INDEX.pop(name, None)
+                _DATA_VERSION += 1
+    return [found[name] for name in sorted(found)]
 
 def _save_project(project):
-    """Save a single project to disk."""
-    pid = project["id"]
-    path = PROJECTS_DIR / f"{pid}.json"
-    path.write_text(json.dumps(project, indent=2))
+    """Save a project, with its task metrics precomputed.
+
+    The write is deferred to a short background timer, so a burst of edits
+    to the same project is serialized to disk once.
+    """
+    global _PROJECTS_TIMER, _DATA_VERSION
+    name = f"{project['id']}.json"
+    _compute_metrics(project)
+    with _PROJECTS_LOCK:
+        _DATA_VERSION += 1
+        _PROJECTS_DIRTY[name] = project
+        _PROJECTS_CACHE[name] = (None, project)
+        _PROJECTS_CACHE.move_to_end(name)
+        _index_tasks(name, None, project)
+        if _PROJECTS_TIMER is None:
+            _PROJECTS_TIMER = threading.Timer(_PROJECTS_FLUSH_DELAY, _flush_projects)
+            _PROJECTS_TIMER.daemon = True
+            _PROJECTS_TIMER.start()
     return project
 
+def _flush_projects():
+    """Write every pending project atomically. Timer callback; also run at exit."""
+    global _PROJECTS_TIMER
+    with _PROJECTS_LOCK:
+        _PROJECTS_TIMER = None
+        for name, project in list(_PROJECTS_DIRTY.items()):
+            path = PROJECTS_DIR / name
+            _atomic_write_bytes(path, _json_dumps(project, pretty=True))
+            del _PROJECTS_DIRTY[name]
+            # Keep the saved dict as the cached parse for the new file signature
+            st = path.stat()
+            sig = (st.st_mtime_ns, st.st_size)
+            _PROJECTS_CACHE[name] = (sig, project)
+            entry = _TASK_INDEX.get(name)
+            if entry and entry[0] is None:
+                _TASK_INDEX[name] = (sig, entry[1])
+
+def _discard_project(project_id):
+    """Delete a project file and any unflushed save of it. Returns False if it did not exist."""
+    global _DATA_VERSION
+    name = f"{project_id}.json"
+    path = PROJECTS_DIR / name
+    if has_request_context():
+        g.pop("_project_files", None)
+    with _PROJECTS_LOCK:
+        _DATA_VERSION += 1
+        existed = _PROJECTS_DIRTY.pop(name, None) is not None
+        _PROJECTS_CACHE.pop(name, None)
+        _TASK_INDEX.pop(name, None)
+        try:
+            path.unlink()
+            existed = True
+        except FileNotFoundError:
+            pass
+    return existed
+
+atexit.register(_flush_projects)
+
 def _compute_metrics(project):
     """Compute task metrics for a project."""
     tasks = project.get("tasks", [])
     total = len(tasks)
-    done = sum(1 for t in tasks if t.get("status") == "done")
-    blocked = sum(1 for t in tasks if t.get("status") == "blocked")
-    in_progress = sum(1 for t in tasks if t.get("status") == "in_progress")
-    todo = sum(1 for t in tasks if t.get("status") == "todo")
+    by_status = Counter(t.get("status") for t in tasks)
+    done = by_status["done"]
+    blocked = by_status["blocked"]
+    in_progress = by_status["in_progress"]
+    todo = by_status["todo"]
     project["metrics"] = {
         "totalTasks": total,
         "completedTasks": done,
@@ -4358,24 +5025,20 @@ def _compute_metrics(project):
 @app.route("/api/projects")
 def api_projects_list():
     projects = _load_projects()
-    for p in projects:
-        _compute_metrics(p)
-    return jsonify({"projects": projects})
+    return ojsonify({"projects": projects})
 
 @app.route("/api/projects/<project_id>")
 def api_project_get(project_id):
-    path = PROJECTS_DIR / f"{project_id}.json"
-    if not path.exists():
+    project = _load_project_cached(project_id)
+    if project is None:
         return jsonify({"error": "Project not found"}), 404
-    project = json.loads(path.read_text())
-    _compute_metrics(project)
-    return jsonify(project)
+    return ojsonify(project)
 
 @app.route("/api/projects", methods=["POST"])
 def api_project_create():
     data = request.json or {}
     pid = data.get("id") or str(_uuid.uuid4())[:8]
-    now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    now = _now_iso()
     project = {
         "id": pid,
         "name": data.get("name", "Untitled Project"),
@@ -4391,42 +5054,36 @@ def api_project_create():
         "tasks": data.get("tasks", [])
     }
     _save_project(project)
-    _compute_metrics(project)
     return jsonify(project), 201
 
 @app.route("/api/projects/<project_id>", methods=["PUT"])
 def api_project_update(project_id):
-    path = PROJECTS_DIR / f"{project_id}.json"
-    if not path.exists():
+    project = _load_project_cached(project_id, copy=True)
+    if project is None:
         return jsonify({"error": "Project not found"}), 404
-    project = json.loads(path.read_text())
     data = request.json or {}
     for key in ("name", "description", "status", "priority", "icon", "color", "deadline", "tags"):
         if key in data:
             project[key] = data[key]
-    project["updatedAt"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    project["updatedAt"] = _now_iso()
     _save_project(project)
-    _compute_metrics(project)
     return jsonify(project)
 
 @app.route("/api/projects/<project_id>", methods=["DELETE"])
 def api_project_delete(project_id):
-    path = PROJECTS_DIR / f"{project_id}.json"
-    if not path.exists():
+    if not _discard_project(project_id):
         return jsonify({"error": "Project not found"}), 404
-    path.unlink()
     return jsonify({"deleted": project_id})
 
 # --- Task CRUD within a project ---
 
 @app.route("/api/projects/<project_id>/tasks", methods=["POST"])
 def api_task_create(project_id):
-    path = PROJECTS_DIR / f"{project_id}.json"
-    if not path.exists():
+    project = _load_project_cached(project_id, copy=True)
+    if project is None:
         return jsonify({"error": "Project not found"}), 404
-    project = json.loads(path.read_text())
     data = request.json or {}
-    now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    now = _now_iso()
     task = {
         "id": data.get("id") or str(_uuid.uuid4())[:8],
         "title": data.get("title", "Untitled Task"),
@@ -4447,38 +5104,39 @@ def api_task_create(project_id):
 
 @app.route("/api/projects/<project_id>/tasks/<task_id>", methods=["PUT"])
 def api_task_update(project_id, task_id):
-    path = PROJECTS_DIR / f"{project_id}.json"
-    if not path.exists():
+    project = _load_project_cached(project_id)
+    if project is None:
         return jsonify({"error": "Project not found"}), 404
-    project = json.loads(path.read_text())
+    pos = _task_position(project_id, task_id)
+    if pos is None:
+        return jsonify({"error": "Task not found"}), 404
+    project = deepcopy(project)
+    task = project["tasks"][pos]
     data = request.json or {}
-    now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-    for task in project.get("tasks", []):
-        if task["id"] == task_id:
-            for key in ("title", "description", "status", "priority", "assignee", "deadline", "blockedBy"):
-                if key in data:
-                    task[key] = data[key]
-            task["updatedAt"] = now
-            if data.get("status") == "done" and not task.get("completedAt"):
-                task["completedAt"] = now
-            elif data.get("status") != "done":
-                task["completedAt"] = None
-            project["updatedAt"] = now
-            _save_project(project)
-            return jsonify(task)
-    return jsonify({"error": "Task not found"}), 404
+    now = _now_iso()
+    for key in ("title", "description", "status", "priority", "assignee", "deadline", "blockedBy"):
+        if key in data:
+            task[key] = data[key]
+    task["updatedAt"] = now
+    if data.get("status") == "done" and not task.get("completedAt"):
+        task["completedAt"] = now
+    elif data.get("status") != "done":
+        task["completedAt"] = None
+    project["updatedAt"] = now
+    _save_project(project)
+    return jsonify(task)
 
 @app.route("/api/projects/<project_id>/tasks/<task_id>", methods=["DELETE"])
 def api_task_delete(project_id, task_id):
-    path = PROJECTS_DIR / f"{project_id}.json"
-    if not path.exists():
+    project = _load_project_cached(project_id)
+    if project is None:
         return jsonify({"error": "Project not found"}), 404
-    project = json.loads(path.read_text())
-    before = len(project.get("tasks", []))
-    project["tasks"] = [t for t in project.get("tasks", []) if t["id"] != task_id]
-    if len(project["tasks"]) == before:
+    pos = _task_position(project_id, task_id)
+    if pos is None:
         return jsonify({"error": "Task not found"}), 404
-    project["updatedAt"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    project = deepcopy(project)
+    project["tasks"].pop(pos)  # _save_project re-indexes the trailing tasks
+    project["updatedAt"] = _now_iso()
     _save_project(project)
     return jsonify({"deleted": task_id})
 
@@ -4486,10 +5144,9 @@ def api_task_delete(project_id, task_id):
 
 @app.route("/api/projects/<project_id>/tasks/reorder", methods=["POST"])
 def api_tasks_reorder(project_id):
-    path = PROJECTS_DIR / f"{project_id}.json"
-    if not path.exists():
+    project = _load_project_cached(project_id, copy=True)
+    if project is None:
         return jsonify({"error": "Project not found"}), 404
-    project = json.loads(path.read_text())
     data = request.json or {}
     task_ids = data.get("taskIds", [])
     if task_ids:
@@ -4507,25 +5164,95 @@ def api_tasks_reorder(project_id):
 TODOS_FILE = Path(__file__).parent / "data" / "todos.json"
 
 
+# In-memory copy of todos.json. Saves update it immediately and are written
+# to disk by a short timer, so bursts of edits collapse into one write.
+_TODOS_LOCK = threading.Lock()
+_TODOS_CACHE = None    # (todos.json mtime_ns, list) — mtime is None while a write is pending
+_TODOS_TIMER = None
+_TODOS_FLUSH_DELAY = 0.2
+
+
+def _todos_mtime():
+    """mtime_ns of todos.json, stat'ed once per request. Raises OSError if missing."""
+    if not has_request_context():
+        return TODOS_FILE.stat().st_mtime_ns
+    if "_todos_mtime" not in g:
+        try:
+            g._todos_mtime = TODOS_FILE.stat().st_mtime_ns
+        except OSError:
+            g._todos_mtime = None
+    if g._todos_mtime is None:
+        raise FileNotFoundError(TODOS_FILE)
+    return g._todos_mtime
+
+
+def _standalone_todos_shared():
+    """The cached standalone todo list itself (do not mutate)."""
+    global _TODOS_CACHE, _DATA_VERSION
+    with _TODOS_LOCK:
+        if _TODOS_CACHE is None or _TODOS_CACHE[0] is not None:
+            try:
+                mtime = _todos_mtime()
+            except OSError:
+                if _TODOS_CACHE is not None:
+                    _TODOS_CACHE = None
+                    _DATA_VERSION += 1
+                return []
+            if _TODOS_CACHE is None or _TODOS_CACHE[0] != mtime:
+                _TODOS_CACHE = (mtime, _json_loads(TODOS_FILE.read_bytes()))
+                _DATA_VERSION += 1
+        return _TODOS_CACHE[1]
+
+
 def _load_standalone_todos():
-    if TODOS_FILE.exists():
-        return json.loads(TODOS_FILE.read_text())
-    return []
+    # Handlers mutate what they get back, so hand out copies
+    return [dict(t) for t in _standalone_todos_shared()]
+
+
+def _flush_standalone_todos():
+    """Write pending todos to disk (timer callback; also run at exit)."""
+    global _TODOS_CACHE, _TODOS_TIMER
+    with _TODOS_LOCK:
+        _TODOS_TIMER = None
+        if _TODOS_CACHE is None or _TODOS_CACHE[0] is not None:
+            return
+        todos = _TODOS_CACHE[1]
+        TODOS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write_bytes(TODOS_FILE, _json_dumps(todos, pretty=True))
+        _TODOS_CACHE = (TODOS_FILE.stat().st_mtime_ns, todos)
 
 
 def _save_standalone_todos(todos):
-    TODOS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    TODOS_FILE.write_text(json.dumps(todos, indent=2))
+    global _TODOS_CACHE, _TODOS_TIMER, _DATA_VERSION
+    with _TODOS_LOCK:
+        _TODOS_CACHE = (None, todos)
+        _DATA_VERSION += 1
+        if _TODOS_TIMER is None:
+            _TODOS_TIMER = threading.Timer(_TODOS_FLUSH_DELAY, _flush_standalone_todos)
+            _TODOS_TIMER.daemon = True
+            _TODOS_TIMER.start()
+
+
+atexit.register(_flush_standalone_todos)
+
+
+_TODO_VIEW_CACHE = {"key": None, "payload": None}
 
 
 @app.route("/api/todo")
 def api_todo_list():
     """Return all todos: project tasks + standalone, sorted by priority."""
+    # Refresh the underlying caches first; they bump _DATA_VERSION on change
+    projects = _load_projects()
+    standalone = _standalone_todos_shared()
+    key = _DATA_VERSION
+    if _TODO_VIEW_CACHE["key"] == key:
+        return app.response_class(_TODO_VIEW_CACHE["payload"], mimetype="application/json")
+
     items = []
     priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
 
     # Pull tasks from all projects
-    projects = _load_projects()
     for p in projects:
         color = p.get("color", "#ffffff")
         pname = p.get("name", "")
@@ -4542,7 +5269,7 @@ def api_todo_list():
             })
 
     # Standalone todos
-    for t in _load_standalone_todos():
+    for t in standalone:
         items.append({
             **t,
             "projectId": None,
@@ -4560,7 +5287,10 @@ def api_todo_list():
         return (done, prio, dl)
 
     items.sort(key=sort_key)
-    return jsonify({"items": items, "count": len(items)})
+    resp = ojsonify({"items": items, "count": len(items)})
+    _TODO_VIEW_CACHE["key"] = key
+    _TODO_VIEW_CACHE["payload"] = resp.get_data()
+    return resp
 
 
 @app.route("/api/todo/standalone", methods=["POST"])
@@ -4570,16 +5300,16 @@ def api_todo_create_standalone():
     if not data.get("title"):
         return jsonify({"error": "Title required"}), 400
     todos = _load_standalone_todos()
-    import uuid
+    now = _now_iso()
     todo = {
-        "id": str(uuid.uuid4())[:8],
+        "id": str(_uuid.uuid4())[:8],
         "title": data["title"],
         "description": data.get("description", ""),
         "status": data.get("status", "todo"),
         "priority": data.get("priority", "medium"),
         "deadline": data.get("deadline"),
-        "createdAt": datetime.now(timezone.utc).isoformat(),
-        "updatedAt": datetime.now(timezone.utc).isoformat(),
+        "createdAt": now,
+        "updatedAt": now,
     }
     todos.append(todo)
     _save_standalone_todos(todos)
@@ -4595,9 +5325,10 @@ def api_todo_update_standalone(todo_id):
             for k in ("title", "description", "status", "priority", "deadline"):
                 if k in data:
                     t[k] = data[k]
-            t["updatedAt"] = datetime.now(timezone.utc).isoformat()
+            now = _now_iso()
+            t["updatedAt"] = now
             if data.get("status") == "done" and not t.get("completedAt"):
-                t["completedAt"] = datetime.now(timezone.utc).isoformat()
+                t["completedAt"] = now
             _save_standalone_todos(todos)
             return jsonify(t)
     return jsonify({"error": "Not found"}), 404
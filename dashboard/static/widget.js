@@ -278,6 +278,42 @@
     }
   }
 
+  // Render SSE text deltas into a live bubble; resolves with the full reply
+  function readStream(body, typing) {
+    var reader = body.getReader();
+    var decoder = new TextDecoder();
+    var live = null, text = '', buf = '';
+    function pump() {
+      return reader.read().then(function(res) {
+        if (!res.done) buf += decoder.decode(res.value, { stream: true });
+        var events = buf.split('\n\n');
+        buf = res.done ? '' : events.pop();
+        events.forEach(function(evt) {
+          if (evt.indexOf('data: ') !== 0) return;
+          var data = JSON.parse(evt.slice(6));
+          if (data.error) throw new Error(data.error);
+          if (!data.delta) return;
+          if (!live) {
+            typing.remove();
+            live = document.createElement('div');
+            live.className = 'ros-msg assistant';
+            msgArea.appendChild(live);
+          }
+          text += data.delta;
+          live.textContent = text;
+          msgArea.scrollTop = msgArea.scrollHeight;
+        });
+        if (!res.done) return pump();
+        if (live) live.remove();
+        return text;
+      });
+    }
+    return pump().catch(function(err) {
+      if (live) live.remove();
+      throw err;
+    });
+  }
+
   function sendMessage(text) {
     if (!text.trim() || isLoading) return;
     addMessage('user', text);
@@ -294,13 +330,17 @@
     fetch(config.apiUrl + '/api/widget/chat', {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ botId: config.botId, messages: messages })
+      body: JSON.stringify({ botId: config.botId, messages: messages, stream: true })
+    })
+    .then(function(r) {
+      var ct = r.headers.get('Content-Type') || '';
+      if (r.body && ct.indexOf('text/event-stream') !== -1) return readStream(r.body, typing);
+      return r.json().then(function(data) { return data.reply; });
     })
-    .then(function(r) { return r.json(); })
-    .then(function(data) {
+    .then(function(reply) {
       typing.remove();
-      if (data.reply) {
-        addMessage('assistant', data.reply);
+      if (reply) {
+        addMessage('assistant', reply);
       } else {
         addMessage('assistant', 'Sorry, something went wrong.');
       }
@@ -23,11 +23,31 @@ Exit codes: 0 = clean, 1 = leak detected, 2 = Logician denied, 3 = error
 import json
 import os
 import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import ahocorasick  # optional: pyahocorasick, one-pass multi-marker matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import grpc  # optional: native Logician client instead of spawning grpcurl
+except ImportError:
+    grpc = None
+
+try:
+    import re2  # optional: google-re2, linear-time matching for credential patterns
+except ImportError:
+    re2 = None
+
 # ============================================================
 # CONFIGURATION
 # ============================================================
@@ -41,6 +61,11 @@ LOGICIAN_PORT = int(os.environ.get("LOGICIAN_PORT", "8080"))
 GRPCURL = os.path.expanduser(os.environ.get("GRPCURL", "~/go/bin/grpcurl"))
 PROTO_DIR = str(_PROJECT_ROOT / "logician" / "poc" / "mangle-service" / "proto")
 PROTO_FILE = "mangle.proto"
+# Native client stubs (optional), generated next to the proto with:
+#   python -m grpc_tools.protoc -I PROTO_DIR --python_out=PROTO_DIR --grpc_python_out=PROTO_DIR mangle.proto
+
+# Push approvals are reused for the same repo + HEAD commit within this window
+LOGICIAN_CACHE_TTL = 60
 
 # ============================================================
 # CREDENTIAL PATTERNS (regex)
@@ -91,6 +116,53 @@ CREDENTIAL_PATTERNS: Dict[str, List[re.Pattern]] = {
     ],
 }
 
+
+def _pattern_source(pat: re.Pattern) -> Tuple[str, bool]:
+    """(source without a leading (?i), whether the pattern ignores case)."""
+    src = pat.pattern
+    icase = bool(pat.flags & re.IGNORECASE)
+    if src.startswith("(?i)"):
+        src, icase = src[4:], True
+    return src, icase
+
+
+def _union_pattern(patterns: List[re.Pattern]) -> re.Pattern:
+    """One alternation over several patterns, keeping each one's IGNORECASE flag."""
+    parts = []
+    for pat in patterns:
+        src, icase = _pattern_source(pat)
+        parts.append(f"(?i:{src})" if icase else f"(?:{src})")
+    return re.compile("|".join(parts))
+
+
+# Matches wherever any credential pattern would; used to find candidate lines
+_ANY_CREDENTIAL_RE = _union_pattern(
+    [pat for patterns in CREDENTIAL_PATTERNS.values() for pat in patterns]
+)
+
+
+def _to_re2(pat: re.Pattern):
+    src, icase = _pattern_source(pat)
+    return re2.compile(f"(?i){src}" if icase else src)
+
+
+# With google-re2 installed, run the credential patterns on RE2's automaton so
+# crafted input (e.g. long word runs against seed_phrase) cannot trigger
+# backtracking blowups. All-or-nothing: the union gate and the individual
+# patterns must share one engine's semantics.
+if re2 is not None:
+    try:
+        _re2_patterns = {
+            name: [_to_re2(pat) for pat in patterns]
+            for name, patterns in CREDENTIAL_PATTERNS.items()
+        }
+        _re2_union = _to_re2(_ANY_CREDENTIAL_RE)
+    except Exception:
+        pass
+    else:
+        CREDENTIAL_PATTERNS.update(_re2_patterns)
+        _ANY_CREDENTIAL_RE = _re2_union
+
 # ============================================================
 # PRIVATE CONTENT FINGERPRINTS
 # ============================================================
@@ -131,6 +203,16 @@ FORBIDDEN_FILE_PATTERNS: List[re.Pattern] = [
     re.compile(r"SSOT-L0-BUSINESS-PLAN"),
 ]
 
+# One pass per filename; the individual patterns only run on a hit
+_FORBIDDEN_FILES_RE = _union_pattern(FORBIDDEN_FILE_PATTERNS)
+
+
+def _forbidden_file_patterns(name: str) -> List[str]:
+    """Source of every FORBIDDEN_FILE_PATTERNS entry matching a path."""
+    if not _FORBIDDEN_FILES_RE.search(name):
+        return []
+    return [pat.pattern for pat in FORBIDDEN_FILE_PATTERNS if pat.search(name)]
+
 # Business-sensitive content markers
 BUSINESS_MARKERS: List[Tuple[str, str]] = [
     (_m("revenue", " model"), "business_plan"),
@@ -141,6 +223,35 @@ BUSINESS_MARKERS: List[Tuple[str, str]] = [
     (_m("vesting", " schedule"), "tokenomics_internal"),
 ]
 
+# Lowercased once for the per-line substring checks: (marker_lc, marker, category)
+_PRIVATE_MARKERS_LC = [(marker.lower(), marker, cat) for marker, cat in PRIVATE_MARKERS]
+_WARN_MARKERS_LC = [(marker.lower(), marker, cat) for marker, cat in WARN_MARKERS]
+_BUSINESS_MARKERS_LC = [(marker.lower(), marker, cat) for marker, cat in BUSINESS_MARKERS]
+
+# All content markers in reporting order: (result category, marker, marker category)
+_MARKER_TABLE: List[Tuple[str, str, str]] = (
+    [("private_content", marker, cat) for marker, cat in PRIVATE_MARKERS]
+    + [("warning", marker, cat) for marker, cat in WARN_MARKERS]
+    + [("business_sensitive", marker, cat) for marker, cat in BUSINESS_MARKERS]
+)
+
+
+def _build_marker_automaton():
+    """Aho-Corasick automaton over the lowercased markers (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    needles: Dict[str, List[int]] = {}
+    for i, (_, marker, _) in enumerate(_MARKER_TABLE):
+        needles.setdefault(marker.lower(), []).append(i)
+    automaton = ahocorasick.Automaton()
+    for needle, idxs in needles.items():
+        automaton.add_word(needle, tuple(idxs))
+    automaton.make_automaton()
+    return automaton
+
+
+_MARKER_AC = _build_marker_automaton()
+
 
 # ============================================================
 # SCANNER
@@ -183,35 +294,187 @@ class ScanResult:
         return "\n".join(lines)
 
 
-def scan_text(text: str) -> ScanResult:
-    """Scan arbitrary text for data leaks."""
-    result = ScanResult()
+def _credential_lines(text: str) -> set:
+    """Line numbers (1-based, as in scan_text) that may contain a credential.
 
-    for line_num, line in enumerate(text.splitlines(), 1):
-        # Credential patterns
+    A single finditer of the union pattern over the whole text replaces ~15
+    per-line searches for lines that cannot match. Every line a union match
+    touches is returned, so lines hidden under a multi-line match are still
+    rescanned pattern by pattern.
+    """
+    lines = set()
+    matches = _ANY_CREDENTIAL_RE.finditer(text)
+    first = next(matches, None)
+    if first is None:
+        return lines
+    offsets = list(accumulate(map(len, text.splitlines(True)), initial=0))
+    for m in (first, *matches):
+        start = bisect_right(offsets, m.start())
+        end = bisect_right(offsets, m.end() - 1)
+        lines.update(range(start, end + 1))
+    return lines
+
+
+# Luhn value of a doubled digit (2*d, minus 9 when above 9)
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
+def _luhn_ok(digits: str) -> bool:
+    """Luhn checksum of a digit string; card-shaped numbers failing it are noise."""
+    total = 0
+    for i, d in enumerate(reversed(digits)):
+        n = ord(d) - 48
+        total += _LUHN_DOUBLED[n] if i & 1 else n
+    return total % 10 == 0
+
+
+def scan_line(result: ScanResult, line: str, line_num: int,
+              check_credentials: Optional[bool] = None) -> None:
+    """Scan one line into result.
+
+    check_credentials=None runs the union pattern on the line first; callers
+    that already know whether the line can hold a credential pass a bool.
+    """
+    # Every credential pattern and marker needs a non-space character
+    if not line or line.isspace():
+        return
+
+    if check_credentials is None:
+        check_credentials = _ANY_CREDENTIAL_RE.search(line) is not None
+
+    # Credential patterns (only on lines the union pattern flagged)
+    if check_credentials:
         for name, patterns in CREDENTIAL_PATTERNS.items():
             for pat in patterns:
                 for m in pat.finditer(line):
+                    if name == "credit_card" and not _luhn_ok(m.group()):
+                        continue
                     result.add("credential", name, m.group(), line_num)
 
-        # Private content markers (block)
-        for marker, cat in PRIVATE_MARKERS:
-            if marker.lower() in line.lower():
-                result.add("private_content", cat, marker, line_num)
+    low = line.lower()
+
+    if _MARKER_AC is not None:
+        # One automaton pass finds every marker; report each once, in table order
+        hits = {i for _, idxs in _MARKER_AC.iter(low) for i in idxs}
+        for i in sorted(hits):
+            bucket, marker, cat = _MARKER_TABLE[i]
+            result.add(bucket, cat, marker, line_num)
+        return
+
+    # Private content markers (block)
+    for marker_lc, marker, cat in _PRIVATE_MARKERS_LC:
+        if marker_lc in low:
+            result.add("private_content", cat, marker, line_num)
+
+    # Warn-only markers (logged but don't block)
+    for marker_lc, marker, cat in _WARN_MARKERS_LC:
+        if marker_lc in low:
+            result.add("warning", cat, marker, line_num)
 
-        # Warn-only markers (logged but don't block)
-        for marker, cat in WARN_MARKERS:
-            if marker.lower() in line.lower():
-                result.add("warning", cat, marker, line_num)
+    # Business-sensitive markers
+    for marker_lc, marker, cat in _BUSINESS_MARKERS_LC:
+        if marker_lc in low:
+            result.add("business_sensitive", cat, marker, line_num)
+
+
+# Inputs at least this large are split across a process pool
+PARALLEL_SCAN_MIN_BYTES = 512 * 1024
+
+
+def _scan_chunk(lines: List[str], first_line_num: int) -> List[Dict]:
+    """Process-pool worker: findings for a run of consecutive lines."""
+    result = ScanResult()
+    for line_num, line in enumerate(lines, first_line_num):
+        scan_line(result, line, line_num)
+    return result.findings
 
-        # Business-sensitive markers
-        for marker, cat in BUSINESS_MARKERS:
-            if marker.lower() in line.lower():
-                result.add("business_sensitive", cat, marker, line_num)
+
+def _parallel_scan(lines: List[str], first_line_num: int = 1) -> List[Dict]:
+    """Scan lines in contiguous chunks on a process pool; findings keep line order.
+
+    Workers are forked/spawned with this module imported, so the compiled
+    patterns and marker tables are built once per worker. Falls back to a
+    serial scan if the pool cannot be used.
+    """
+    workers = min(os.cpu_count() or 1, 8)
+    if workers < 2:
+        return _scan_chunk(lines, first_line_num)
+    size = -(-len(lines) // workers)
+    starts = range(0, len(lines), size)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = [
+                ex.submit(_scan_chunk, lines[i:i + size], first_line_num + i) for i in starts
+            ]
+            return [f for fut in futures for f in fut.result()]
+    except Exception:
+        return _scan_chunk(lines, first_line_num)
+
+
+def scan_text(text: str) -> ScanResult:
+    """Scan arbitrary text for data leaks."""
+    result = ScanResult()
+    if not text or text.isspace():
+        return result
+    if len(text) >= PARALLEL_SCAN_MIN_BYTES:
+        findings = _parallel_scan(text.splitlines())
+        result.findings.extend(findings)
+        result.clean = not findings
+        return result
+    cred_lines = _credential_lines(text)
+
+    for line_num, line in enumerate(text.splitlines(), 1):
+        scan_line(result, line, line_num, line_num in cred_lines)
 
     return result
 
 
+def _scan_diff_stream(cmd: List[str], timeout: int = 10) -> Tuple[ScanResult, int, str]:
+    """Run a git diff and scan its added lines as they stream in.
+
+    Numbering matches scan_text() over the joined added lines. Headers
+    ('+++') and Logician rule definitions ('+sensitive_pattern(') are
+    skipped. Once PARALLEL_SCAN_MIN_BYTES of added text has been scanned
+    inline, the remainder is collected and scanned on a process pool.
+    Returns (findings, returncode, stderr).
+    """
+    result = ScanResult()
+    rest: List[str] = []
+    rest_start = 0
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1 << 20,
+    )
+    killer = threading.Timer(timeout, proc.kill)
+    killer.start()
+    try:
+        line_num = 0
+        scanned = 0
+        for chunk in proc.stdout:
+            for line in chunk.splitlines():
+                if (line.startswith("+") and not line.startswith("+++")
+                        and not line.startswith("+sensitive_pattern(")):
+                    line_num += 1
+                    if scanned < PARALLEL_SCAN_MIN_BYTES:
+                        scan_line(result, line[1:], line_num)
+                        scanned += len(line)
+                    else:
+                        if not rest:
+                            rest_start = line_num
+                        rest.append(line[1:])
+        stderr = proc.stderr.read()
+        returncode = proc.wait()
+    finally:
+        killer.cancel()
+        proc.stdout.close()
+        proc.stderr.close()
+    if rest and returncode == 0:
+        findings = _parallel_scan(rest, rest_start)
+        result.findings.extend(findings)
+        if findings:
+            result.clean = False
+    return result, returncode, stderr
+
+
 def scan_file(path: str) -> ScanResult:
     """Scan a file for data leaks."""
     p = Path(path)
@@ -222,9 +485,8 @@ def scan_file(path: str) -> ScanResult:
 
     # Check if the file itself is forbidden
     result = ScanResult()
-    for pat in FORBIDDEN_FILE_PATTERNS:
-        if pat.search(str(p)):
-            result.add("forbidden_file", pat.pattern, str(p))
+    for pattern in _forbidden_file_patterns(str(p)):
+        result.add("forbidden_file", pattern, str(p))
 
     # Scan content (skip binary)
     try:
@@ -247,10 +509,10 @@ def scan_git_diff(repo_path: str, staged: bool = True) -> ScanResult:
     cmd.append("--no-color")
 
     try:
-        diff = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if diff.returncode != 0:
+        text_result, returncode, stderr = _scan_diff_stream(cmd)
+        if returncode != 0:
             result = ScanResult()
-            result.add("error", "git_diff_failed", diff.stderr[:100])
+            result.add("error", "git_diff_failed", stderr[:100])
             return result
     except Exception as e:
         result = ScanResult()
@@ -263,18 +525,10 @@ def scan_git_diff(repo_path: str, staged: bool = True) -> ScanResult:
     files_cmd = ["git", "-C", repo_path, "diff", "--cached", "--name-only"]
     files = subprocess.run(files_cmd, capture_output=True, text=True, timeout=5)
     for fname in files.stdout.strip().splitlines():
-        for pat in FORBIDDEN_FILE_PATTERNS:
-            if pat.search(fname):
-                result.add("forbidden_file", pat.pattern, fname)
-
-    # Scan only ADDED lines (lines starting with '+', skip diff headers '+++')
-    # Exclude Logician rule definitions (they define patterns, not leak them)
-    added_lines = "\n".join(
-        line[1:] for line in diff.stdout.splitlines()
-        if line.startswith("+") and not line.startswith("+++")
-        and not line.startswith("+sensitive_pattern(")
-    )
-    text_result = scan_text(added_lines)
+        for pattern in _forbidden_file_patterns(fname):
+            result.add("forbidden_file", pattern, fname)
+
+    # Added-line findings were collected while the diff streamed
     result.findings.extend(text_result.findings)
     if text_result.findings:
         result.clean = False
@@ -287,8 +541,43 @@ def scan_git_diff(repo_path: str, staged: bool = True) -> ScanResult:
 # ============================================================
 
 
+_MANGLE = None  # (mangle_pb2, MangleStub) once loaded; False if unavailable
+
+
+def _mangle_client():
+    """Persistent native gRPC client, or None without grpcio / generated stubs."""
+    global _MANGLE
+    if _MANGLE is None:
+        _MANGLE = False
+        if grpc is not None:
+            try:
+                if PROTO_DIR not in sys.path:
+                    sys.path.append(PROTO_DIR)
+                import mangle_pb2
+                import mangle_pb2_grpc
+                channel = grpc.insecure_channel(f"{LOGICIAN_HOST}:{LOGICIAN_PORT}")
+                _MANGLE = (mangle_pb2, mangle_pb2_grpc.MangleStub(channel))
+            except Exception:
+                pass
+    return _MANGLE or None
+
+
 def query_logician(query: str) -> Optional[str]:
     """Query the Logician (Mangle) via gRPC. Returns answer or None on failure."""
+    client = _mangle_client()
+    if client is not None:
+        pb2, stub = client
+        try:
+            from google.protobuf.json_format import MessageToJson
+
+            resp = stub.Query(pb2.QueryRequest(query=query, program=""), timeout=5)
+            # Same JSON rendering grpcurl prints, so callers' checks are unchanged
+            return MessageToJson(resp).strip() or None
+        except grpc.RpcError:
+            return None
+        except Exception:
+            pass  # stub/message mismatch: fall back to grpcurl
+
     if not os.path.exists(GRPCURL):
         return None
 
@@ -337,6 +626,44 @@ def logician_approves_push(repo_name: str) -> Tuple[bool, str]:
     return True, "Logician approved"
 
 
+def _git_head(repo_path: str) -> Optional[str]:
+    try:
+        proc = subprocess.run(
+            ["git", "-C", repo_path, "rev-parse", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+        )
+    except Exception:
+        return None
+    return proc.stdout.strip() if proc.returncode == 0 else None
+
+
+# (repo_abs, HEAD sha) -> (monotonic expiry, reason). Process memory only:
+# an on-disk cache would let anything running as the user forge approvals.
+_LOGICIAN_CACHE: Dict[Tuple[str, str], Tuple[float, str]] = {}
+
+
+def cached_logician_approval(repo_abs: str) -> Tuple[bool, str]:
+    """logician_approves_push(), reusing an approval for the same (repo, HEAD).
+
+    Approvals are kept in memory for LOGICIAN_CACHE_TTL seconds, so repeated
+    checks within one process skip both grpcurl calls. Denials are never cached.
+    """
+    head = _git_head(repo_abs)
+    key = (repo_abs, head)
+    now = time.monotonic()
+    if head:
+        cached = _LOGICIAN_CACHE.get(key)
+        if cached and cached[0] > now:
+            return True, f"{cached[1]} (cached)"
+
+    approved, reason = logician_approves_push(repo_abs)
+    if approved and head:
+        for k in [k for k, v in _LOGICIAN_CACHE.items() if v[0] <= now]:
+            del _LOGICIAN_CACHE[k]
+        _LOGICIAN_CACHE[key] = (now + LOGICIAN_CACHE_TTL, reason)
+    return approved, reason
+
+
 # ============================================================
 # PRE-PUSH HOOK INTEGRATION
 # ============================================================
@@ -355,14 +682,8 @@ def pre_push_check(repo_path: str) -> int:
     # Also scan what's about to be pushed (added lines only)
     cmd = ["git", "-C", repo_path, "diff", "HEAD~1..HEAD", "--no-color"]
     try:
-        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if proc.returncode == 0:
-            added_only = "\n".join(
-                line[1:] for line in proc.stdout.splitlines()
-                if line.startswith("+") and not line.startswith("+++")
-                and not line.startswith("+sensitive_pattern(")
-            )
-            push_result = scan_text(added_only)
+        push_result, returncode, _ = _scan_diff_stream(cmd)
+        if returncode == 0:
             diff_result.findings.extend(push_result.findings)
             if push_result.findings:
                 diff_result.clean = False
@@ -378,7 +699,7 @@ def pre_push_check(repo_path: str) -> int:
 
     # Step 2: Query Logician
     repo_abs = str(Path(repo_path).resolve())
-    approved, reason = logician_approves_push(repo_abs)
+    approved, reason = cached_logician_approval(repo_abs)
 
     if not approved:
         print(f"[Shield] ❌ BLOCKED — {reason}")
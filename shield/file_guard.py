@@ -6,13 +6,27 @@ This means the AI agent CANNOT unlock files; only a human with sudo can.
 Previous version used `uchg` which could be bypassed without root.
 """
 
+import functools
 import json
 import os
+import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Fast JSON for CLI output (orjson optional; stdlib fallback)
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 _REPO_ROOT = Path(__file__).resolve().parent.parent
+_HOME_STR = str(Path.home())
 _SSOT_ROOT = _REPO_ROOT / "ssot"
 if not _SSOT_ROOT.exists():
     _SSOT_ROOT = _REPO_ROOT / "ssot-template"
@@ -90,48 +104,133 @@ EXCLUDE_PATTERNS = [
 ]
 
 
+@functools.lru_cache(maxsize=512)
 def expand_path(p: str) -> Path:
+    # Manifest paths are static; call expand_path.cache_clear() if symlinks move
     return Path(os.path.expanduser(p)).resolve()
 
 
+# EXCLUDE_PATTERNS split by kind once, so should_exclude does no per-pattern loop
+_EXCLUDE_NAMES = frozenset(EXCLUDE_PATTERNS)
+_EXCLUDE_SUFFIXES = tuple(p[1:] for p in EXCLUDE_PATTERNS if p.startswith("*"))
+_EXCLUDE_DIR_SUBSTRINGS = tuple(p.rstrip("/") for p in EXCLUDE_PATTERNS if p.endswith("/"))
+
+
 def should_exclude(filepath: Path) -> bool:
     name = filepath.name
-    parts = str(filepath)
-    for pat in EXCLUDE_PATTERNS:
-        if pat.endswith("/") and pat.rstrip("/") in parts:
-            return True
-        if pat.startswith("*") and name.endswith(pat[1:]):
-            return True
-        if name == pat:
+    if name in _EXCLUDE_NAMES or name.endswith(_EXCLUDE_SUFFIXES):
+        return True
+    parts = os.fspath(filepath)
+    for d in _EXCLUDE_DIR_SUBSTRINGS:
+        if d in parts:
             return True
     return False
 
 
-def collect_files(paths, include_data=False, exclude_names=None):
-    """Collect all files from paths (expanding dirs recursively)."""
-    result = []
+def _scandir_recursive(path, dirs=None):
+    """Yield os.DirEntry for every file under path.
+
+    Like rglob("*"), symlinked directories are not descended into, while
+    symlinks to files are yielded. DirEntry caches its type and stat, so
+    callers can reuse them without extra syscalls; on Linux and macOS the
+    type comes from the directory listing itself (d_type), so only
+    symlinks cost a stat here.
+
+    If dirs is a list, (path, mtime_ns) of every directory visited is
+    appended to it, taken before the directory is listed.
+    """
+    if dirs is not None:
+        dirs.append((path, _mtime_ns(path)))
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _scandir_recursive(entry.path, dirs)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+
+def _mtime_ns(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _collect_entries(paths, include_data=False, exclude_names=None, seen=None, sort=True):
+    """(Path, DirEntry or None) pairs for collect_files; None for files
+    named directly in paths. seen collects (path, mtime_ns) of every path
+    and directory looked at. sort=False keeps walk order."""
+    result = {}  # path string -> (Path, DirEntry or None); dedups without hashing Paths
     _excl = set(exclude_names or [])
     for p in paths:
         fp = expand_path(p)
+        if fp.is_dir():
+            for entry in _scandir_recursive(fp, seen):
+                f = Path(entry.path)
+                if entry.name not in _excl and (include_data or not should_exclude(f)):
+                    result[entry.path] = (f, entry)
+            continue
+        if seen is not None:
+            seen.append((fp, _mtime_ns(fp)))
         if fp.is_file():
             if fp.name not in _excl and (include_data or not should_exclude(fp)):
-                result.append(fp)
-        elif fp.is_dir():
-            for f in fp.rglob("*"):
-                if f.is_file() and f.name not in _excl and (include_data or not should_exclude(f)):
-                    result.append(f)
-    return sorted(set(result))
+                result.setdefault(os.fspath(fp), (fp, None))
+    if not sort:
+        return list(result.values())
+    return [result[k] for k in sorted(result)]
+
+
+_FILES_CACHE = {}  # group_id -> (((path, mtime_ns), ...), [(Path, None), ...])
+
+
+def _group_entries(group_id: str, group: dict):
+    """_collect_entries for a manifest group, reused while none of the
+    directories it walked has changed. A directory's mtime moves whenever
+    an entry is added, removed or renamed, so checking those is enough to
+    know the file list is the same; file contents are not cached."""
+    cached = _FILES_CACHE.get(group_id)
+    if cached is not None and all(_mtime_ns(p) == m for p, m in cached[0]):
+        return cached[1]
+    seen = []
+    entries = _collect_entries(group["paths"], include_data=group.get("include_data", False),
+                               exclude_names=group.get("exclude_names"), seen=seen)
+    # Cached DirEntry stats would go stale, so hits stat each file afresh
+    _FILES_CACHE[group_id] = (tuple(seen), [(f, None) for f, _ in entries])
+    return entries
+
+
+def collect_files(paths, include_data=False, exclude_names=None, sort=True):
+    """Collect all files from paths (expanding dirs recursively)."""
+    return [f for f, _ in _collect_entries(paths, include_data, exclude_names, sort=sort)]
+
+
+def _file_stat(f: Path, entry=None):
+    """stat of f, reusing the DirEntry's cached one; None if it is gone."""
+    try:
+        return entry.stat() if entry is not None else f.stat()
+    except OSError:
+        return None
+
+
+_IMMUTABLE = stat.SF_IMMUTABLE | stat.UF_IMMUTABLE
+
+
+def _flags_locked(st) -> bool:
+    # st_flags only exists on macOS/BSD; elsewhere nothing is ever locked
+    return bool(getattr(st, "st_flags", 0) & _IMMUTABLE)
 
 
 def is_locked(filepath: Path) -> bool:
     """Check if file has schg or uchg flag set (either counts as locked)."""
     try:
-        result = subprocess.run(
-            ["ls", "-lO", str(filepath)],
-            capture_output=True, text=True, timeout=5
-        )
-        return "schg" in result.stdout or "uchg" in result.stdout
-    except Exception:
+        return _flags_locked(os.stat(filepath))
+    except OSError:
         return False
 
 
@@ -146,9 +245,10 @@ def get_status() -> dict:
             for r in repos:
                 rp = expand_path(r)
                 locked = is_hook_locked(rp)
+                path = os.fspath(rp)
                 file_status.append({
-                    "path": str(rp),
-                    "short": str(rp).replace(str(Path.home()), "~"),
+                    "path": path,
+                    "short": path.replace(_HOME_STR, "~", 1),
                     "locked": locked,
                     "size": 0,
                 })
@@ -163,16 +263,16 @@ def get_status() -> dict:
                 "files": file_status,
             }
             continue
-        files = collect_files(group["paths"], include_data=group.get("include_data", False),
-                              exclude_names=group.get("exclude_names"))
+        entries = _group_entries(group_id, group)
         file_status = []
-        for f in files:
-            locked = is_locked(f)
+        for f, entry in entries:
+            st = _file_stat(f, entry)
+            path = os.fspath(f)
             file_status.append({
-                "path": str(f),
-                "short": str(f).replace(str(Path.home()), "~"),
-                "locked": locked,
-                "size": f.stat().st_size if f.exists() else 0,
+                "path": path,
+                "short": path.replace(_HOME_STR, "~", 1),
+                "locked": st is not None and _flags_locked(st),
+                "size": st.st_size if st is not None else 0,
             })
         all_locked = len(file_status) > 0 and all(f["locked"] for f in file_status)
         any_locked = any(f["locked"] for f in file_status)
@@ -195,6 +295,57 @@ def _sudo_chflags(flag: str, filepath: str, password: str = None) -> bool:
     return result.returncode == 0
 
 
+def _map_parallel(fn, items) -> list:
+    """fn over items on a thread pool (each call mostly waits on a subprocess)."""
+    if len(items) < 2:
+        return [fn(i) for i in items]
+    workers = min(16, (os.cpu_count() or 1) * 2, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(fn, items))
+
+
+def _chunked(paths, max_bytes=200_000):
+    """Split paths into argv-sized chunks (well under macOS ARG_MAX)."""
+    buf, n = [], 0
+    for p in paths:
+        n += len(p) + 1
+        if buf and n > max_bytes:
+            yield buf
+            buf, n = [], len(p) + 1
+        buf.append(p)
+    if buf:
+        yield buf
+
+
+def _run_many(cmd, paths, stdin_data=None) -> dict:
+    """Run `cmd path1 path2 ...` per chunk; {path: ok}.
+
+    chflags is variadic, so one process handles a whole chunk. A failed
+    chunk is retried file by file to find out which paths failed.
+    """
+    def run(args, timeout):
+        try:
+            return subprocess.run(cmd + args, input=stdin_data, capture_output=True,
+                                  text=True, timeout=timeout).returncode == 0
+        except Exception:
+            return False
+
+    status = {}
+    for chunk in _chunked(paths):
+        if run(chunk, 60):
+            status.update(dict.fromkeys(chunk, True))
+        else:
+            status.update(zip(chunk, _map_parallel(lambda p: run([p], 10), chunk)))
+    return status
+
+
+def _sudo_chflags_many(flag: str, filepaths, password: str = None) -> dict:
+    """sudo chflags over many files in as few processes as possible; {path: ok}."""
+    cmd = ["sudo", "-S", "chflags", flag] if password else ["sudo", "chflags", flag]
+    stdin_data = (password + "\n") if password else None
+    return _run_many(cmd, list(filepaths), stdin_data)
+
+
 def lock_group(group_id: str, password: str = None) -> dict:
     """Lock all files in a group using sudo chflags schg (system immutable, root-only)."""
     if group_id not in GUARD_MANIFEST:
@@ -207,11 +358,10 @@ def lock_group(group_id: str, password: str = None) -> dict:
             results.append(lock_hook(rp))
         return {"group": group_id, "results": results}
     files = collect_files(group["paths"], include_data=group.get("include_data", False),
-                          exclude_names=group.get("exclude_names"))
-    results = []
-    for f in files:
-        ok = _sudo_chflags("schg", str(f), password)
-        results.append({"path": str(f), "locked": ok, **({"error": "sudo failed"} if not ok else {})})
+                          exclude_names=group.get("exclude_names"), sort=False)
+    oks = _sudo_chflags_many("schg", map(str, files), password)
+    results = [{"path": str(f), "locked": oks[str(f)], **({"error": "sudo failed"} if not oks[str(f)] else {})}
+               for f in files]
     return {"group": group_id, "results": results}
 
 
@@ -227,11 +377,10 @@ def unlock_group(group_id: str, password: str = None) -> dict:
             results.append(unlock_hook(rp))
         return {"group": group_id, "results": results}
     files = collect_files(group["paths"], include_data=group.get("include_data", False),
-                          exclude_names=group.get("exclude_names"))
-    results = []
-    for f in files:
-        ok = _sudo_chflags("noschg", str(f), password)
-        results.append({"path": str(f), "unlocked": ok, **({"error": "sudo failed"} if not ok else {})})
+                          exclude_names=group.get("exclude_names"), sort=False)
+    oks = _sudo_chflags_many("noschg", map(str, files), password)
+    results = [{"path": str(f), "unlocked": oks[str(f)], **({"error": "sudo failed"} if not oks[str(f)] else {})}
+               for f in files]
     return {"group": group_id, "results": results}
 
 
@@ -242,15 +391,24 @@ exit 1
 """
 
 
+def _is_shield_hook(hook: Path) -> bool:
+    """True if hook is our pre-push hook. The marker is on its second line,
+    so only the head of the file is read."""
+    try:
+        with open(hook, "rb") as f:
+            return b"Shield File Guard" in f.read(256)
+    except OSError:
+        return False
+
+
 def is_hook_locked(repo_path: Path) -> bool:
-    hook = repo_path / ".git" / "hooks" / "pre-push"
-    return hook.exists() and "Shield File Guard" in hook.read_text()
+    return _is_shield_hook(repo_path / ".git" / "hooks" / "pre-push")
 
 
 def lock_hook(repo_path: Path) -> dict:
     hook = repo_path / ".git" / "hooks" / "pre-push"
     # Back up existing hook if present and not ours
-    if hook.exists() and "Shield File Guard" not in hook.read_text():
+    if hook.exists() and not _is_shield_hook(hook):
         hook.rename(hook.with_suffix(".pre-shield-backup"))
     hook.write_text(PRE_PUSH_HOOK)
     hook.chmod(0o755)
@@ -260,7 +418,7 @@ def lock_hook(repo_path: Path) -> dict:
 def unlock_hook(repo_path: Path) -> dict:
     hook = repo_path / ".git" / "hooks" / "pre-push"
     backup = hook.with_suffix(".pre-shield-backup")
-    if hook.exists() and "Shield File Guard" in hook.read_text():
+    if _is_shield_hook(hook):
         hook.unlink()
         if backup.exists():
             backup.rename(hook)
@@ -287,31 +445,45 @@ def migrate_uchg_to_schg() -> dict:
     """Migrate all guarded files from uchg (user) to schg (system) immutable.
     Requires root. Run: sudo python3 file_guard.py migrate
     """
-    results = []
+    files = []
     for group_id, group in GUARD_MANIFEST.items():
         if group.get("hook_guard"):
             continue
-        files = collect_files(group["paths"], include_data=group.get("include_data", False),
-                              exclude_names=group.get("exclude_names"))
-        for f in files:
-            try:
-                # Check current state
-                check = subprocess.run(["ls", "-lO", str(f)], capture_output=True, text=True, timeout=5)
-                had_uchg = "uchg" in check.stdout and "schg" not in check.stdout
-                had_schg = "schg" in check.stdout
-
-                if had_schg:
-                    results.append({"path": str(f), "action": "already_schg"})
-                    continue
+        files += collect_files(group["paths"], include_data=group.get("include_data", False),
+                               exclude_names=group.get("exclude_names"), sort=False)
+
+    # Check current state
+    state = {}
+    for f in files:
+        try:
+            flags = getattr(os.stat(f), "st_flags", 0)
+        except OSError as e:
+            state[str(f)] = e
+            continue
+        if flags & stat.SF_IMMUTABLE:
+            state[str(f)] = "schg"
+        elif flags & stat.UF_IMMUTABLE:
+            state[str(f)] = "uchg"
+        else:
+            state[str(f)] = None
 
-                if had_uchg:
-                    # Remove uchg first, then apply schg
-                    subprocess.run(["chflags", "nouchg", str(f)], check=True, timeout=5)
+    # Remove uchg first, then apply schg — one chflags per chunk of files
+    nouchg = _run_many(["chflags", "nouchg"], [p for p, s in state.items() if s == "uchg"])
+    schg = _run_many(["chflags", "schg"], [p for p, s in state.items()
+                                           if s in (None, "uchg") and nouchg.get(p, True)])
 
-                subprocess.run(["chflags", "schg", str(f)], check=True, timeout=5)
-                results.append({"path": str(f), "action": "migrated" if had_uchg else "locked_new"})
-            except subprocess.CalledProcessError as e:
-                results.append({"path": str(f), "action": "error", "error": str(e)})
+    results = []
+    for p, s in state.items():
+        if isinstance(s, OSError):
+            results.append({"path": p, "action": "error", "error": str(s)})
+        elif s == "schg":
+            results.append({"path": p, "action": "already_schg"})
+        elif not nouchg.get(p, True):
+            results.append({"path": p, "action": "error", "error": "chflags nouchg failed"})
+        elif not schg[p]:
+            results.append({"path": p, "action": "error", "error": "chflags schg failed"})
+        else:
+            results.append({"path": p, "action": "migrated" if s == "uchg" else "locked_new"})
     return {"migrated": sum(1 for r in results if r["action"] == "migrated"),
             "already": sum(1 for r in results if r["action"] == "already_schg"),
             "new": sum(1 for r in results if r["action"] == "locked_new"),
@@ -327,21 +499,21 @@ if __name__ == "__main__":
 
     cmd = sys.argv[1]
     if cmd == "status":
-        print(json.dumps(get_status(), indent=2))
+        print(_dumps(get_status()))
     elif cmd == "migrate":
-        print(json.dumps(migrate_uchg_to_schg(), indent=2))
+        print(_dumps(migrate_uchg_to_schg()))
     elif cmd == "lock" and len(sys.argv) > 2:
         target = sys.argv[2]
         if target in GUARD_MANIFEST:
-            print(json.dumps(lock_group(target), indent=2))
+            print(_dumps(lock_group(target)))
         else:
-            print(json.dumps(lock_file(target), indent=2))
+            print(_dumps(lock_file(target)))
     elif cmd == "unlock" and len(sys.argv) > 2:
         target = sys.argv[2]
         if target in GUARD_MANIFEST:
-            print(json.dumps(unlock_group(target), indent=2))
+            print(_dumps(unlock_group(target)))
         else:
-            print(json.dumps(unlock_file(target), indent=2))
+            print(_dumps(unlock_file(target)))
     else:
         print("Usage: file_guard.py [status|lock|unlock|migrate] [group_id|file_path]")
         sys.exit(1)
@@ -0,0 +1,48 @@
+"""Shared spl-token CLI helpers for the NFT minters."""
+
+import functools
+import re
+import subprocess
+from pathlib import Path
+
+
+# Solana CLI path
+SOLANA_BIN = Path.home() / ".local" / "share" / "solana" / "install" / "active_release" / "bin"
+
+# Token-2022 program
+TOKEN_2022_PROGRAM = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+
+# spl-token create-token output parsing
+RE_ADDRESS = re.compile(r"Address:\s+(\S+)")
+RE_CREATING_TOKEN = re.compile(r"Creating token\s+(\S+)")
+
+
+@functools.lru_cache(maxsize=32)
+def _expand_path(path: str) -> str:
+    return str(Path(path).expanduser())
+
+
+def run_spl_token(*args: str, keypair_path: str = "~/.config/solana/id.json") -> str:
+    """Run an spl-token CLI command and return stdout.
+
+    Args:
+        *args: Arguments to pass to spl-token.
+        keypair_path: Path to the signing keypair.
+
+    Returns:
+        str: Command stdout.
+
+    Raises:
+        RuntimeError: If the command fails.
+    """
+    expanded = _expand_path(keypair_path)
+    cmd = [
+        str(SOLANA_BIN / "spl-token"),
+        *args,
+        "--url", "devnet",
+        "--fee-payer", expanded,
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+    if result.returncode != 0:
+        raise RuntimeError(f"spl-token failed: {result.stderr.strip()}")
+    return result.stdout.strip()
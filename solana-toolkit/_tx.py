@@ -0,0 +1,164 @@
+"""Shared transaction send/confirm helpers for TokenManager and SymbioticClient."""
+
+import asyncio
+import contextlib
+import time
+
+from solana.rpc.api import Client
+from solana.rpc.types import TxOpts
+from solders.transaction import Transaction
+
+# Seconds to wait for a transaction to reach "confirmed"
+CONFIRM_TIMEOUT = 30
+
+_SEND_OPTS = TxOpts(skip_preflight=True, preflight_commitment="confirmed")
+
+
+class TransactionError(Exception):
+    """The cluster rejected or failed a sent transaction."""
+
+
+def build_tx(ixs: list, signers: list, blockhash, fee_payer=None) -> Transaction:
+    """Compile and sign a transaction in one call; the first signer pays by default."""
+    return Transaction.new_signed_with_payer(ixs, fee_payer or signers[0].pubkey(), signers, blockhash)
+
+
+class TransactionSender:
+    """Mixin for clients with a ``client`` attribute: builds, sends and
+    confirms transactions, and lets a batch of them share one
+    getLatestBlockhash."""
+
+    _pinned_blockhash = None
+
+    def _blockhash(self):
+        if self._pinned_blockhash is not None:
+            return self._pinned_blockhash
+        return self.client.get_latest_blockhash().value.blockhash
+
+    @contextlib.contextmanager
+    def with_batched_blockhash(self):
+        """Pin one blockhash for every transaction built inside the block.
+
+        Blockhashes stay valid for ~150 slots, so keep batches short. Two
+        transactions with identical instructions and signers would share a
+        signature and the second would be dropped as a duplicate, so only
+        batch distinct transactions.
+        """
+        outer = self._pinned_blockhash
+        if outer is None:
+            self._pinned_blockhash = self.client.get_latest_blockhash().value.blockhash
+        try:
+            yield self._pinned_blockhash
+        finally:
+            self._pinned_blockhash = outer
+
+    def _send_tx(self, ixs: list, signers: list, fee_payer=None, blockhash=None) -> str:
+        """Build, sign and send a transaction. Returns signature string."""
+        tx = build_tx(ixs, signers, blockhash or self._blockhash(), fee_payer)
+        return send_and_confirm(self.client, tx)
+
+
+def ws_url(client: Client) -> str:
+    """WebSocket endpoint matching the client's HTTP RPC URL."""
+    provider = getattr(client, "_provider", None)
+    http_url = getattr(provider, "endpoint_uri", None) or "https://api.devnet.solana.com"
+    if http_url.startswith("https://"):
+        return "wss://" + http_url[len("https://"):]
+    if http_url.startswith("http://"):
+        return "ws://" + http_url[len("http://"):]
+    return http_url
+
+
+def _send(client: Client, tx: Transaction):
+    resp = client.send_transaction(tx, opts=_SEND_OPTS)
+    sig = resp.value
+    if sig is None:
+        raise TransactionError(f"Transaction failed: {resp}")
+    return sig
+
+
+async def _send_and_wait_ws(client: Client, tx: Transaction, sent: list):
+    from solana.rpc.websocket_api import connect
+
+    sig = tx.signatures[0]
+    async with connect(ws_url(client)) as ws:
+        # Subscribe before sending so the notification cannot be missed
+        await ws.signature_subscribe(sig, commitment="confirmed")
+        await ws.recv()  # subscription id
+        sent.append(_send(client, tx))
+        try:
+            msgs = await asyncio.wait_for(ws.recv(), CONFIRM_TIMEOUT)
+        except asyncio.TimeoutError:
+            return sent[0]
+        for msg in msgs:
+            err = getattr(getattr(getattr(msg, "result", None), "value", None), "err", None)
+            if err:
+                raise TransactionError(f"Transaction error: {err}")
+    return sent[0]
+
+
+def poll_delays():
+    """Sleep schedule for status polling: check at once, then back off from
+    0.2 s (about one slot) by 1.5x up to 1 s, until CONFIRM_TIMEOUT elapses."""
+    deadline = time.monotonic() + CONFIRM_TIMEOUT
+    yield 0
+    delay = 0.2
+    while time.monotonic() + delay < deadline:
+        yield delay
+        delay = min(delay * 1.5, 1.0)
+
+
+def _poll(client: Client, sig):
+    for delay in poll_delays():
+        time.sleep(delay)
+        status = client.get_signature_statuses([sig])
+        if status.value and status.value[0] is not None:
+            if status.value[0].err:
+                raise TransactionError(f"Transaction error: {status.value[0].err}")
+            return sig
+    return sig
+
+
+def send_and_confirm(client: Client, tx: Transaction) -> str:
+    """Send a signed transaction and wait until it is confirmed.
+
+    Confirmation comes from a signatureSubscribe notification; if the
+    WebSocket cannot be used (no websockets package, connection refused,
+    already inside an event loop) it falls back to polling
+    getSignatureStatuses. Returns the signature string.
+    """
+    sent = []
+    try:
+        return str(asyncio.run(_send_and_wait_ws(client, tx, sent)))
+    except TransactionError:
+        raise
+    except Exception:
+        if not sent:
+            sent.append(_send(client, tx))
+    return str(_poll(client, sent[0]))
+
+
+def send_many_and_confirm(client: Client, txs: list) -> list:
+    """Send independent signed transactions back to back, then confirm them
+    together (one getSignatureStatuses per poll, up to 256 signatures each).
+
+    Returns signature strings in the order of ``txs``.
+    """
+    sigs = [_send(client, tx) for tx in txs]
+    pending = list(range(len(sigs)))
+    for delay in poll_delays():
+        time.sleep(delay)
+        statuses = []
+        for i in range(0, len(pending), 256):
+            chunk = [sigs[j] for j in pending[i:i + 256]]
+            statuses.extend(client.get_signature_statuses(chunk).value or [None] * len(chunk))
+        still = []
+        for j, status in zip(pending, statuses):
+            if status is None:
+                still.append(j)
+            elif status.err:
+                raise TransactionError(f"Transaction error: {status.err}")
+        pending = still
+        if not pending:
+            break
+    return [str(sig) for sig in sigs]
@@ -4,6 +4,7 @@
 import argparse
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from toolkit import create_toolkit
 
@@ -79,13 +80,19 @@ def cmd_mint_nft(args):
 def cmd_dao_info(args):
     """Show DAO realm information."""
     tk = create_toolkit(keypair_path=args.keypair, network=args.network, realm=args.realm)
+    # The three reads are independent RPC round-trips; run them concurrently
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        info_f = ex.submit(tk.dao.get_realm_info)
+        records_f = ex.submit(tk.dao.get_token_owner_records)
+        proposals_f = ex.submit(tk.dao.get_proposals)
+
     print("=== Realm Info ===")
-    info = tk.dao.get_realm_info()
+    info = info_f.result()
     for k, v in info.items():
         print(f"  {k}: {v}")
 
     print("\n=== Token Owner Records ===")
-    records = tk.dao.get_token_owner_records()
+    records = records_f.result()
     if records:
         for r in records:
             print(f"  Owner: {r['governing_token_owner']}, Deposit: {r.get('governing_token_deposit_amount', '?')}")
@@ -93,7 +100,7 @@ def cmd_dao_info(args):
         print("  (none found)")
 
     print("\n=== Proposals ===")
-    proposals = tk.dao.get_proposals()
+    proposals = proposals_f.result()
     if proposals:
         for p in proposals:
             print(f"  [{p['state']}] {p.get('name', '(unnamed)')} — {p['pubkey'][:16]}...")
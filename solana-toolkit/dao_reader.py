@@ -1,9 +1,11 @@
 """Read-only DAO governance data from Solana Realms program."""
 
 import struct
+import time
 from typing import Dict, List, Any, Optional
 
 from solana.rpc.api import Client
+from solana.rpc.types import MemcmpOpts
 from solders.pubkey import Pubkey
 
 from wallet import SolanaWallet
@@ -14,19 +16,99 @@ GOVERNANCE_PROGRAM_ID = Pubkey.from_string("GovER5Lthms3bLBqWub97yVrMmEogzX7xNjd
 # Default DAO realm
 DEFAULT_REALM = "42sRg1Spzu3YxwXTduDFLWPtb4JJQhmMmDMbPPmnvoTY"
 
+_U32 = struct.Struct("<I")  # Borsh u32 (string / Vec length prefix)
+_U64 = struct.Struct("<Q")
+
+# Fixed Pubkey fields shared by Governance/Proposal/TokenOwnerRecord layouts
+_S_PARENT = slice(1, 33)   # realm (Governance, TokenOwnerRecord) or governance (Proposal)
+_S_MINT = slice(33, 65)    # governed account / governing_token_mint
+_S_OWNER = slice(65, 97)   # governing_token_owner
+_STATE_OFFSET = 65         # Proposal state (u8)
+
+_PROPOSAL_STATES = {
+    0: "Draft", 1: "SigningOff", 2: "Voting", 3: "Succeeded",
+    4: "Executing", 5: "Completed", 6: "Cancelled", 7: "Defeated",
+    8: "ExecutingWithErrors",
+}
+
+_B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def _account_type_filter(account_type: int) -> MemcmpOpts:
+    """memcmp filter on the account_type byte (a single byte < 58 is one base58 digit)."""
+    return MemcmpOpts(offset=0, bytes=_B58_ALPHABET[account_type])
+
 
 def _decode_string(data: bytes, offset: int) -> tuple:
     """Decode a Borsh string (u32 length prefix + utf-8 bytes). Returns (string, new_offset)."""
     if offset + 4 > len(data):
         return ("", offset)
-    length = struct.unpack_from("<I", data, offset)[0]
+    length = _U32.unpack_from(data, offset)[0]
     offset += 4
     if offset + length > len(data):
         return ("", offset)
-    s = data[offset:offset + length].decode("utf-8", errors="replace")
+    # Decode straight from a view of the buffer, without copying the slice first
+    s = str(memoryview(data)[offset:offset + length], "utf-8", "replace")
     return (s, offset + length)
 
 
+# Fall back to scanning for a plausible Borsh string when a proposal does
+# not fit the known layouts (e.g. a future program version)
+_NAME_SCAN_FALLBACK = True
+
+
+def _skip_option(data: bytes, offset: int, size: int) -> int:
+    """Skip a Borsh Option<T> of fixed-size T (1-byte tag, T only if Some)."""
+    return offset + 1 + (size if data[offset] else 0)
+
+
+def _proposal_name(data: bytes, acct_type: int) -> Optional[str]:
+    """
+    Decode a proposal's name by walking its Borsh layout (spl-governance v3
+    ProposalV2, or ProposalV1). Returns None if the data does not fit.
+    """
+    try:
+        # type, governance, governing_token_mint, state, token_owner_record,
+        # signatories_count, signatories_signed_off_count
+        offset = 100
+        if acct_type == 6:
+            # vote_type: SingleChoice | MultiChoice {choice_type, min/max options}
+            offset += 1 + (4 if data[offset] == 1 else 0)
+            # options: Vec<ProposalOption>
+            count = _U32.unpack_from(data, offset)[0]
+            offset += 4
+            for _ in range(count):
+                offset += 4 + _U32.unpack_from(data, offset)[0]  # label
+                offset += 8 + 1 + 2 + 2 + 2  # vote_weight, vote_result, transaction counters
+            offset = _skip_option(data, offset, 8)  # deny_vote_weight
+            offset += 1  # reserved1
+            offset = _skip_option(data, offset, 8)  # abstain_vote_weight
+            offset = _skip_option(data, offset, 8)  # start_voting_at
+        else:
+            offset += 8 + 8 + 2 + 2 + 2  # yes/no votes, instruction counters
+        offset += 8  # draft_at
+        # signing_off_at, voting_at, voting_at_slot, voting_completed_at, executing_at, closed_at
+        for _ in range(6):
+            offset = _skip_option(data, offset, 8)
+        offset += 1  # execution_flags
+        offset = _skip_option(data, offset, 8)  # max_vote_weight
+        if acct_type == 6:
+            offset = _skip_option(data, offset, 4)  # max_voting_time
+            # vote_threshold: Option<YesVotePercentage(u8) | QuorumPercentage(u8) | Disabled>
+            if data[offset]:
+                offset += 1 + (1 if data[offset + 1] in (0, 1) else 0)
+            offset += 1
+            offset += 64  # reserved
+        else:
+            offset = _skip_option(data, offset, 2)  # vote_threshold_percentage
+        if offset + 4 > len(data) or _U32.unpack_from(data, offset)[0] >= 200:
+            return None
+        name, _ = _decode_string(data, offset)
+    except (IndexError, struct.error):
+        return None
+    return name if name.isprintable() else None
+
+
 class DAOReader:
     """Query DAO realm information from the SPL Governance (Realms) program on Solana."""
 
@@ -41,6 +123,24 @@ class DAOReader:
         self.wallet = wallet or SolanaWallet()
         self.client = self.wallet.client
         self.realm_pubkey = Pubkey.from_string(realm)
+        self._pga_cache: Dict[tuple, tuple] = {}  # filters -> (monotonic fetch time, accounts)
+
+    def _program_accounts(self, *filters, ttl: float = 30.0) -> list:
+        """
+        Governance-program accounts matching the given RPC filters (dataSize
+        ints / MemcmpOpts), so the node only sends the accounts we decode.
+        Each filter set is cached for ttl seconds.
+        """
+        now = time.monotonic()
+        cached = self._pga_cache.get(filters)
+        if cached is None or now - cached[0] >= ttl:
+            resp = self.client.get_program_accounts(
+                GOVERNANCE_PROGRAM_ID,
+                encoding="base64",
+                filters=list(filters),
+            )
+            cached = self._pga_cache[filters] = (now, resp.value or [])
+        return cached[1]
 
     def get_realm_info(self) -> Dict[str, Any]:
         """
@@ -79,7 +179,7 @@ class DAOReader:
         result["account_type"] = account_type
 
         # Community mint
-        community_mint = Pubkey.from_bytes(data[1:33])
+        community_mint = Pubkey.from_bytes(data[_S_PARENT])
         result["community_mint"] = str(community_mint)
 
         # reserved
@@ -110,42 +210,24 @@ class DAOReader:
         Returns:
             List of dicts with pubkey, data_len, and decoded fields where possible.
         """
-        # Governance accounts have account_type = 2 at byte 0
-        # and realm pubkey at bytes 1..33
-        filters = [
-            {"memcmp": {"offset": 0, "bytes": "2"}},  # account_type = Governance (rough)
-        ]
-
         # Use getProgramAccounts with memcmp on realm
         # realm pubkey starts at offset 1 for Governance accounts
-        realm_b58 = str(self.realm_pubkey)
-
-        resp = self.client.get_program_accounts(
-            GOVERNANCE_PROGRAM_ID,
-            encoding="base64",
-            filters=[
-                {"dataSize": 108},  # Common governance account size (may vary)
-            ],
-        )
-
         accounts: List[Dict[str, Any]] = []
-        if resp.value:
-            for acct in resp.value:
-                data = bytes(acct.account.data)
-                # Check if realm matches at offset 1
-                if len(data) >= 33:
-                    acct_realm = Pubkey.from_bytes(data[1:33])
-                    if acct_realm == self.realm_pubkey:
-                        entry: Dict[str, Any] = {
-                            "pubkey": str(acct.pubkey),
-                            "data_len": len(data),
-                            "account_type": data[0] if data else None,
-                        }
-                        # Governed account at offset 33..65
-                        if len(data) >= 65:
-                            governed = Pubkey.from_bytes(data[33:65])
-                            entry["governed_account"] = str(governed)
-                        accounts.append(entry)
+        for acct in self._program_accounts(
+            108,  # dataSize: common governance account size (may vary)
+            MemcmpOpts(offset=1, bytes=str(self.realm_pubkey)),
+        ):
+            data = bytes(acct.account.data)
+            entry: Dict[str, Any] = {
+                "pubkey": str(acct.pubkey),
+                "data_len": len(data),
+                "account_type": data[0] if data else None,
+            }
+            # Governed account at offset 33..65
+            if len(data) >= 65:
+                governed = Pubkey.from_bytes(data[_S_MINT])
+                entry["governed_account"] = str(governed)
+            accounts.append(entry)
 
         return accounts
 
@@ -162,60 +244,42 @@ class DAOReader:
         # Proposal accounts: account_type = 6 (ProposalV2)
         # Layout: [0] type, [1..33] governance, [33..65] governing_token_mint,
         # [65] state(u8), ...then Borsh strings for name/description
-        resp = self.client.get_program_accounts(
-            GOVERNANCE_PROGRAM_ID,
-            encoding="base64",
-        )
+        # ProposalV1=5, ProposalV2=6 — one filtered call per account type
+        extra = (MemcmpOpts(offset=1, bytes=governance),) if governance else ()
+        accounts = [acct for acct_type in (5, 6)
+                    for acct in self._program_accounts(_account_type_filter(acct_type), *extra)]
 
         proposals: List[Dict[str, Any]] = []
-        if not resp.value:
-            return proposals
-
-        for acct in resp.value:
+        for acct in accounts:
             data = bytes(acct.account.data)
             if len(data) < 66:
                 continue
             acct_type = data[0]
-            # ProposalV1=5, ProposalV2=6
-            if acct_type not in (5, 6):
-                continue
 
-            prop_governance = Pubkey.from_bytes(data[1:33])
-
-            # Check governance belongs to our realm by filtering if governance param given
-            if governance and str(prop_governance) != governance:
-                continue
+            prop_governance = Pubkey.from_bytes(data[_S_PARENT])
 
-            governing_mint = Pubkey.from_bytes(data[33:65])
-            state = data[65]
-
-            state_names = {
-                0: "Draft", 1: "SigningOff", 2: "Voting", 3: "Succeeded",
-                4: "Executing", 5: "Completed", 6: "Cancelled", 7: "Defeated",
-                8: "ExecutingWithErrors",
-            }
+            governing_mint = Pubkey.from_bytes(data[_S_MINT])
+            state = data[_STATE_OFFSET]
 
             entry: Dict[str, Any] = {
                 "pubkey": str(acct.pubkey),
                 "governance": str(prop_governance),
                 "governing_token_mint": str(governing_mint),
-                "state": state_names.get(state, f"Unknown({state})"),
+                "state": _PROPOSAL_STATES.get(state, f"Unknown({state})"),
                 "state_code": state,
                 "version": "v2" if acct_type == 6 else "v1",
             }
 
-            # Try to decode name from remaining data
-            # After state byte, there are several fields before the name string
-            # This varies by version; try a best-effort parse
-            offset = 66
-            # Skip: signatory_count(u8), signatories_signed_off(u8), vote_type(?), ...
-            # For ProposalV2 the layout is complex; try to find the name heuristically
-            # by scanning for a reasonable Borsh string
-            for try_offset in range(66, min(200, len(data) - 4)):
-                name_candidate, end = _decode_string(data, try_offset)
-                if 3 < len(name_candidate) < 200 and name_candidate.isprintable():
-                    entry["name"] = name_candidate
-                    break
+            name = _proposal_name(data, acct_type)
+            if name is not None:
+                entry["name"] = name
+            elif _NAME_SCAN_FALLBACK:
+                # Unknown layout: scan for a plausible Borsh string
+                for try_offset in range(66, min(200, len(data) - 4)):
+                    name_candidate, end = _decode_string(data, try_offset)
+                    if 3 < len(name_candidate) < 200 and name_candidate.isprintable():
+                        entry["name"] = name_candidate
+                        break
 
             proposals.append(entry)
 
@@ -234,42 +298,31 @@ class DAOReader:
         # TokenOwnerRecord: account_type=4
         # [0] type(u8), [1..33] realm, [33..65] governing_token_mint,
         # [65..97] governing_token_owner
-        resp = self.client.get_program_accounts(
-            GOVERNANCE_PROGRAM_ID,
-            encoding="base64",
-        )
+        filters = [_account_type_filter(4), MemcmpOpts(offset=1, bytes=str(self.realm_pubkey))]
+        if governing_token_mint:
+            filters.append(MemcmpOpts(offset=33, bytes=governing_token_mint))
 
+        realm = str(self.realm_pubkey)
         records: List[Dict[str, Any]] = []
-        if not resp.value:
-            return records
-
-        for acct in resp.value:
+        for acct in self._program_accounts(*filters):
             data = bytes(acct.account.data)
             if len(data) < 97:
                 continue
-            if data[0] != 4:  # TokenOwnerRecord
-                continue
 
-            rec_realm = Pubkey.from_bytes(data[1:33])
-            if rec_realm != self.realm_pubkey:
-                continue
-
-            rec_mint = Pubkey.from_bytes(data[33:65])
-            if governing_token_mint and str(rec_mint) != governing_token_mint:
-                continue
+            rec_mint = Pubkey.from_bytes(data[_S_MINT])
 
-            rec_owner = Pubkey.from_bytes(data[65:97])
+            rec_owner = Pubkey.from_bytes(data[_S_OWNER])
 
             entry: Dict[str, Any] = {
                 "pubkey": str(acct.pubkey),
-                "realm": str(rec_realm),
+                "realm": realm,  # matched by the RPC filter
                 "governing_token_mint": str(rec_mint),
                 "governing_token_owner": str(rec_owner),
             }
 
             # Governing token deposit amount (u64) at offset 97
             if len(data) >= 105:
-                deposit = struct.unpack_from("<Q", data, 97)[0]
+                deposit = _U64.unpack_from(data, 97)[0]
                 entry["governing_token_deposit_amount"] = deposit
 
             records.append(entry)
@@ -7,7 +7,10 @@ Network: Solana DevNet
 Provides: list_protocol, buy_protocol, delist_protocol, get_all_listings
 """
 
+import functools
+import heapq
 import json
+import operator
 import struct
 import subprocess
 import base64
@@ -15,6 +18,19 @@ import base58
 from pathlib import Path
 from hashlib import sha256
 
+from solders.pubkey import Pubkey
+
+# Pooled keep-alive HTTPS for RPC calls, so repeat queries skip the TLS handshake
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    _SESSION = requests.Session()
+    _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    _SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+except ImportError:
+    _SESSION = None
+
 MARKETPLACE_PROGRAM_ID = "5wpGj4EG6J5uEqozLqUyHzEQbU26yjaL5aUE5FwBiYe5"
 TOKEN_2022_PROGRAM_ID = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
 SPL_TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
@@ -22,6 +38,14 @@ ASSOCIATED_TOKEN_PROGRAM_ID = "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"
 SYSTEM_PROGRAM_ID = "11111111111111111111111111111111"
 DEVNET_RPC = "https://api.devnet.solana.com"
 
+# Program ids decoded from base58 once, not on every PDA/ATA derivation
+_MARKETPLACE_PK = Pubkey.from_string(MARKETPLACE_PROGRAM_ID)
+_ATA_PROGRAM_PK = Pubkey.from_string(ASSOCIATED_TOKEN_PROGRAM_ID)
+_TOKEN_PROGRAM_BYTES = {
+    TOKEN_2022_PROGRAM_ID: bytes(Pubkey.from_string(TOKEN_2022_PROGRAM_ID)),
+    SPL_TOKEN_PROGRAM_ID: bytes(Pubkey.from_string(SPL_TOKEN_PROGRAM_ID)),
+}
+
 # Anchor discriminators (first 8 bytes of sha256("global:<method_name>"))
 def _discriminator(name: str) -> bytes:
     return sha256(f"global:{name}".encode()).digest()[:8]
@@ -32,6 +56,23 @@ DELIST_DISC = _discriminator("delist_protocol")
 
 # Listing account discriminator
 LISTING_DISC = sha256(b"account:Listing").digest()[:8]
+# ...base58-encoded once for the getProgramAccounts memcmp filter
+_LISTING_DISC_B58 = base58.b58encode(LISTING_DISC).decode()
+
+# Listing account: 8 disc + 32 seller + 32 nft_mint + 8 price + 8 created_at + 1 bump
+LISTING_SIZE = 89
+
+# Listing tail after disc + seller + nft_mint: price_res u64, created_at i64, bump u8
+_LISTING_TAIL = struct.Struct("<QqB")
+
+# field -> (offset, size, Struct; None for a Pubkey)
+_LISTING_FIELDS = {
+    "seller": (8, 32, None),
+    "nft_mint": (40, 32, None),
+    "price_res": (72, 8, struct.Struct("<Q")),
+    "created_at": (80, 8, struct.Struct("<q")),
+    "bump": (88, 1, struct.Struct("<B")),
+}
 
 
 def _run_cmd(args: list, timeout: int = 30) -> str:
@@ -42,65 +83,89 @@ def _run_cmd(args: list, timeout: int = 30) -> str:
     return result.stdout.strip()
 
 
-def _find_pda(seeds: list[bytes], program_id: str) -> tuple[str, int]:
-    """Find PDA using solana CLI. Returns (address, bump)."""
-    # Use Python to derive PDA
-    from solders.pubkey import Pubkey
-    program_pk = Pubkey.from_string(program_id)
+def _find_pda(seeds: list[bytes], program_pk: Pubkey = _MARKETPLACE_PK) -> tuple[str, int]:
+    """Find PDA. Returns (address, bump)."""
+    # Kept in solders: its bump search (sha256 + curve check) runs in Rust, which
+    # beats a hashlib loop with a reused prefix hasher, and libsodium's
+    # is_valid_point also rejects off-subgroup points Solana treats as on-curve.
+    # Repeat lookups are served by the lru_caches below.
     pda, bump = Pubkey.find_program_address(seeds, program_pk)
     return str(pda), bump
 
 
 def _get_ata(wallet: str, mint: str, token_program: str = TOKEN_2022_PROGRAM_ID) -> str:
     """Get associated token address."""
-    from solders.pubkey import Pubkey
-    wallet_pk = Pubkey.from_string(wallet)
-    mint_pk = Pubkey.from_string(mint)
-    token_prog_pk = Pubkey.from_string(token_program)
-    ata_prog_pk = Pubkey.from_string(ASSOCIATED_TOKEN_PROGRAM_ID)
-    
+    token_prog_bytes = _TOKEN_PROGRAM_BYTES.get(token_program)
+    if token_prog_bytes is None:
+        token_prog_bytes = bytes(Pubkey.from_string(token_program))
+
     ata, _ = Pubkey.find_program_address(
-        [bytes(wallet_pk), bytes(token_prog_pk), bytes(mint_pk)],
-        ata_prog_pk,
+        [bytes(Pubkey.from_string(wallet)), token_prog_bytes, bytes(Pubkey.from_string(mint))],
+        _ATA_PROGRAM_PK,
     )
     return str(ata)
 
 
+def _create_pda(seeds: list[bytes], bump: int, program_pk: Pubkey = _MARKETPLACE_PK) -> str:
+    """Derive a PDA from a known bump (one hash instead of a bump search)."""
+    return str(Pubkey.create_program_address([*seeds, bytes([bump])], program_pk))
+
+
+@functools.lru_cache(maxsize=1024)
 def get_escrow_authority(nft_mint: str) -> tuple[str, int]:
     """Get escrow PDA for a given NFT mint."""
-    from solders.pubkey import Pubkey
-    mint_pk = Pubkey.from_string(nft_mint)
-    return _find_pda([b"escrow", bytes(mint_pk)], MARKETPLACE_PROGRAM_ID)
+    return _find_pda([b"escrow", bytes(Pubkey.from_string(nft_mint))])
 
 
+@functools.lru_cache(maxsize=1024)
 def get_listing_address(nft_mint: str) -> tuple[str, int]:
     """Get listing PDA for a given NFT mint."""
-    from solders.pubkey import Pubkey
-    mint_pk = Pubkey.from_string(nft_mint)
-    return _find_pda([b"listing", bytes(mint_pk)], MARKETPLACE_PROGRAM_ID)
+    return _find_pda([b"listing", bytes(Pubkey.from_string(nft_mint))])
 
 
-def get_all_listings(rpc: str = DEVNET_RPC) -> list[dict]:
-    """Fetch all active listings from chain using getProgramAccounts."""
-    import requests
-    
-    # Filter by Listing account discriminator
+def escrow_authority_with_bump(nft_mint: str, bump: int) -> str:
+    """Get escrow PDA for a given NFT mint when its bump is already known."""
+    return _create_pda([b"escrow", bytes(Pubkey.from_string(nft_mint))], bump)
+
+
+def listing_address_with_bump(nft_mint: str, bump: int) -> str:
+    """Get listing PDA for a given NFT mint when its bump is already known
+    (e.g. the bump stored in the listing account)."""
+    return _create_pda([b"listing", bytes(Pubkey.from_string(nft_mint))], bump)
+
+
+def get_all_listings(rpc: str = DEVNET_RPC, fields: list[str] = None) -> list[dict]:
+    """Fetch all active listings from chain using getProgramAccounts.
+
+    fields: optional subset of _LISTING_FIELDS; only the byte range covering
+    them is requested (dataSlice), and only they are decoded.
+    """
+    if _SESSION is None:
+        raise RuntimeError("get_all_listings requires the requests package")
+
+    # Cheap size check first, then the Listing account discriminator
+    config = {
+        "encoding": "base64",
+        "filters": [
+            {"dataSize": LISTING_SIZE},
+            {"memcmp": {"offset": 0, "bytes": _LISTING_DISC_B58}},
+        ],
+    }
+    start, end = 0, LISTING_SIZE
+    if fields:
+        spans = [_LISTING_FIELDS[f] for f in fields]
+        start = min(off for off, _, _ in spans)
+        end = max(off + size for off, size, _ in spans)
+        config["dataSlice"] = {"offset": start, "length": end - start}
+
     payload = {
         "jsonrpc": "2.0",
         "id": 1,
         "method": "getProgramAccounts",
-        "params": [
-            MARKETPLACE_PROGRAM_ID,
-            {
-                "encoding": "base64",
-                "filters": [
-                    {"memcmp": {"offset": 0, "bytes": base58.b58encode(LISTING_DISC).decode()}},
-                ],
-            },
-        ],
+        "params": [MARKETPLACE_PROGRAM_ID, config],
     }
     
-    resp = requests.post(rpc, json=payload, timeout=15)
+    resp = _SESSION.post(rpc, json=payload, timeout=15)
     data = resp.json()
     
     if "error" in data:
@@ -109,16 +174,23 @@ def get_all_listings(rpc: str = DEVNET_RPC) -> list[dict]:
     listings = []
     for account in data.get("result", []):
         raw = base64.b64decode(account["account"]["data"][0])
+        if fields:
+            raw = bytes(start) + raw  # realign the slice to account offsets
+            if len(raw) < end:
+                continue
+            listing = {"listing_address": account["pubkey"]}
+            for f in fields:
+                off, size, st = _LISTING_FIELDS[f]
+                listing[f] = str(Pubkey.from_bytes(raw[off:off + size])) if st is None else st.unpack_from(raw, off)[0]
+            listings.append(listing)
+            continue
+
         # Parse: 8 disc + 32 seller + 32 nft_mint + 8 price + 8 created_at + 1 bump
-        if len(raw) < 89:
+        if len(raw) < LISTING_SIZE:
             continue
-        seller = base64.b58encode(raw[8:40]).decode()  # won't work, use solders
-        from solders.pubkey import Pubkey
         seller = str(Pubkey.from_bytes(raw[8:40]))
         nft_mint = str(Pubkey.from_bytes(raw[40:72]))
-        price_res = struct.unpack("<Q", raw[72:80])[0]
-        created_at = struct.unpack("<q", raw[80:88])[0]
-        bump = raw[88]
+        price_res, created_at, bump = _LISTING_TAIL.unpack_from(raw, 72)
         
         listings.append({
             "listing_address": account["pubkey"],
@@ -132,6 +204,11 @@ def get_all_listings(rpc: str = DEVNET_RPC) -> list[dict]:
     return listings
 
 
+def cheapest_listings(listings: list[dict], k: int) -> list[dict]:
+    """Return the k lowest-priced listings, cheapest first (O(n log k), no full sort)."""
+    return heapq.nsmallest(k, listings, key=operator.itemgetter("price_res"))
+
+
 if __name__ == "__main__":
     print(f"Marketplace Program: {MARKETPLACE_PROGRAM_ID}")
     print(f"List discriminator: {LIST_DISC.hex()}")
@@ -5,24 +5,91 @@ instruction encoding bugs). Metaplex metadata is handled separately.
 """
 
 import json
-import subprocess
-import re
 import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from solana.rpc.api import Client
 from solders.pubkey import Pubkey
 
-from wallet import SolanaWallet
-
+from token_manager import TokenManager
+from wallet import SolanaWallet, load_keypair
+from _spl_cli import (
+    TOKEN_2022_PROGRAM,
+    RE_ADDRESS as _RE_ADDRESS,
+    RE_CREATING_TOKEN as _RE_CREATING_TOKEN,
+    run_spl_token as _run_spl_token,
+)
+
+# Pooled keep-alive HTTPS for RPC calls (requests optional; urllib fallback)
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    _SESSION = requests.Session()
+    _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    _SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+except ImportError:
+    _SESSION = None
+
+
+# getMultipleAccounts accepts at most 100 pubkeys per request
+_MULTIPLE_ACCOUNTS_MAX = 100
+
+# Concurrent RPC requests per wallet check (keeps clear of public-node 429s)
+_RPC_CONCURRENCY = 10
+
+# mint -> (monotonic expiry, nft type or None) from on-chain tokenMetadata names
+_MINT_TYPE_CACHE: Dict[str, tuple] = {}
+_MINT_TYPE_TTL = 300
+
+# NFT registry locations, in lookup order (cwd/data is inserted after the third)
+_BASE_DIR = Path(__file__).resolve().parent
+_REGISTRY_PATHS = (
+    _BASE_DIR / "data" / "nft_registry.json",
+    _BASE_DIR.parent / "data" / "nft_registry.json",
+    _BASE_DIR.parent.parent / "dashboard-audit" / "data" / "nft_registry.json",
+    Path.home() / "resonantos-augmentor" / "data" / "nft_registry.json",
+)
+
+# On-chain metadata name fragments -> NFT type; earlier types take precedence
+_NAME_MAP = {
+    "identity": (
+        "augmentor identity",
+        "resonantos identity",
+    ),
+    "alpha_tester": (
+        "ai artisan — alpha tester",
+        "ai artisan - alpha tester",
+        "ai artisan — alpha",
+        "resonantos alpha tester",
+        "alpha tester",
+    ),
+    "symbiotic_license": (
+        "symbiotic license agreement",
+        "resonant commons license signatory",
+        "symbiotic license",
+    ),
+    "manifesto": (
+        "augmentatism manifesto signatory",
+        "augmentatism manifesto",
+    ),
+}
+# Flattened (needle, type) in precedence order
+_NAME_NEEDLES = tuple((c, t) for t, cands in _NAME_MAP.items() for c in cands)
 
-# Solana CLI path
-_SOLANA_BIN = Path.home() / ".local" / "share" / "solana" / "install" / "active_release" / "bin"
+# One-pass multi-needle matching when pyahocorasick is installed
+try:
+    import ahocorasick
 
-# Token-2022 program
-TOKEN_2022_PROGRAM = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+    _NAME_AUTOMATON = ahocorasick.Automaton()
+    for _rank, (_needle, _type) in enumerate(_NAME_NEEDLES):
+        _NAME_AUTOMATON.add_word(_needle, (_rank, _type))
+    _NAME_AUTOMATON.make_automaton()
+except ImportError:
+    _NAME_AUTOMATON = None
 
 # NFT type templates
 NFT_TYPES = {
@@ -65,32 +132,6 @@ NFT_TYPES = {
 }
 
 
-def _run_spl_token(*args: str, keypair_path: str = "~/.config/solana/id.json") -> str:
-    """Run an spl-token CLI command and return stdout.
-
-    Args:
-        *args: Arguments to pass to spl-token.
-        keypair_path: Path to the signing keypair.
-
-    Returns:
-        str: Command stdout.
-
-    Raises:
-        RuntimeError: If the command fails.
-    """
-    expanded = str(Path(keypair_path).expanduser())
-    cmd = [
-        str(_SOLANA_BIN / "spl-token"),
-        *args,
-        "--url", "devnet",
-        "--fee-payer", expanded,
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-    if result.returncode != 0:
-        raise RuntimeError(f"spl-token failed: {result.stderr.strip()}")
-    return result.stdout.strip()
-
-
 class NFTMinter:
     """Mint soulbound (non-transferable) NFTs on Solana devnet via Token-2022.
 
@@ -105,7 +146,10 @@ class NFTMinter:
         """
         self.wallet = wallet or SolanaWallet()
         self.client = self.wallet.client
+        # Resolved once; the client's endpoint never changes
+        self._rpc_endpoint = getattr(getattr(self.client, "_provider", None), "endpoint_uri", None) or "https://api.devnet.solana.com"
         self.keypair_path = str(Path("~/.config/solana/id.json").expanduser())
+        self._registry_cache: Optional[tuple] = None  # (path, mtime, registry)
 
     def mint_soulbound_nft(
         self,
@@ -159,10 +203,10 @@ class NFTMinter:
         )
 
         # Extract mint address from output
-        mint_match = re.search(r"Address:\s+(\S+)", output)
+        mint_match = _RE_ADDRESS.search(output)
         if not mint_match:
             # Try alternate format: "Creating token <address>"
-            mint_match = re.search(r"Creating token\s+(\S+)", output)
+            mint_match = _RE_CREATING_TOKEN.search(output)
         if not mint_match:
             raise RuntimeError(f"Could not parse mint address from: {output}")
         mint_address = mint_match.group(1)
@@ -182,31 +226,17 @@ class NFTMinter:
             import sys
             print(f"Warning: metadata initialization failed: {e}", file=sys.stderr)
 
-        # Step 2: Create ATA for recipient
-        create_output = _run_spl_token(
-            "create-account",
-            "--program-id", TOKEN_2022_PROGRAM,
-            "--owner", recipient,
+        # Step 2+3: Create the recipient's ATA and mint exactly 1 token, in
+        # one in-process transaction. spl-token signs as the default CLI
+        # keypair, so that keypair is the mint authority.
+        minted = TokenManager(self.wallet).mint_nft(
             mint_address,
-            keypair_path=payer,
-        )
-
-        # Extract ATA address
-        ata_match = re.search(r"Creating account\s+(\S+)", create_output)
-        ata_address = ata_match.group(1) if ata_match else "unknown"
-
-        # Step 3: Mint exactly 1 token
-        mint_output = _run_spl_token(
-            "mint",
-            "--program-id", TOKEN_2022_PROGRAM,
-            mint_address, "1",
-            ata_address,
-            keypair_path=payer,
+            recipient,
+            fee_payer=load_keypair(payer),
+            mint_authority=load_keypair(self.keypair_path),
         )
-
-        # Extract signature
-        sig_match = re.search(r"Signature:\s+(\S+)", mint_output)
-        mint_sig = sig_match.group(1) if sig_match else "unknown"
+        ata_address = minted["ata"]
+        mint_sig = minted["signature"]
 
         return {
             "mint": mint_address,
@@ -269,20 +299,22 @@ class NFTMinter:
         return self.mint_soulbound_nft(recipient, nft_type="manifesto", fee_payer_keypair=fee_payer_keypair)
 
     def _rpc_url(self) -> str:
-        provider = getattr(self.client, "_provider", None)
-        endpoint_uri = getattr(provider, "endpoint_uri", None)
-        return endpoint_uri or "https://api.devnet.solana.com"
+        return self._rpc_endpoint
 
     def _rpc_call(self, method: str, params: Optional[list] = None) -> Dict[str, Any]:
-        body = json.dumps({
+        payload = {
             "jsonrpc": "2.0",
             "id": 1,
             "method": method,
             "params": params or [],
-        }).encode()
+        }
+        if _SESSION is not None:
+            resp = _SESSION.post(self._rpc_url(), json=payload, timeout=10)
+            resp.raise_for_status()
+            return resp.json()
         req = urllib.request.Request(
             self._rpc_url(),
-            data=body,
+            data=json.dumps(payload).encode(),
             headers={"Content-Type": "application/json"},
         )
         with urllib.request.urlopen(req, timeout=10) as resp:
@@ -323,56 +355,61 @@ class NFTMinter:
         if not normalized:
             return None
 
-        name_map = {
-            "identity": [
-                "augmentor identity",
-                "resonantos identity",
-            ],
-            "alpha_tester": [
-                "ai artisan — alpha tester",
-                "ai artisan - alpha tester",
-                "ai artisan — alpha",
-                "resonantos alpha tester",
-                "alpha tester",
-            ],
-            "symbiotic_license": [
-                "symbiotic license agreement",
-                "resonant commons license signatory",
-                "symbiotic license",
-            ],
-            "manifesto": [
-                "augmentatism manifesto signatory",
-                "augmentatism manifesto",
-            ],
-        }
-        for nft_type, candidates in name_map.items():
-            for candidate in candidates:
-                if candidate in normalized:
-                    return nft_type
+        if _NAME_AUTOMATON is not None:
+            # Lowest _NAME_MAP position wins, as in the ordered scan below
+            best = None
+            for _, (rank, nft_type) in _NAME_AUTOMATON.iter(normalized):
+                if best is None or rank < best[0]:
+                    best = (rank, nft_type)
+            return best[1] if best else None
+        for candidate, nft_type in _NAME_NEEDLES:
+            if candidate in normalized:
+                return nft_type
         return None
 
     @staticmethod
-    def _registry_path_candidates() -> list[Path]:
-        base = Path(__file__).resolve().parent
-        return [
-            base / "data" / "nft_registry.json",
-            base.parent / "data" / "nft_registry.json",
-            base.parent.parent / "dashboard-audit" / "data" / "nft_registry.json",
-            Path.cwd() / "data" / "nft_registry.json",
-            Path.home() / "resonantos-augmentor" / "data" / "nft_registry.json",
-        ]
+    def _registry_path_candidates() -> tuple:
+        return _REGISTRY_PATHS[:3] + (Path.cwd() / "data" / "nft_registry.json",) + _REGISTRY_PATHS[3:]
 
     def _load_nft_registry(self) -> Dict[str, str]:
+        # Reuse the parsed registry while its file is unchanged
+        cached = self._registry_cache
+        if cached:
+            try:
+                if cached[0].stat().st_mtime == cached[1]:
+                    return cached[2]
+            except OSError:
+                pass
+            self._registry_cache = None
+
         for reg_path in self._registry_path_candidates():
             try:
                 if reg_path.exists():
+                    mtime = reg_path.stat().st_mtime
                     data = json.loads(reg_path.read_text())
                     if isinstance(data, dict):
-                        return {k: self._normalize_nft_type(v) for k, v in data.items()}
+                        registry = {k: self._normalize_nft_type(v) for k, v in data.items()}
+                        self._registry_cache = (reg_path, mtime, registry)
+                        return registry
             except Exception:
                 continue
         return {}
 
+    def _fetch_mint_types(self, mints: list) -> Dict[str, Optional[str]]:
+        """Classify up to 100 mints by on-chain metadata name in one getMultipleAccounts."""
+        try:
+            infos = self._rpc_call("getMultipleAccounts", [mints, {"encoding": "jsonParsed"}])
+            values = infos.get("result", {}).get("value") or []
+        except Exception:
+            values = []
+        types = {}
+        for mint, value in zip(mints, values):
+            if value is None:
+                continue
+            onchain_name = self._extract_onchain_name({"result": {"value": value}})
+            types[mint] = self._name_to_nft_type(onchain_name or "")
+        return types
+
     def check_wallet_has_nft(self, address: str, nft_type: str) -> Dict[str, Any]:
         """Check whether wallet/PDA already holds a specific NFT type.
 
@@ -388,6 +425,10 @@ class NFTMinter:
             {"encoding": "jsonParsed"},
         ])
 
+        # Mints to classify by on-chain metadata, in account order, up to the
+        # first registry match (which wins only if none of them match)
+        candidates = []
+        registry_hit = None
         accounts = result.get("result", {}).get("value", [])
         for account in accounts:
             parsed = account.get("account", {}).get("data", {}).get("parsed", {}).get("info", {})
@@ -405,15 +446,36 @@ class NFTMinter:
 
             reg_type = self._normalize_nft_type(registry.get(mint, ""))
             if reg_type and reg_type == target_type:
-                return {"has_nft": True, "mint": mint, "matched_by": "registry"}
-
-            try:
-                mint_info = self._rpc_call("getAccountInfo", [mint, {"encoding": "jsonParsed"}])
-                onchain_name = self._extract_onchain_name(mint_info)
-                onchain_type = self._name_to_nft_type(onchain_name or "")
-                if onchain_type == target_type:
-                    return {"has_nft": True, "mint": mint, "matched_by": "metadata"}
-            except Exception:
-                continue
+                registry_hit = mint
+                break
+            candidates.append(mint)
+
+        # One getMultipleAccounts per 100 mints instead of a getAccountInfo each,
+        # fetched concurrently; mints classified recently are answered from
+        # _MINT_TYPE_CACHE
+        now = time.monotonic()
+        types = {}
+        for mint in candidates:
+            cached = _MINT_TYPE_CACHE.get(mint)
+            if cached and cached[0] > now:
+                types[mint] = cached[1]
+        missing = [m for m in candidates if m not in types]
+        chunks = [missing[i:i + _MULTIPLE_ACCOUNTS_MAX] for i in range(0, len(missing), _MULTIPLE_ACCOUNTS_MAX)]
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), _RPC_CONCURRENCY)) as ex:
+                fetched = list(ex.map(self._fetch_mint_types, chunks))
+        else:
+            fetched = [self._fetch_mint_types(chunk) for chunk in chunks]
+        for chunk_types in fetched:
+            for mint, mint_type in chunk_types.items():
+                types[mint] = mint_type
+                _MINT_TYPE_CACHE[mint] = (now + _MINT_TYPE_TTL, mint_type)
+
+        for mint in candidates:
+            if mint in types and types[mint] == target_type:
+                return {"has_nft": True, "mint": mint, "matched_by": "metadata"}
+
+        if registry_hit:
+            return {"has_nft": True, "mint": registry_hit, "matched_by": "registry"}
 
         return {"has_nft": False, "mint": None, "matched_by": None}
@@ -6,23 +6,24 @@ traded, sold, or gifted between wallets. Still uses Token-2022 with
 """
 
 import json
-import subprocess
-import re
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from solana.rpc.api import Client
 from solders.pubkey import Pubkey
+from spl.token.constants import TOKEN_2022_PROGRAM_ID
+from spl.token.instructions import get_associated_token_address
 
-from wallet import SolanaWallet
+from token_manager import TokenManager
+from wallet import SolanaWallet, load_keypair
+from _spl_cli import (
+    TOKEN_2022_PROGRAM,
+    RE_ADDRESS as _RE_ADDRESS,
+    RE_CREATING_TOKEN as _RE_CREATING_TOKEN,
+    run_spl_token as _run_spl_token,
+)
 
 
-# Solana CLI path
-_SOLANA_BIN = Path.home() / ".local" / "share" / "solana" / "install" / "active_release" / "bin"
-
-# Token-2022 program
-TOKEN_2022_PROGRAM = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
-
 # Protocol NFT definitions
 PROTOCOL_NFTS = {
     "blindspot": {
@@ -44,32 +45,6 @@ PROTOCOL_NFTS = {
 }
 
 
-def _run_spl_token(*args: str, keypair_path: str = "~/.config/solana/id.json") -> str:
-    """Run an spl-token CLI command and return stdout.
-
-    Args:
-        *args: Arguments to pass to spl-token.
-        keypair_path: Path to the signing keypair.
-
-    Returns:
-        str: Command stdout.
-
-    Raises:
-        RuntimeError: If the command fails.
-    """
-    expanded = str(Path(keypair_path).expanduser())
-    cmd = [
-        str(_SOLANA_BIN / "spl-token"),
-        *args,
-        "--url", "devnet",
-        "--fee-payer", expanded,
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-    if result.returncode != 0:
-        raise RuntimeError(f"spl-token failed: {result.stderr.strip()}")
-    return result.stdout.strip()
-
-
 class ProtocolNFTMinter:
     """Mint transferable protocol NFTs on Solana devnet via Token-2022."""
 
@@ -88,8 +63,8 @@ class ProtocolNFTMinter:
 
         Steps:
         1. Create Token-2022 mint (0 decimals, NO non-transferable flag)
-        2. Create associated token account for recipient
-        3. Mint exactly 1 token
+        2. Create associated token account for recipient and mint exactly
+           1 token (one transaction, built in-process)
 
         Args:
             recipient: Recipient wallet address (base58).
@@ -119,36 +94,24 @@ class ProtocolNFTMinter:
         )
 
         # Extract mint address
-        mint_match = re.search(r"Address:\s+(\S+)", output)
+        mint_match = _RE_ADDRESS.search(output)
         if not mint_match:
-            mint_match = re.search(r"Creating token\s+(\S+)", output)
+            mint_match = _RE_CREATING_TOKEN.search(output)
         if not mint_match:
             raise RuntimeError(f"Could not parse mint address from: {output}")
         mint_address = mint_match.group(1)
 
-        # Step 2: Create ATA for recipient
-        create_output = _run_spl_token(
-            "create-account",
-            "--program-id", TOKEN_2022_PROGRAM,
-            "--owner", recipient,
+        # Step 2+3: Create the recipient's ATA and mint exactly 1 token, in
+        # one in-process transaction. spl-token signs as the default CLI
+        # keypair, so that keypair is the mint authority.
+        minted = TokenManager(self.wallet).mint_nft(
             mint_address,
-            keypair_path=payer,
+            recipient,
+            fee_payer=load_keypair(payer),
+            mint_authority=load_keypair(self.keypair_path),
         )
-
-        ata_match = re.search(r"Creating account\s+(\S+)", create_output)
-        ata_address = ata_match.group(1) if ata_match else "unknown"
-
-        # Step 3: Mint exactly 1 token
-        mint_output = _run_spl_token(
-            "mint",
-            "--program-id", TOKEN_2022_PROGRAM,
-            mint_address, "1",
-            ata_address,
-            keypair_path=payer,
-        )
-
-        sig_match = re.search(r"Signature:\s+(\S+)", mint_output)
-        mint_sig = sig_match.group(1) if sig_match else "unknown"
+        ata_address = minted["ata"]
+        mint_sig = minted["signature"]
 
         return {
             "mint": mint_address,
@@ -164,6 +127,60 @@ class ProtocolNFTMinter:
             "transferable": True,
         }
 
+    def mint_protocol_nfts_batch(
+        self,
+        recipients: list[str],
+        protocol_id: str,
+        fee_payer_keypair: Optional[str] = None,
+    ) -> list[Dict[str, Any]]:
+        """Mint one transferable protocol NFT to each recipient.
+
+        Mint creation, ATA creation and minting are built in-process, one
+        transaction per recipient, and submitted in a single JSON-RPC batch
+        instead of running mint_protocol_nft once per recipient.
+
+        Args:
+            recipients: Recipient wallet addresses (base58).
+            protocol_id: Key from PROTOCOL_NFTS dict.
+            fee_payer_keypair: Optional path to fee payer keypair.
+
+        Returns:
+            List of result dicts in recipient order, shaped like
+            mint_protocol_nft's, plus an "error" field (None on success).
+
+        Raises:
+            ValueError: If protocol_id is unknown.
+        """
+        if protocol_id not in PROTOCOL_NFTS:
+            raise ValueError(f"Unknown protocol: {protocol_id}. Options: {list(PROTOCOL_NFTS.keys())}")
+
+        template = PROTOCOL_NFTS[protocol_id]
+        payer = fee_payer_keypair or self.keypair_path
+
+        # The default CLI keypair stays mint authority, as with spl-token create-token
+        minted = TokenManager(self.wallet).mint_nfts_batch(
+            recipients,
+            fee_payer=load_keypair(payer),
+            mint_authority=load_keypair(self.keypair_path),
+        )
+        return [
+            {
+                "mint": m["mint"],
+                "ata": m["ata"],
+                "recipient": m["owner"],
+                "protocol_id": protocol_id,
+                "name": template["name"],
+                "symbol": template["symbol"],
+                "uri": template["uri"],
+                "price_res": template["price_res"],
+                "mint_signature": m["signature"],
+                "soulbound": False,
+                "transferable": True,
+                "error": m["error"],
+            }
+            for m in minted
+        ]
+
     def check_ownership(self, wallet_address: str, mint_address: str) -> bool:
         """Check if a wallet holds a specific protocol NFT.
 
@@ -174,18 +191,17 @@ class ProtocolNFTMinter:
         Returns:
             True if the wallet holds at least 1 token of this mint.
         """
+        # One getTokenAccountBalance on the ATA instead of an spl-token subprocess
         try:
-            output = _run_spl_token(
-                "balance",
-                "--program-id", TOKEN_2022_PROGRAM,
-                "--owner", wallet_address,
-                mint_address,
-                keypair_path=self.keypair_path,
+            ata = get_associated_token_address(
+                Pubkey.from_string(wallet_address),
+                Pubkey.from_string(mint_address),
+                TOKEN_2022_PROGRAM_ID,
             )
-            # Output is just the balance number, e.g. "1"
-            balance = float(output.strip())
-            return balance >= 1
-        except (RuntimeError, ValueError):
+            resp = self.client.get_token_account_balance(ata)
+            return int(resp.value.amount) >= 1
+        except Exception:
+            # Missing ATA (account not found) or malformed address
             return False
 
     def list_protocol_nfts(self) -> Dict[str, Dict[str, Any]]:
@@ -6,27 +6,24 @@ initialize pairs, daily claims, freeze/unfreeze, rotate AI key, co-sign actions.
 Uses solana-py + solders only (no Anchor Python SDK needed).
 """
 
-import json
+import functools
 import struct
 import hashlib
-from pathlib import Path
 from typing import Optional, Dict, Any
 
-from solana.rpc.api import Client
-from solana.rpc.types import TxOpts
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.instruction import Instruction, AccountMeta
-from solders.transaction import Transaction
-from solders.message import Message
 from solders.system_program import ID as SYSTEM_PROGRAM_ID
-import time
+
+from _tx import TransactionSender, build_tx, send_many_and_confirm
+from wallet import load_keypair, rpc_client
 
 
 # Anchor discriminators: sha256("global:<instruction_name>")[:8]
 def _discriminator(name: str) -> bytes:
     """Compute Anchor instruction discriminator."""
-    return hashlib.sha256(f"global:{name}".encode()).digest()[:8]
+    return hashlib.sha256(b"global:" + name.encode()).digest()[:8]
 
 
 DISC_INITIALIZE_PAIR = _discriminator("initialize_pair")
@@ -35,9 +32,40 @@ DISC_EMERGENCY_FREEZE = _discriminator("emergency_freeze")
 DISC_UNFREEZE = _discriminator("unfreeze")
 DISC_ROTATE_AI_KEY = _discriminator("rotate_ai_key")
 DISC_CO_SIGN_ACTION = _discriminator("co_sign_action")
+DISC_TRANSFER_OUT = _discriminator("transfer_out")
+
+# Instruction data layouts: Borsh string length prefix, discriminator + u8,
+# discriminator + u64
+_U32 = struct.Struct("<I")
+_DISC_U8 = struct.Struct("<8sB")
+_DISC_U64 = struct.Struct("<8sQ")
+
+# Serialized transaction size limit, and the fixed cost of a co-sign tx:
+# 2 signatures, header, 4 account keys (pair, human, ai, program), blockhash,
+# plus per instruction: program index, 3 account indices, compact lengths
+_TX_SIZE_LIMIT = 1232
+_CO_SIGN_TX_BASE = 1 + 2 * 64 + 3 + 1 + 4 * 32 + 32 + 1
+_CO_SIGN_IX_BASE = 1 + 1 + 3 + 2
+
+# Pair account after the discriminator: human, ai, pair_nonce, bump, frozen,
+# last_claim i64, created_at i64, ai_rotations u16
+_PAIR_STRUCT = struct.Struct("<32s32sBBBqqH")
+
+
+_PAIR_SEED = b"symbiotic"
+
+
+@functools.lru_cache(maxsize=1024)
+def _find_pair_pda(human: bytes, pair_nonce: int, program_id: Pubkey) -> tuple[Pubkey, int]:
+    return Pubkey.find_program_address([_PAIR_SEED, human, bytes([pair_nonce])], program_id)
+
 
+@functools.lru_cache(maxsize=256)
+def _pubkey_str(raw: bytes) -> str:
+    return str(Pubkey.from_bytes(raw))
 
-class SymbioticClient:
+
+class SymbioticClient(TransactionSender):
     """Client for the Symbiotic Wallet program."""
 
     def __init__(
@@ -56,17 +84,14 @@ class SymbioticClient:
         """
         self.program_id = Pubkey.from_string(program_id)
 
-        expanded = Path(keypair_path).expanduser()
-        with open(expanded, "r") as f:
-            secret = json.load(f)
-        self.keypair = Keypair.from_bytes(bytes(secret))
+        self.keypair = load_keypair(keypair_path)
 
         rpcs = {
             "devnet": "https://api.devnet.solana.com",
             "testnet": "https://api.testnet.solana.com",
             "mainnet-beta": "https://api.mainnet-beta.com",
         }
-        self.client = Client(rpcs.get(network, network))
+        self.client = rpc_client(rpcs.get(network, network))
         self.network = network
 
     def find_pair_pda(self, human: Pubkey, pair_nonce: int) -> tuple[Pubkey, int]:
@@ -75,31 +100,20 @@ class SymbioticClient:
         Returns:
             (pda_pubkey, bump)
         """
-        seeds = [b"symbiotic", bytes(human), bytes([pair_nonce])]
-        return Pubkey.find_program_address(seeds, self.program_id)
-
-    def _send_tx(self, ixs: list[Instruction], signers: list[Keypair]) -> str:
-        """Build, sign, send transaction. Returns signature."""
-        blockhash_resp = self.client.get_latest_blockhash()
-        blockhash = blockhash_resp.value.blockhash
-        msg = Message.new_with_blockhash(ixs, signers[0].pubkey(), blockhash)
-        tx = Transaction.new_unsigned(msg)
-        tx.sign(signers, blockhash)
-        resp = self.client.send_transaction(
-            tx, opts=TxOpts(skip_preflight=True, preflight_commitment="confirmed")
-        )
-        sig = resp.value
-        if sig is None:
-            raise Exception(f"Transaction failed: {resp}")
-        # Poll for confirmation
-        for _ in range(30):
-            status = self.client.get_signature_statuses([sig])
-            if status.value and status.value[0] is not None:
-                if status.value[0].err:
-                    raise Exception(f"Transaction error: {status.value[0].err}")
-                return str(sig)
-            time.sleep(1)
-        return str(sig)
+        return _find_pair_pda(bytes(human), pair_nonce, self.program_id)
+
+    def send_many(self, batch: list[tuple[list[Instruction], list[Keypair]]]) -> list[str]:
+        """Send independent transactions without waiting on each one.
+
+        Args:
+            batch: (instructions, signers) per transaction; the first signer pays.
+
+        Returns:
+            Signatures in batch order, once all are confirmed.
+        """
+        blockhash = self._blockhash()
+        txs = [build_tx(ixs, signers, blockhash) for ixs, signers in batch]
+        return send_many_and_confirm(self.client, txs)
 
     def initialize_pair(
         self,
@@ -119,7 +133,7 @@ class SymbioticClient:
         """
         pda, bump = self.find_pair_pda(human_keypair.pubkey(), pair_nonce)
 
-        data = DISC_INITIALIZE_PAIR + struct.pack("<B", pair_nonce)
+        data = _DISC_U8.pack(DISC_INITIALIZE_PAIR, pair_nonce)
 
         accounts = [
             AccountMeta(pubkey=pda, is_signer=False, is_writable=True),
@@ -135,8 +149,6 @@ class SymbioticClient:
 
     def daily_claim(self, signer_keypair: Keypair, pair_pda: Pubkey) -> str:
         """Trigger daily claim. Signer must be human or AI of the pair."""
-        pair_data = self._fetch_pair(pair_pda)
-
         data = DISC_DAILY_CLAIM
         accounts = [
             AccountMeta(pubkey=pair_pda, is_signer=False, is_writable=True),
@@ -187,24 +199,64 @@ class SymbioticClient:
         memo: str = "",
     ) -> str:
         """Co-signed action requiring both human and AI signatures."""
-        # Borsh: discriminator + string(action_type) + string(memo)
+        ix = self._co_sign_ix(human_keypair, ai_keypair, pair_pda, action_type, memo)
+        return self._send_tx([ix], [human_keypair, ai_keypair])
+
+    def co_sign_action_batch(
+        self,
+        human_keypair: Keypair,
+        ai_keypair: Keypair,
+        pair_pda: Pubkey,
+        actions: list[tuple[str, str]],
+    ) -> list[str]:
+        """Co-sign many (action_type, memo) actions, packed into as few
+        transactions as the 1232-byte limit allows.
+
+        Returns:
+            One signature per transaction sent.
+        """
+        batch = []
+        ixs: list[Instruction] = []
+        size = _CO_SIGN_TX_BASE
+        for action_type, memo in actions:
+            ix = self._co_sign_ix(human_keypair, ai_keypair, pair_pda, action_type, memo)
+            ix_size = _CO_SIGN_IX_BASE + len(ix.data)
+            if ixs and size + ix_size > _TX_SIZE_LIMIT:
+                batch.append((ixs, [human_keypair, ai_keypair]))
+                ixs, size = [], _CO_SIGN_TX_BASE
+            ixs.append(ix)
+            size += ix_size
+        if ixs:
+            batch.append((ixs, [human_keypair, ai_keypair]))
+        return self.send_many(batch)
+
+    def _co_sign_ix(
+        self,
+        human_keypair: Keypair,
+        ai_keypair: Keypair,
+        pair_pda: Pubkey,
+        action_type: str,
+        memo: str,
+    ) -> Instruction:
+        # Borsh: discriminator + string(action_type) + string(memo), written
+        # into one preallocated buffer
         action_bytes = action_type.encode("utf-8")
         memo_bytes = memo.encode("utf-8")
-        data = (
-            DISC_CO_SIGN_ACTION
-            + struct.pack("<I", len(action_bytes))
-            + action_bytes
-            + struct.pack("<I", len(memo_bytes))
-            + memo_bytes
-        )
+        n = len(action_bytes)
+        buf = bytearray(16 + n + len(memo_bytes))
+        buf[0:8] = DISC_CO_SIGN_ACTION
+        _U32.pack_into(buf, 8, n)
+        buf[12:12 + n] = action_bytes
+        _U32.pack_into(buf, 12 + n, len(memo_bytes))
+        buf[16 + n:] = memo_bytes
+        data = bytes(buf)
 
         accounts = [
             AccountMeta(pubkey=pair_pda, is_signer=False, is_writable=False),
             AccountMeta(pubkey=human_keypair.pubkey(), is_signer=True, is_writable=False),
             AccountMeta(pubkey=ai_keypair.pubkey(), is_signer=True, is_writable=False),
         ]
-        ix = Instruction(self.program_id, data, accounts)
-        return self._send_tx([ix], [human_keypair, ai_keypair])
+        return Instruction(self.program_id, data, accounts)
 
     def transfer_out(
         self,
@@ -234,7 +286,7 @@ class SymbioticClient:
         Returns:
             Transaction signature string.
         """
-        data = _discriminator("transfer_out") + struct.pack("<Q", amount)
+        data = _DISC_U64.pack(DISC_TRANSFER_OUT, amount)
 
         accounts = [
             AccountMeta(pubkey=pair_pda, is_signer=False, is_writable=False),
@@ -257,16 +309,16 @@ class SymbioticClient:
         if len(raw) < 93:
             return None
         # Skip 8-byte discriminator
-        d = raw[8:]
+        human, ai, pair_nonce, bump, frozen, last_claim, created_at, ai_rotations = _PAIR_STRUCT.unpack_from(raw, 8)
         return {
-            "human": str(Pubkey.from_bytes(d[0:32])),
-            "ai": str(Pubkey.from_bytes(d[32:64])),
-            "pair_nonce": d[64],
-            "bump": d[65],
-            "frozen": bool(d[66]),
-            "last_claim": struct.unpack("<q", d[67:75])[0],
-            "created_at": struct.unpack("<q", d[75:83])[0],
-            "ai_rotations": struct.unpack("<H", d[83:85])[0],
+            "human": _pubkey_str(human),
+            "ai": _pubkey_str(ai),
+            "pair_nonce": pair_nonce,
+            "bump": bump,
+            "frozen": bool(frozen),
+            "last_claim": last_claim,
+            "created_at": created_at,
+            "ai_rotations": ai_rotations,
         }
 
     def get_pair_info(self, human: Pubkey, pair_nonce: int = 0) -> Optional[Dict]:
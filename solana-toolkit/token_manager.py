@@ -1,18 +1,21 @@
 """Token management for SPL and Token-2022 tokens on Solana."""
 
+import base64
+import functools
+import json
 import struct
 import time
-from pathlib import Path
+import urllib.request
 from typing import Dict, List, Optional, Any
 
 from solana.rpc.api import Client
-from solana.rpc.types import TokenAccountOpts, TxOpts
+from solana.rpc.types import TokenAccountOpts
 from solders.keypair import Keypair
+from solders.hash import Hash
 from solders.pubkey import Pubkey
-from solders.system_program import CreateAccountParams, create_account
+from solders.signature import Signature
+from solders.system_program import ID as SYSTEM_PROGRAM_ID, CreateAccountParams, create_account
 from solders.instruction import Instruction, AccountMeta
-from solders.transaction import Transaction
-from solders.message import Message
 
 from spl.token.constants import TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID, ASSOCIATED_TOKEN_PROGRAM_ID
 from spl.token.instructions import (
@@ -21,20 +24,39 @@ from spl.token.instructions import (
     get_associated_token_address,
 )
 
+from _tx import TransactionSender, build_tx, poll_delays
 from wallet import SolanaWallet
 
 
 # Token-2022 extension type IDs
-_EXT_NON_TRANSFERABLE = 17  # NonTransferable extension
+_EXT_NON_TRANSFERABLE = 9  # NonTransferable extension
+
+# Mint account size without extensions
+_MINT_SIZE = 82
+
+# Mint with the NonTransferable extension: base padded to 165 + account type
+# byte + one empty TLV entry (2-byte type, 2-byte length)
+_NON_TRANSFERABLE_MINT_SIZE = 165 + 1 + 4
+
+# Rent parameters effectively never change; refresh hourly anyway
+_RENT_TTL = 3600
+
+# Recipients per mint_tokens_bulk transaction: create-ATA + mint_to for 10
+# recipients stays under the 1232-byte transaction limit
+_MINT_BULK_CHUNK = 10
+
+
+# Parsed pubkeys for repeat mints/recipients (base58 decode + validation)
+_pubkey = functools.lru_cache(maxsize=1024)(Pubkey.from_string)
 
 
 def _initialize_non_transferable_mint_ix(mint: Pubkey) -> Instruction:
     """Build the InitializeNonTransferableMint instruction for Token-2022.
 
-    Instruction index 35 (0x23) with no additional data.
+    Instruction index 32 (0x20) with no additional data.
     Must be called BEFORE InitializeMint.
     """
-    data = struct.pack("<B", 35)  # instruction discriminator
+    data = struct.pack("<B", 32)  # instruction discriminator
     accounts = [AccountMeta(pubkey=mint, is_signer=False, is_writable=True)]
     return Instruction(TOKEN_2022_PROGRAM_ID, data, accounts)
 
@@ -44,23 +66,31 @@ def _create_ata_ix(
     owner: Pubkey,
     mint: Pubkey,
     token_program_id: Pubkey = TOKEN_PROGRAM_ID,
+    idempotent: bool = False,
 ) -> Instruction:
-    """Build a CreateAssociatedTokenAccount instruction (works for both SPL and Token-2022)."""
+    """Build a CreateAssociatedTokenAccount instruction (works for both SPL and Token-2022).
+
+    With idempotent=True it is CreateIdempotent (instruction 1), which
+    succeeds as a no-op when the ATA already exists.
+    """
     ata = get_associated_token_address(owner, mint, token_program_id)
     keys = [
         AccountMeta(pubkey=payer, is_signer=True, is_writable=True),
         AccountMeta(pubkey=ata, is_signer=False, is_writable=True),
         AccountMeta(pubkey=owner, is_signer=False, is_writable=False),
         AccountMeta(pubkey=mint, is_signer=False, is_writable=False),
-        AccountMeta(pubkey=Pubkey.from_string("11111111111111111111111111111111"), is_signer=False, is_writable=False),
+        AccountMeta(pubkey=SYSTEM_PROGRAM_ID, is_signer=False, is_writable=False),
         AccountMeta(pubkey=token_program_id, is_signer=False, is_writable=False),
     ]
-    return Instruction(ASSOCIATED_TOKEN_PROGRAM_ID, bytes(), keys)
+    return Instruction(ASSOCIATED_TOKEN_PROGRAM_ID, bytes([1]) if idempotent else bytes(), keys)
 
 
-class TokenManager:
+class TokenManager(TransactionSender):
     """Manage SPL and Token-2022 token creation, minting, and balance queries."""
 
+    # (network, account size) -> (monotonic fetch time, rent-exempt lamports)
+    _rent_cache: Dict[tuple, tuple] = {}
+
     def __init__(self, wallet: Optional[SolanaWallet] = None):
         """
         Initialize TokenManager.
@@ -71,34 +101,43 @@ class TokenManager:
         self.wallet = wallet or SolanaWallet()
         self.client = self.wallet.client
         self.payer = self.wallet.keypair
-
-    def _send_tx(self, ixs: List[Instruction], signers: List[Keypair]) -> str:
-        """Build, sign and send a transaction. Returns signature string."""
-        blockhash_resp = self.client.get_latest_blockhash()
-        blockhash = blockhash_resp.value.blockhash
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), blockhash)
-        tx = Transaction.new_unsigned(msg)
-        tx.sign(signers, blockhash)
-        resp = self.client.send_transaction(tx, opts=TxOpts(skip_preflight=True, preflight_commitment="confirmed"))
-        sig = resp.value
-        if sig is None:
-            raise Exception(f"Transaction failed: {resp}")
-        # Wait for confirmation
-        for _ in range(30):
-            status = self.client.get_signature_statuses([sig])
-            if status.value and status.value[0] is not None:
-                if status.value[0].err:
-                    raise Exception(f"Transaction error: {status.value[0].err}")
-                return str(sig)
-            time.sleep(1)
-        return str(sig)
-
-    def create_spl_token(self, decimals: int = 6) -> str:
+        # ATAs known to exist (created or minted into by this manager)
+        self._existing_atas: set = set()
+
+    def _rent_exempt(self, size: int) -> int:
+        """Rent-exempt minimum in lamports for an account of `size` bytes (cached per network)."""
+        key = (self.wallet.network, size)
+        cached = TokenManager._rent_cache.get(key)
+        now = time.monotonic()
+        if cached and now - cached[0] < _RENT_TTL:
+            return cached[1]
+        lamports = self.client.get_minimum_balance_for_rent_exemption(size).value
+        TokenManager._rent_cache[key] = (now, lamports)
+        return lamports
+
+    def _rpc_batch(self, bodies: List[Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+        """POST JSON-RPC requests as one batch array. Returns replies keyed by request id."""
+        provider = getattr(self.client, "_provider", None)
+        url = getattr(provider, "endpoint_uri", None) or "https://api.devnet.solana.com"
+        req = urllib.request.Request(
+            url,
+            data=json.dumps(bodies).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            replies = json.loads(resp.read())
+        if isinstance(replies, dict):  # whole batch rejected
+            raise Exception(f"Batch request failed: {replies.get('error')}")
+        # Batch replies may come back in any order
+        return {r.get("id"): r for r in replies}
+
+    def create_spl_token(self, decimals: int = 6, blockhash: Optional[Hash] = None) -> str:
         """
         Create a new standard SPL token mint.
 
         Args:
             decimals: Number of decimal places for the token.
+            blockhash: Recent blockhash to reuse instead of fetching one.
 
         Returns:
             str: The mint public key as base58 string.
@@ -106,9 +145,8 @@ class TokenManager:
         mint_keypair = Keypair()
         mint_pubkey = mint_keypair.pubkey()
 
-        # Get minimum rent for Mint account (82 bytes)
-        rent = self.client.get_minimum_balance_for_rent_exemption(82)
-        lamports = rent.value
+        # Minimum rent for Mint account (82 bytes)
+        lamports = self._rent_exempt(_MINT_SIZE)
 
         create_ix = create_account(CreateAccountParams(
             from_pubkey=self.payer.pubkey(),
@@ -126,50 +164,51 @@ class TokenManager:
             freeze_authority=self.payer.pubkey(),
         ))
 
-        sig = self._send_tx([create_ix, init_ix], [self.payer, mint_keypair])
+        sig = self._send_tx([create_ix, init_ix], [self.payer, mint_keypair], blockhash=blockhash)
         print(f"Created SPL token mint: {mint_pubkey} (tx: {sig})")
         return str(mint_pubkey)
 
-    def create_token2022_non_transferable(self, decimals: int = 9) -> str:
+    def create_token2022_non_transferable(self, decimals: int = 9, blockhash: Optional[Hash] = None) -> str:
         """
         Create a Token-2022 mint with NonTransferable extension (soulbound).
 
-        Uses the spl-token CLI for correctness — the canonical implementation
-        for Token-2022 extension instructions. Security-first approach.
+        One transaction: create the account sized for the extension,
+        InitializeNonTransferableMint, then InitializeMint. Like spl-token
+        create-token, the payer is mint authority and there is no freeze
+        authority.
 
         Args:
             decimals: Number of decimal places.
+            blockhash: Recent blockhash to reuse instead of fetching one.
 
         Returns:
             str: The mint public key as base58 string.
-
-        Raises:
-            Exception: If spl-token CLI is not available or creation fails.
         """
-        import subprocess
-        import re
-
-        solana_bin = str(Path.home() / ".local/share/solana/install/active_release/bin/spl-token")
-        result = subprocess.run(
-            [
-                solana_bin, "create-token",
-                "--program-id", str(TOKEN_2022_PROGRAM_ID),
-                "--decimals", str(decimals),
-                "--enable-non-transferable",
-            ],
-            capture_output=True, text=True, timeout=30,
-        )
-        if result.returncode != 0:
-            raise Exception(f"spl-token create-token failed: {result.stderr}")
+        mint_keypair = Keypair()
+        mint_pubkey = mint_keypair.pubkey()
+
+        create_ix = create_account(CreateAccountParams(
+            from_pubkey=self.payer.pubkey(),
+            to_pubkey=mint_pubkey,
+            lamports=self._rent_exempt(_NON_TRANSFERABLE_MINT_SIZE),
+            space=_NON_TRANSFERABLE_MINT_SIZE,
+            owner=TOKEN_2022_PROGRAM_ID,
+        ))
 
-        # Parse mint address from output: "Address:  <pubkey>"
-        match = re.search(r"Address:\s+(\S+)", result.stdout)
-        if not match:
-            raise Exception(f"Could not parse mint address from: {result.stdout}")
+        init_ix = initialize_mint(InitializeMintParams(
+            program_id=TOKEN_2022_PROGRAM_ID,
+            mint=mint_pubkey,
+            decimals=decimals,
+            mint_authority=self.payer.pubkey(),
+        ))
 
-        mint_address = match.group(1)
-        print(f"Created Token-2022 NonTransferable mint: {mint_address}")
-        return mint_address
+        sig = self._send_tx(
+            [create_ix, _initialize_non_transferable_mint_ix(mint_pubkey), init_ix],
+            [self.payer, mint_keypair],
+            blockhash=blockhash,
+        )
+        print(f"Created Token-2022 NonTransferable mint: {mint_pubkey} (tx: {sig})")
+        return str(mint_pubkey)
 
     def mint_tokens(
         self,
@@ -177,6 +216,7 @@ class TokenManager:
         destination_owner: str,
         amount: int,
         token_program: str = "spl",
+        blockhash: Optional[Hash] = None,
     ) -> str:
         """
         Mint tokens to a destination wallet.
@@ -186,21 +226,22 @@ class TokenManager:
             destination_owner: Owner wallet public key (base58).
             amount: Raw amount (with decimals factored in).
             token_program: 'spl' or 'token2022'.
+            blockhash: Recent blockhash to reuse instead of fetching one.
 
         Returns:
             str: Transaction signature.
         """
-        mint_pk = Pubkey.from_string(mint)
-        owner_pk = Pubkey.from_string(destination_owner)
+        mint_pk = _pubkey(mint)
+        owner_pk = _pubkey(destination_owner)
         program_id = TOKEN_2022_PROGRAM_ID if token_program == "token2022" else TOKEN_PROGRAM_ID
 
         ata = get_associated_token_address(owner_pk, mint_pk, program_id)
 
-        # Check if ATA exists
-        acct_info = self.client.get_account_info(ata)
+        # Idempotent create: no getAccountInfo round trip to see if the ATA
+        # exists; left out entirely once this manager has seen the ATA
         ixs: List[Instruction] = []
-        if acct_info.value is None:
-            ixs.append(_create_ata_ix(self.payer.pubkey(), owner_pk, mint_pk, program_id))
+        if ata not in self._existing_atas:
+            ixs.append(_create_ata_ix(self.payer.pubkey(), owner_pk, mint_pk, program_id, idempotent=True))
 
         ixs.append(mint_to(MintToParams(
             program_id=program_id,
@@ -211,27 +252,262 @@ class TokenManager:
             signers=[self.payer.pubkey()],
         )))
 
-        sig = self._send_tx(ixs, [self.payer])
+        sig = self._send_tx(ixs, [self.payer], blockhash=blockhash)
+        self._existing_atas.add(ata)
         print(f"Minted {amount} tokens to {ata} (tx: {sig})")
         return sig
 
-    def get_token_balances(self, owner: Optional[str] = None) -> List[Dict[str, Any]]:
+    def mint_tokens_bulk(
+        self,
+        mint: str,
+        recipients: List[tuple],
+        token_program: str = "spl",
+    ) -> List[str]:
+        """
+        Mint tokens to many wallets, _MINT_BULK_CHUNK recipients per transaction.
+
+        ATA existence for every recipient is read with one getMultipleAccounts
+        per 100 ATAs; create-ATA instructions are added only for missing ones.
+
+        Args:
+            mint: Mint public key (base58).
+            recipients: (owner base58, raw amount) pairs.
+            token_program: 'spl' or 'token2022'.
+
+        Returns:
+            List of transaction signatures, one per chunk.
+        """
+        mint_pk = _pubkey(mint)
+        program_id = TOKEN_2022_PROGRAM_ID if token_program == "token2022" else TOKEN_PROGRAM_ID
+        owners = [_pubkey(owner) for owner, _ in recipients]
+        atas = [get_associated_token_address(owner_pk, mint_pk, program_id) for owner_pk in owners]
+
+        exists = [ata in self._existing_atas for ata in atas]
+        unknown = [i for i, known in enumerate(exists) if not known]
+        for start in range(0, len(unknown), 100):
+            chunk = unknown[start:start + 100]
+            infos = self.client.get_multiple_accounts([atas[i] for i in chunk]).value
+            for i, info in zip(chunk, infos):
+                exists[i] = info is not None
+        # Create each missing ATA once even if its owner is listed twice
+        seen = set()
+        for i, ata in enumerate(atas):
+            if ata in seen:
+                exists[i] = True
+            seen.add(ata)
+
+        sigs = []
+        with self.with_batched_blockhash():
+            for start in range(0, len(recipients), _MINT_BULK_CHUNK):
+                ixs: List[Instruction] = []
+                for i in range(start, min(start + _MINT_BULK_CHUNK, len(recipients))):
+                    if not exists[i]:
+                        ixs.append(_create_ata_ix(self.payer.pubkey(), owners[i], mint_pk, program_id))
+                    ixs.append(mint_to(MintToParams(
+                        program_id=program_id,
+                        mint=mint_pk,
+                        dest=atas[i],
+                        mint_authority=self.payer.pubkey(),
+                        amount=recipients[i][1],
+                        signers=[self.payer.pubkey()],
+                    )))
+                sig = self._send_tx(ixs, [self.payer])
+                self._existing_atas.update(atas[start:start + _MINT_BULK_CHUNK])
+                print(f"Minted to {min(start + _MINT_BULK_CHUNK, len(recipients)) - start} recipients (tx: {sig})")
+                sigs.append(sig)
+        return sigs
+
+    def mint_nft(
+        self,
+        mint: str,
+        owner: str,
+        fee_payer: Optional[Keypair] = None,
+        mint_authority: Optional[Keypair] = None,
+    ) -> Dict[str, str]:
+        """
+        Create the owner's Token-2022 ATA and mint exactly 1 token into it,
+        in a single transaction.
+
+        Args:
+            mint: Freshly created 0-decimal Token-2022 mint (base58).
+            owner: Recipient wallet or PDA (base58).
+            fee_payer: Pays fees and ATA rent. Defaults to own wallet.
+            mint_authority: Mint authority signer. Defaults to own wallet.
+
+        Returns:
+            Dict with ata and signature.
+        """
+        payer = fee_payer or self.payer
+        authority = mint_authority or self.payer
+        mint_pk = _pubkey(mint)
+        owner_pk = _pubkey(owner)
+        ata = get_associated_token_address(owner_pk, mint_pk, TOKEN_2022_PROGRAM_ID)
+
+        ixs = [
+            _create_ata_ix(payer.pubkey(), owner_pk, mint_pk, TOKEN_2022_PROGRAM_ID, idempotent=True),
+            mint_to(MintToParams(
+                program_id=TOKEN_2022_PROGRAM_ID,
+                mint=mint_pk,
+                dest=ata,
+                mint_authority=authority.pubkey(),
+                amount=1,
+                signers=[authority.pubkey()],
+            )),
+        ]
+        signers = [payer] if authority.pubkey() == payer.pubkey() else [payer, authority]
+        sig = self._send_tx(ixs, signers, fee_payer=payer.pubkey())
+        return {"ata": str(ata), "signature": sig}
+
+    def mint_nfts_batch(
+        self,
+        owners: List[str],
+        fee_payer: Optional[Keypair] = None,
+        mint_authority: Optional[Keypair] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Create a fresh 0-decimal Token-2022 mint per owner and mint 1 token
+        into the owner's ATA. Each owner is one transaction; all of them are
+        sent in a single JSON-RPC batch and confirmed with one status poll.
+
+        Args:
+            owners: Recipient wallets or PDAs (base58).
+            fee_payer: Pays fees and rent. Defaults to own wallet.
+            mint_authority: Mint authority of the new mints. Defaults to own wallet.
+
+        Returns:
+            List (in owner order) of dicts with owner, mint, ata, signature
+            and error (None on success).
+        """
+        if not owners:
+            return []
+        payer = fee_payer or self.payer
+        authority = mint_authority or self.payer
+        signers_base = [payer] if authority.pubkey() == payer.pubkey() else [payer, authority]
+        rent = self._rent_exempt(_MINT_SIZE)
+        blockhash = self._blockhash()
+
+        results: List[Dict[str, Any]] = []
+        bodies = []
+        for i, owner in enumerate(owners):
+            mint_keypair = Keypair()
+            mint_pk = mint_keypair.pubkey()
+            owner_pk = _pubkey(owner)
+            ata = get_associated_token_address(owner_pk, mint_pk, TOKEN_2022_PROGRAM_ID)
+            ixs = [
+                create_account(CreateAccountParams(
+                    from_pubkey=payer.pubkey(),
+                    to_pubkey=mint_pk,
+                    lamports=rent,
+                    space=_MINT_SIZE,
+                    owner=TOKEN_2022_PROGRAM_ID,
+                )),
+                initialize_mint(InitializeMintParams(
+                    program_id=TOKEN_2022_PROGRAM_ID,
+                    mint=mint_pk,
+                    decimals=0,
+                    mint_authority=authority.pubkey(),
+                )),
+                _create_ata_ix(payer.pubkey(), owner_pk, mint_pk, TOKEN_2022_PROGRAM_ID),
+                mint_to(MintToParams(
+                    program_id=TOKEN_2022_PROGRAM_ID,
+                    mint=mint_pk,
+                    dest=ata,
+                    mint_authority=authority.pubkey(),
+                    amount=1,
+                    signers=[authority.pubkey()],
+                )),
+            ]
+            tx = build_tx(ixs, [*signers_base, mint_keypair], blockhash)
+            results.append({"owner": owner, "mint": str(mint_pk), "ata": str(ata), "signature": None, "error": None})
+            bodies.append({
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "sendTransaction",
+                "params": [
+                    base64.b64encode(bytes(tx)).decode(),
+                    {"encoding": "base64", "skipPreflight": True, "preflightCommitment": "confirmed"},
+                ],
+            })
+
+        replies = self._rpc_batch(bodies)
+        for i, result in enumerate(results):
+            reply = replies.get(i) or {"error": "no reply"}
+            if reply.get("result"):
+                result["signature"] = reply["result"]
+            else:
+                result["error"] = str(reply.get("error"))
+
+        # Wait for confirmation of everything that was accepted
+        pending = [r for r in results if r["signature"]]
+        for delay in poll_delays():
+            if not pending:
+                break
+            time.sleep(delay)
+            status = self.client.get_signature_statuses([Signature.from_string(r["signature"]) for r in pending])
+            still = []
+            for r, st in zip(pending, status.value or [None] * len(pending)):
+                if st is None:
+                    still.append(r)
+                elif st.err:
+                    r["error"] = f"Transaction error: {st.err}"
+            pending = still
+        return results
+
+    def get_token_balances(self, owner: Optional[str] = None, use_batch: bool = True) -> List[Dict[str, Any]]:
         """
         Get all token balances for a wallet (both SPL and Token-2022).
 
         Args:
             owner: Wallet public key (base58). Defaults to own wallet.
+            use_batch: Query both token programs in one JSON-RPC batch.
+                Set False for RPC providers that reject or serialize batches.
 
         Returns:
             List of dicts with mint, balance, decimals, program fields.
         """
         owner_pk = Pubkey.from_string(owner) if owner else self.payer.pubkey()
         balances: List[Dict[str, Any]] = []
-
-        for program_id, program_name in [
+        programs = [
             (TOKEN_PROGRAM_ID, "spl"),
             (TOKEN_2022_PROGRAM_ID, "token2022"),
-        ]:
+        ]
+
+        if use_batch:
+            bodies = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "getTokenAccountsByOwner",
+                    "params": [str(owner_pk), {"programId": str(program_id)}, {"encoding": "jsonParsed"}],
+                }
+                for i, (program_id, _) in enumerate(programs)
+            ]
+            try:
+                replies = self._rpc_batch(bodies)
+            except Exception as e:
+                print(f"Warning: batched token account query failed, retrying per program: {e}")
+                return self.get_token_balances(owner, use_batch=False)
+            for i, (_, program_name) in enumerate(programs):
+                try:
+                    reply = replies[i]
+                    if "error" in reply:
+                        raise Exception(reply["error"])
+                    for acct in reply["result"]["value"] or []:
+                        info = acct["account"]["data"]["parsed"]["info"]
+                        token_amount = info["tokenAmount"]
+                        balances.append({
+                            "mint": info["mint"],
+                            "balance": float(token_amount["uiAmountString"]),
+                            "raw_amount": int(token_amount["amount"]),
+                            "decimals": token_amount["decimals"],
+                            "program": program_name,
+                            "account": acct["pubkey"],
+                        })
+                except Exception as e:
+                    print(f"Warning: failed to query {program_name} accounts: {e}")
+            return balances
+
+        for program_id, program_name in programs:
             try:
                 resp = self.client.get_token_accounts_by_owner_json_parsed(
                     owner_pk,
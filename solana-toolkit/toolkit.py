@@ -1,9 +1,6 @@
 """ResonantOS Solana Toolkit — unified entry point."""
 
 from wallet import SolanaWallet
-from token_manager import TokenManager
-from nft_minter import NFTMinter
-from dao_reader import DAOReader
 
 
 class ResonantToolkit:
@@ -16,7 +13,7 @@ class ResonantToolkit:
         realm: str = "42sRg1Spzu3YxwXTduDFLWPtb4JJQhmMmDMbPPmnvoTY",
     ):
         """
-        Initialize all toolkit components with a shared wallet.
+        Initialize the shared wallet; components are built on first access.
 
         Args:
             keypair_path: Path to Solana keypair JSON file.
@@ -24,9 +21,34 @@ class ResonantToolkit:
             realm: DAO realm public key (base58).
         """
         self.wallet = SolanaWallet(keypair_path=keypair_path, network=network)
-        self.tokens = TokenManager(wallet=self.wallet)
-        self.nfts = NFTMinter(wallet=self.wallet)
-        self.dao = DAOReader(wallet=self.wallet, realm=realm)
+        self.realm = realm
+        self._tokens = None
+        self._nfts = None
+        self._dao = None
+
+    @property
+    def tokens(self):
+        """TokenManager sharing the toolkit wallet."""
+        if self._tokens is None:
+            from token_manager import TokenManager
+            self._tokens = TokenManager(wallet=self.wallet)
+        return self._tokens
+
+    @property
+    def nfts(self):
+        """NFTMinter sharing the toolkit wallet."""
+        if self._nfts is None:
+            from nft_minter import NFTMinter
+            self._nfts = NFTMinter(wallet=self.wallet)
+        return self._nfts
+
+    @property
+    def dao(self):
+        """DAOReader for the toolkit realm."""
+        if self._dao is None:
+            from dao_reader import DAOReader
+            self._dao = DAOReader(wallet=self.wallet, realm=self.realm)
+        return self._dao
 
     @property
     def pubkey(self) -> str:
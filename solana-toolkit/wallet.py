@@ -1,11 +1,83 @@
+import asyncio
 import json
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 
+# HTTP/2 (one multiplexed TLS connection per endpoint) when httpx's h2 extra
+# is installed; otherwise solana-py's default HTTP/1.1 keep-alive pool
+try:
+    import h2  # noqa: F401
+    import httpx
+
+    _HTTP2_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=8)
+except ImportError:
+    httpx = None
+
+
+# expanded path -> (st_mtime_ns, Keypair); repeat loads cost one stat
+_KEYPAIR_CACHE: Dict[str, tuple] = {}
+
+
+def load_keypair(keypair_path: str) -> Keypair:
+    """
+    Load a Solana CLI JSON keypair file.
+
+    Raises:
+        FileNotFoundError: If the keypair file does not exist.
+        ValueError: If the keypair file contains invalid data.
+    """
+    expanded_path = Path(keypair_path).expanduser()
+
+    try:
+        mtime_ns = expanded_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Keypair file not found: {expanded_path}")
+    cached = _KEYPAIR_CACHE.get(str(expanded_path))
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    try:
+        with open(expanded_path, 'r') as f:
+            secret_key = json.load(f)
+
+        keypair = Keypair.from_bytes(bytes(secret_key))
+    except (json.JSONDecodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid keypair file format: {e}")
+    _KEYPAIR_CACHE[str(expanded_path)] = (mtime_ns, keypair)
+    return keypair
+
+
+# rpc_url -> Client, so every wallet/client on one endpoint shares a
+# keep-alive connection pool
+_CLIENTS: Dict[str, Client] = {}
+
+
+def _use_http2(client):
+    """Swap a solana-py (Async)Client's httpx session for an HTTP/2 one."""
+    provider = getattr(client, "_provider", None)
+    session = getattr(provider, "session", None)
+    if httpx is None or session is None:
+        return client
+    if isinstance(session, httpx.AsyncClient):
+        provider.session = httpx.AsyncClient(http2=True, timeout=session.timeout, limits=_HTTP2_LIMITS)
+    elif isinstance(session, httpx.Client):
+        provider.session = httpx.Client(http2=True, timeout=session.timeout, limits=_HTTP2_LIMITS)
+        session.close()
+    return client
+
+
+def rpc_client(rpc_url: str) -> Client:
+    """Return the shared solana-py Client for an RPC URL."""
+    client = _CLIENTS.get(rpc_url)
+    if client is None:
+        client = _CLIENTS[rpc_url] = _use_http2(Client(rpc_url))
+    return client
+
 
 class SolanaWallet:
     """A Solana wallet wrapper for keypair management and basic RPC operations."""
@@ -22,19 +94,7 @@ class SolanaWallet:
             FileNotFoundError: If the keypair file does not exist.
             ValueError: If the keypair file contains invalid data.
         """
-        expanded_path = Path(keypair_path).expanduser()
-        
-        if not expanded_path.exists():
-            raise FileNotFoundError(f"Keypair file not found: {expanded_path}")
-        
-        try:
-            with open(expanded_path, 'r') as f:
-                secret_key = json.load(f)
-            
-            keypair_bytes = bytes(secret_key)
-            self.keypair = Keypair.from_bytes(keypair_bytes)
-        except (json.JSONDecodeError, ValueError, TypeError) as e:
-            raise ValueError(f"Invalid keypair file format: {e}")
+        self.keypair = load_keypair(keypair_path)
         
         if network == "devnet":
             rpc_url = "https://api.devnet.solana.com"
@@ -45,9 +105,23 @@ class SolanaWallet:
         else:
             rpc_url = network
         
-        self.client = Client(rpc_url)
+        self.client = rpc_client(rpc_url)
+        self.rpc_url = rpc_url
         self.network = network
         self.pubkey = self.keypair.pubkey()
+        self._aclient: Optional[AsyncClient] = None
+
+    @property
+    def aclient(self) -> AsyncClient:
+        """
+        Nonblocking RPC client for the same endpoint, created on first use.
+
+        Bound to the event loop it is first awaited in; use from one
+        long-lived loop (the sync wrappers open their own client).
+        """
+        if self._aclient is None:
+            self._aclient = _use_http2(AsyncClient(self.rpc_url))
+        return self._aclient
     
     def get_balance(self) -> float:
         """
@@ -59,8 +133,15 @@ class SolanaWallet:
         Raises:
             Exception: If the RPC request fails or returns no value.
         """
-        response = self.client.get_balance(self.pubkey)
-        
+        return self._balance_from(self.client.get_balance(self.pubkey))
+
+    async def get_balance_async(self, aclient: Optional[AsyncClient] = None) -> float:
+        """Nonblocking get_balance (uses self.aclient unless one is given)."""
+        response = await (aclient or self.aclient).get_balance(self.pubkey)
+        return self._balance_from(response)
+
+    @staticmethod
+    def _balance_from(response) -> float:
         if response.value is None:
             raise Exception("Failed to retrieve balance from RPC")
         
@@ -101,7 +182,34 @@ class SolanaWallet:
             Exception: If the RPC request fails.
         """
         response = self.client.get_signatures_for_address(self.pubkey, limit=limit)
-        
+        return self._transactions_from(response)
+
+    async def get_recent_transactions_async(
+        self, limit: int = 10, aclient: Optional[AsyncClient] = None
+    ) -> List[Dict[str, Any]]:
+        """Nonblocking get_recent_transactions (uses self.aclient unless one is given)."""
+        response = await (aclient or self.aclient).get_signatures_for_address(self.pubkey, limit=limit)
+        return self._transactions_from(response)
+
+    def get_balance_and_transactions(self, limit: int = 10) -> Tuple[float, List[Dict[str, Any]]]:
+        """
+        Fetch balance and recent transactions concurrently (one round trip of latency).
+
+        Returns:
+            (balance in SOL, recent transactions as from get_recent_transactions)
+        """
+        async def _both():
+            async with _use_http2(AsyncClient(self.rpc_url)) as aclient:
+                return await asyncio.gather(
+                    self.get_balance_async(aclient),
+                    self.get_recent_transactions_async(limit, aclient),
+                )
+
+        balance, transactions = asyncio.run(_both())
+        return balance, transactions
+
+    @staticmethod
+    def _transactions_from(response) -> List[Dict[str, Any]]:
         if response.value is None:
             raise Exception("Failed to retrieve transactions from RPC")
         
@@ -9,48 +9,207 @@ Usage:
 """
 
 import argparse
+import hashlib
+import json
 import math
+import mmap
 import os
 import re
 import sys
-from collections import defaultdict
+import tempfile
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple, dataclass, replace
+from functools import lru_cache, partial
+from operator import attrgetter
 from pathlib import Path
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ── Pattern Definitions ──────────────────────────────────────────────
 
+# Simple (?<!...) / (?=...) style assertions, as used in PATTERNS
+_LOOKAROUND = re.compile(rb"\(\?<?[=!][^()]*\)")
+
+
+def _compile(src: bytes):
+    """Compile with RE2 (linear time, no backtracking) when it is installed;
+    patterns with lookarounds, which RE2 does not support, use re."""
+    if re2 is not None and not _LOOKAROUND.search(src):
+        try:
+            return re2.compile(src)
+        except re2.error:
+            pass
+    return re.compile(src)
+
+
+# Patterns are bytes so files are matched without decoding; every pattern is ASCII.
+# They run over whole files, so whitespace is written [^\S\r\n] (\s minus line
+# breaks) and nothing can match across lines.
 PATTERNS = {
     # API Keys & Tokens
-    "AWS Access Key": re.compile(r"AKIA[0-9A-Z]{16}"),
-    "AWS Secret Key": re.compile(r"(?i)aws[_\-]?secret[_\-]?access[_\-]?key\s*[=:]\s*[A-Za-z0-9/+=]{40}"),
-    "OpenAI API Key": re.compile(r"sk-[A-Za-z0-9]{20,}"),
-    "Anthropic API Key": re.compile(r"sk-ant-[A-Za-z0-9\-]{20,}"),
-    "GitHub Token": re.compile(r"gh[pousr]_[A-Za-z0-9_]{36,}"),
-    "Generic API Key": re.compile(r"(?i)(api[_\-]?key|apikey)\s*[=:]\s*['\"]?[A-Za-z0-9\-_]{20,}['\"]?"),
-    "Generic Secret": re.compile(r"(?i)(secret|password|passwd|pwd)\s*[=:]\s*['\"]?[^\s'\"]{8,}['\"]?"),
-    "Bearer Token": re.compile(r"(?i)bearer\s+[A-Za-z0-9\-_.~+/]+=*"),
-    "Private Key Block": re.compile(r"-----BEGIN\s+(RSA|EC|DSA|OPENSSH|PGP)?\s*PRIVATE KEY-----"),
-    "JWT Token": re.compile(r"eyJ[A-Za-z0-9\-_]{10,}\.eyJ[A-Za-z0-9\-_]{10,}\.[A-Za-z0-9\-_.+/=]{10,}"),
+    "AWS Access Key": _compile(rb"AKIA[0-9A-Z]{16}"),
+    "AWS Secret Key": _compile(rb"(?i)aws[_\-]?secret[_\-]?access[_\-]?key[^\S\r\n]*[=:][^\S\r\n]*[A-Za-z0-9/+=]{40}"),
+    "OpenAI API Key": _compile(rb"sk-[A-Za-z0-9]{20,}"),
+    "Anthropic API Key": _compile(rb"sk-ant-[A-Za-z0-9\-]{20,}"),
+    "GitHub Token": _compile(rb"gh[pousr]_[A-Za-z0-9_]{36,}"),
+    "Generic API Key": _compile(rb"(?i)(api[_\-]?key|apikey)[^\S\r\n]*[=:][^\S\r\n]*['\"]?[A-Za-z0-9\-_]{20,}['\"]?"),
+    "Generic Secret": _compile(rb"(?i)(secret|password|passwd|pwd)[^\S\r\n]*[=:][^\S\r\n]*['\"]?[^\s'\"]{8,256}['\"]?"),
+    "Bearer Token": _compile(rb"(?i)bearer[^\S\r\n]+[A-Za-z0-9\-_.~+/]+=*"),
+    "Private Key Block": _compile(rb"-----BEGIN[^\S\r\n]+(RSA|EC|DSA|OPENSSH|PGP)?[^\S\r\n]*PRIVATE KEY-----"),
+    "JWT Token": _compile(rb"eyJ[A-Za-z0-9\-_]{10,}\.eyJ[A-Za-z0-9\-_]{10,}\.[A-Za-z0-9\-_.+/=]{10,}"),
 
     # Crypto
-    "Solana Private Key (base58, 64+ chars)": re.compile(r"(?<![A-Za-z0-9])[1-9A-HJ-NP-Za-km-z]{64,88}(?![A-Za-z0-9])"),
-    "Seed Phrase (12+ words)": re.compile(r"(?i)(?:seed|mnemonic|recovery)\s*[=:]\s*.{20,}"),
-    "Hex Private Key (64 hex chars)": re.compile(r"(?i)(?:private[_\-]?key|priv[_\-]?key)\s*[=:]\s*[0-9a-f]{64}"),
+    "Solana Private Key (base58, 64+ chars)": _compile(rb"(?<![A-Za-z0-9])[1-9A-HJ-NP-Za-km-z]{64,88}(?![A-Za-z0-9])"),
+    "Seed Phrase (12+ words)": _compile(rb"(?i)(?:seed|mnemonic|recovery)[^\S\r\n]*[=:][^\S\r\n]*[^\r\n]{20,}"),
+    "Hex Private Key (64 hex chars)": _compile(rb"(?i)(?:private[_\-]?key|priv[_\-]?key)[^\S\r\n]*[=:][^\S\r\n]*[0-9a-f]{64}"),
 
     # PII
-    "Email Address": re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}"),
-    "Phone Number": re.compile(r"(?<![0-9])(?:\+?[1-9]\d{1,2}[\s\-]?)?\(?\d{3}\)?[\s\-]?\d{3}[\s\-]?\d{4}(?![0-9])"),
-    "IP Address (private)": re.compile(r"(?:192\.168\.\d{1,3}\.\d{1,3}|10\.\d{1,3}\.\d{1,3}\.\d{1,3}|172\.(?:1[6-9]|2\d|3[01])\.\d{1,3}\.\d{1,3})"),
+    # The lookbehind starts matches only at the beginning of a local-part run;
+    # without it every offset in a long run is retried, which is quadratic
+    "Email Address": _compile(rb"(?<![a-zA-Z0-9._%+\-])[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}"),
+    "Phone Number": _compile(rb"(?<![0-9])(?:\+?[1-9]\d{1,2}(?:[^\S\r\n]|-)?)?\(?\d{3}\)?(?:[^\S\r\n]|-)?\d{3}(?:[^\S\r\n]|-)?\d{4}(?![0-9])"),
+    "IP Address (private)": _compile(rb"(?:192\.168\.\d{1,3}\.\d{1,3}|10\.\d{1,3}\.\d{1,3}\.\d{1,3}|172\.(?:1[6-9]|2\d|3[01])\.\d{1,3}\.\d{1,3})"),
 
     # Paths & Environment
-    "Hardcoded Home Path": re.compile(r"/Users/[a-zA-Z0-9_\-]+/"),
-    "Hardcoded Home Path (Linux)": re.compile(r"/home/[a-zA-Z0-9_\-]+/"),
-    "Environment Variable Assignment": re.compile(r"(?i)export\s+(?:API_KEY|SECRET|TOKEN|PASSWORD|PRIVATE_KEY)\s*="),
+    "Hardcoded Home Path": _compile(rb"/Users/[a-zA-Z0-9_\-]+/"),
+    "Hardcoded Home Path (Linux)": _compile(rb"/home/[a-zA-Z0-9_\-]+/"),
+    "Environment Variable Assignment": _compile(rb"(?i)export[^\S\r\n]+(?:API_KEY|SECRET|TOKEN|PASSWORD|PRIVATE_KEY)[^\S\r\n]*="),
 
     # Misc
-    "Telegram Bot Token": re.compile(r"\d{8,10}:[A-Za-z0-9_\-]{35}"),
-    "Slack Token": re.compile(r"xox[baprs]\-[A-Za-z0-9\-]{10,}"),
-    "Discord Token": re.compile(r"(?i)discord[_\-]?token\s*[=:]\s*[A-Za-z0-9\-_.]{50,}"),
+    "Telegram Bot Token": _compile(rb"\d{8,10}:[A-Za-z0-9_\-]{35}"),
+    "Slack Token": _compile(rb"xox[baprs]\-[A-Za-z0-9\-]{10,}"),
+    "Discord Token": _compile(rb"(?i)discord[_\-]?token[^\S\r\n]*[=:][^\S\r\n]*[A-Za-z0-9\-_.]{50,}"),
+}
+
+
+# Literals of which at least one must occur in a file for the pattern to match
+# there. Caseless patterns list lowercase literals. Patterns without a fixed
+# literal are not listed.
+_PREFILTERS = {
+    "AWS Access Key": (b"AKIA",),
+    "AWS Secret Key": (b"aws",),
+    "OpenAI API Key": (b"sk-",),
+    "Anthropic API Key": (b"sk-ant-",),
+    "GitHub Token": (b"ghp_", b"gho_", b"ghu_", b"ghs_", b"ghr_"),
+    "Generic API Key": (b"api",),
+    "Generic Secret": (b"secret", b"passw", b"pwd"),
+    "Bearer Token": (b"bearer",),
+    "Private Key Block": (b"PRIVATE KEY-----",),
+    "JWT Token": (b"eyJ",),
+    "Seed Phrase (12+ words)": (b"seed", b"mnemonic", b"recovery"),
+    "Hex Private Key (64 hex chars)": (b"priv",),
+    "Email Address": (b"@",),
+    "IP Address (private)": (b"192.168.", b"10.", b"172."),
+    "Hardcoded Home Path": (b"/Users/",),
+    "Hardcoded Home Path (Linux)": (b"/home/",),
+    "Environment Variable Assignment": (b"export",),
+    "Telegram Bot Token": (b":",),
+    "Slack Token": (b"xox",),
+    "Discord Token": (b"discord",),
 }
+_CASELESS = {name for name, p in PATTERNS.items() if p.pattern.startswith(b"(?i)")}
+
+# _PREFILTERS as one literal search per pattern, caseless where the pattern is
+_PREFILTER_RES = {
+    name: _compile((b"(?i)" if name in _CASELESS else b"") + b"|".join(map(re.escape, literals)))
+    for name, literals in _PREFILTERS.items()
+}
+
+
+def _scoped(src: bytes) -> bytes:
+    """Pattern source wrapped so it can sit inside an alternation (a leading
+    global (?i) becomes a scoped (?i:...) group)."""
+    if src.startswith(b"(?i)"):
+        return b"(?i:" + src[4:] + b")"
+    return b"(?:" + src + b")"
+
+
+# All patterns in one alternation: a single search tells whether any of them
+# can match a file, so clean files cost one regex pass instead of one per pattern.
+# Lookarounds are dropped, which only widens what the gate lets through, so the
+# whole alternation stays RE2-compatible.
+_ANY_PATTERN = _compile(b"|".join(
+    _scoped(_LOOKAROUND.sub(b"", p.pattern)) for p in PATTERNS.values()
+))
+
+
+def _build_hyperscan_db():
+    """Compile the patterns Hyperscan supports (no lookarounds) into one
+    block-mode database. Returns (db, {pattern name: id}) or (None, {})."""
+    if hyperscan is None:
+        return None, {}
+    ids, expressions, flags = {}, [], []
+    for name, pattern in PATTERNS.items():
+        src = pattern.pattern
+        if b"(?<" in src or b"(?=" in src or b"(?!" in src:
+            continue
+        flag = hyperscan.HS_FLAG_SINGLEMATCH
+        if src.startswith(b"(?i)"):
+            src, flag = src[4:], flag | hyperscan.HS_FLAG_CASELESS
+        ids[name] = len(expressions)
+        expressions.append(src)
+        flags.append(flag)
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        db.compile(expressions=expressions, ids=list(range(len(expressions))),
+                   elements=len(expressions), flags=flags)
+    except hyperscan.error:
+        return None, {}
+    return db, ids
+
+
+_HS_DB, _HS_IDS = _build_hyperscan_db()
+
+
+def candidate_patterns(data) -> list:
+    """(name, pattern) pairs worth running over a file.
+
+    With Hyperscan installed, one SIMD pass over the whole file drops the
+    patterns that match nowhere in it; patterns it cannot compile are always
+    kept.
+    """
+    if _HS_DB is None:
+        return list(PATTERNS.items())
+    hits = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(pattern_id)
+
+    _HS_DB.scan(data, match_event_handler=on_match)
+    return [
+        (name, pattern) for name, pattern in PATTERNS.items()
+        if name not in _HS_IDS or _HS_IDS[name] in hits
+    ]
 
 # Files to always skip
 SKIP_EXTENSIONS = {
@@ -64,6 +223,9 @@ SKIP_EXTENSIONS = {
     ".lock",
 }
 
+# Files larger than this are skipped (minified bundles, generated blobs)
+MAX_SCAN_BYTES = 10 * 1024 * 1024
+
 SKIP_DIRS = {
     ".git", "node_modules", "__pycache__", ".venv", "venv",
     "target", "build", "dist", ".eggs", "*.egg-info",
@@ -81,118 +243,368 @@ ALLOWLIST = [
     "/Users/augmentor/",  # Will be flagged but can be allowlisted per-project
 ]
 
+# ALLOWLIST as one case-insensitive alternation, searched once per match
+_ALLOWLIST_RE = re.compile("|".join(map(re.escape, ALLOWLIST)), re.IGNORECASE) if ALLOWLIST else None
+
 # ── Entropy Check ────────────────────────────────────────────────────
 
+# Below this length numpy's per-call overhead outweighs the Python loop
+_NUMPY_ENTROPY_MIN_LEN = 256
+
+if numba is not None and np is not None:
+    @numba.njit(cache=True)
+    def _entropy_bytes(a):
+        """Shannon entropy of a uint8 array, compiled to native code."""
+        counts = np.zeros(256, np.int64)
+        for i in range(a.size):
+            counts[a[i]] += 1
+        n = a.size
+        h = 0.0
+        for c in counts:
+            if c:
+                p = c / n
+                h -= p * math.log2(p)
+        return h
+else:
+    _entropy_bytes = None
+
+
+
 def shannon_entropy(s: str) -> float:
     """Calculate Shannon entropy of a string."""
     if not s:
         return 0.0
-    freq = defaultdict(int)
-    for c in s:
-        freq[c] += 1
-    length = len(s)
-    return -sum((count / length) * math.log2(count / length) for count in freq.values())
+    if _entropy_bytes is not None and s.isascii():
+        return _entropy_bytes(np.frombuffer(s.encode("ascii"), dtype=np.uint8))
+    if np is not None and len(s) >= _NUMPY_ENTROPY_MIN_LEN and s.isascii():
+        counts = np.bincount(np.frombuffer(s.encode("ascii"), dtype=np.uint8))
+        p = counts[counts > 0] / len(s)
+        return float(-np.sum(p * np.log2(p)))
+    inv = 1.0 / len(s)
+    log2 = math.log2
+    return -sum(c * inv * log2(c * inv) for c in Counter(s).values())
+
 
+# Quoted base64/hex-like runs that are long enough to be a secret
+_ENTROPY_CAND = _compile(rb'["\']([A-Za-z0-9+/=\-_]{20,})["\']')
 
-def check_high_entropy_strings(line: str, min_length: int = 20, min_entropy: float = 4.5):
-    """Find high-entropy strings that might be secrets."""
+
+def check_high_entropy_strings(data, min_length: int = 20, min_entropy: float = 4.5):
+    """Find high-entropy strings that might be secrets.
+
+    Returns (offset, pattern label, shown match) tuples.
+    """
     findings = []
+    # A string of n characters has entropy at most log2(n), so shorter
+    # candidates cannot reach min_entropy and skip the histogram entirely
+    min_length = max(min_length, math.ceil(2 ** min_entropy))
     # Look for quoted strings or assignments with high entropy
-    for match in re.finditer(r'["\']([A-Za-z0-9+/=\-_]{20,})["\']', line):
-        candidate = match.group(1)
+    for match in _ENTROPY_CAND.finditer(data):
+        if match.end(1) - match.start(1) < min_length:
+            continue
+        candidate = match.group(1).decode("ascii")
         ent = shannon_entropy(candidate)
-        if ent >= min_entropy and len(candidate) >= min_length:
-            findings.append({
-                "pattern": f"High-Entropy String (entropy={ent:.1f})",
-                "match": candidate[:60] + ("..." if len(candidate) > 60 else ""),
-            })
+        if ent >= min_entropy:
+            findings.append((
+                match.start(),
+                f"High-Entropy String (entropy={ent:.1f})",
+                candidate[:60] + ("..." if len(candidate) > 60 else ""),
+            ))
     return findings
 
 
 # ── Scanner ──────────────────────────────────────────────────────────
 
+@dataclass
+class Finding:
+    """One pattern or entropy hit. Slotted: scans can produce thousands.
+
+    Repeats of the same pattern and match within a file are folded into the
+    first occurrence; count says how many there were.
+    """
+    __slots__ = ("file", "line", "pattern", "match", "context", "severity", "rank", "count")
+    file: str
+    line: int
+    pattern: str
+    match: str
+    context: str
+    severity: str
+    rank: int
+    count: int
+
+    def to_dict(self) -> dict:
+        """JSON form of the finding; rank is internal."""
+        return {
+            "file": self.file,
+            "line": self.line,
+            "pattern": self.pattern,
+            "match": self.match,
+            "context": self.context,
+            "severity": self.severity,
+            "count": self.count,
+        }
+
+
+def _finding(filepath, lineno: int, pattern: str, match: str, context: str) -> Finding:
+    sev = get_severity(pattern)
+    return Finding(str(filepath), lineno, pattern, match, context, sev, SEVERITY_ORDER.get(sev, 4), 1)
+
+
 def should_skip_dir(dirname: str) -> bool:
     return dirname in SKIP_DIRS or dirname.startswith(".")
 
 
-def should_skip_file(filepath: Path) -> bool:
-    return filepath.suffix.lower() in SKIP_EXTENSIONS
+def should_skip_file(filename: str) -> bool:
+    dot = filename.rfind(".")
+    return dot > 0 and filename[dot:].lower() in SKIP_EXTENSIONS
 
 
 def is_allowlisted(match_text: str) -> bool:
-    lower = match_text.lower()
-    return any(al.lower() in lower for al in ALLOWLIST)
+    return _ALLOWLIST_RE is not None and _ALLOWLIST_RE.search(match_text) is not None
+
+
+# Files smaller than this are read into memory; larger ones are memory-mapped
+_MMAP_MIN_BYTES = 64 * 1024
+
+# Leading bytes checked for NUL to detect binary files, as git does
+_SNIFF_BYTES = 4096
+
+
+# Line breaks as text-mode reading sees them
+_EOL = re.compile(rb"\r\n?|\n")
+
+
+def _scan_data(filepath, data) -> list:
+    """Findings for one file's bytes (or mmap), in line order.
+
+    Each pattern runs over the whole buffer in one finditer. Match offsets
+    map back to line numbers through a table of line start offsets, built
+    only once the file has a hit.
+    """
+    hits = []  # (line, pattern index, offset, Finding)
+    seen = {}  # (pattern, match) -> first Finding, to fold repeats
+    line_starts = []
+    contexts = {}  # line -> context, or None for skipped "#!" lines
+
+    def context_at(offset: int):
+        if not line_starts:
+            line_starts.append(0)
+            line_starts.extend(m.end() for m in _EOL.finditer(data))
+        lineno = bisect_right(line_starts, offset)
+        if lineno not in contexts:
+            end = line_starts[lineno] if lineno < len(line_starts) else len(data)
+            raw = data[line_starts[lineno - 1]:end]
+            if raw.strip().startswith(b"#!"):
+                contexts[lineno] = None
+            else:
+                contexts[lineno] = raw.decode("utf-8", "ignore").strip()[:120]
+        return lineno, contexts[lineno]
+
+    def add(index: int, offset: int, pattern: str, key: str, shown: str):
+        lineno, context = context_at(offset)
+        if context is None:
+            return
+        if (pattern, key) in seen:
+            seen[(pattern, key)].count += 1
+            return
+        seen[(pattern, key)] = finding = _finding(filepath, lineno, pattern, shown, context)
+        hits.append((lineno, index, offset, finding))
+
+    # Pattern matching
+    patterns = candidate_patterns(data)
+    if patterns and _ANY_PATTERN.search(data):
+        for index, (name, pattern) in enumerate(patterns):
+            gate = _PREFILTER_RES.get(name)
+            if gate is not None and not gate.search(data):
+                continue
+            for match in pattern.finditer(data):
+                text = match.group(0).decode("utf-8", "ignore")
+                if is_allowlisted(text):
+                    continue
+                add(index, match.start(), name, text, text[:80] + ("..." if len(text) > 80 else ""))
 
+    # Entropy check
+    for offset, label, shown in check_high_entropy_strings(data):
+        add(len(PATTERNS), offset, label, shown, shown)
 
-def scan_file(filepath: Path) -> list:
-    """Scan a single file for secrets/PII. Returns list of findings."""
-    findings = []
+    hits.sort(key=lambda h: h[:3])
+    return [h[3] for h in hits]
+
+
+def scan_file(filepath: str, max_bytes: int = MAX_SCAN_BYTES) -> list:
+    """Scan a single file for secrets/PII. Returns list of findings.
+
+    Files over max_bytes (0 = no limit) and binary files are skipped.
+    """
     try:
-        with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-            for lineno, line in enumerate(f, 1):
-                line_stripped = line.strip()
-                if not line_stripped or line_stripped.startswith("#!"):
+        with open(filepath, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if max_bytes and size > max_bytes:
+                return []
+            head = f.read(_SNIFF_BYTES)
+            if b"\0" in head:
+                return []
+            if size < _MMAP_MIN_BYTES:
+                return _scan_data(filepath, head + f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _scan_data(filepath, mm)
+    except (PermissionError, OSError):
+        return []
+
+
+def _gitignore_matcher(gitignore_path: str):
+    """Build is_ignored(rel_path, name, is_dir) from a .gitignore file, with
+    paths taken relative to the scanned root; None if there is no file.
+
+    With pathspec installed the full gitwildmatch rules apply (globs,
+    negation, anchored and directory-only patterns); otherwise an entry is
+    ignored when its name equals a pattern.
+    """
+    if not gitignore_path:
+        return None
+    try:
+        with open(gitignore_path) as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return None
+    if pathspec is not None:
+        spec = pathspec.PathSpec.from_lines("gitwildmatch", lines)
+        return lambda rel, name, is_dir: spec.match_file(rel + "/" if is_dir else rel)
+    names = set()
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            names.add(line.strip("/"))
+    return lambda rel, name, is_dir: name in names
+
+
+def _walk(root: str, is_ignored=None):
+    """Yield paths of the files to scan under root, in os.walk order.
+
+    Uses os.scandir directly so names are filtered on DirEntry.name without
+    building Path objects or extra stat calls. Like os.walk, symlinked
+    directories are listed but not followed.
+    """
+    stack = [(root, "")]
+    while stack:
+        path, rel = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            continue
+        subdirs = []
+        with it:
+            for entry in it:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_ignored is not None and is_ignored(rel + name, name, is_dir):
                     continue
+                if is_dir:
+                    if not should_skip_dir(name) and not entry.is_symlink():
+                        subdirs.append((entry.path, rel + name + "/"))
+                elif not should_skip_file(name):
+                    yield entry.path
+        stack.extend(reversed(subdirs))
 
-                # Pattern matching
-                for name, pattern in PATTERNS.items():
-                    for match in pattern.finditer(line):
-                        text = match.group(0)
-                        if is_allowlisted(text):
-                            continue
-                        findings.append({
-                            "file": str(filepath),
-                            "line": lineno,
-                            "pattern": name,
-                            "match": text[:80] + ("..." if len(text) > 80 else ""),
-                            "context": line_stripped[:120],
-                        })
-
-                # Entropy check
-                for ef in check_high_entropy_strings(line_stripped):
-                    ef["file"] = str(filepath)
-                    ef["line"] = lineno
-                    ef["context"] = line_stripped[:120]
-                    findings.append(ef)
 
-    except (PermissionError, OSError):
+# Below this many files a process pool costs more to start than it saves
+_PARALLEL_MIN_FILES = 32
+
+# Per-file findings from earlier runs, reused while a file is unchanged (--cache)
+CACHE_PATH = Path.home() / ".cache" / "resonantos-sanitize" / "findings.json"
+
+
+def _scan_files(filepaths: list, max_bytes: int) -> list:
+    """scan_file over each path, in order; one findings list per path."""
+    scan = partial(scan_file, max_bytes=max_bytes)
+    workers = os.cpu_count() or 1
+    if workers == 1 or len(filepaths) < _PARALLEL_MIN_FILES:
+        return [scan(fp) for fp in filepaths]
+    # Files are independent and the work is CPU-bound regex/entropy code,
+    # so worker processes sidestep the GIL. Workers compile PATTERNS on import.
+    chunksize = max(1, len(filepaths) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(scan, filepaths, chunksize=chunksize))
+
+
+def _cache_version(max_bytes: int) -> str:
+    """Cached findings are valid only for this exact scanner source and size limit."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(str(max_bytes).encode())
+    return digest.hexdigest()
+
+
+def _load_cache(cache_path: Path, version: str) -> dict:
+    try:
+        with open(cache_path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != version:
+        return {}
+    return data.get("files", {})
+
+
+def _save_cache(cache_path: Path, version: str, files: dict):
+    """Write the cache atomically (temp file + rename); failures are ignored."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": version, "files": files}, f)
+        os.replace(tmp, cache_path)
+    except OSError:
         pass
 
-    return findings
 
+def _file_stamp(filepath) -> str:
+    st = os.stat(filepath)
+    return f"{st.st_mtime_ns}:{st.st_size}:{st.st_ino}"
 
-def scan_directory(root: str, gitignore_path: str = None) -> list:
-    """Recursively scan directory for secrets/PII."""
-    all_findings = []
-    root_path = Path(root)
 
-    gitignore_patterns = set()
-    if gitignore_path:
-        try:
-            with open(gitignore_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        gitignore_patterns.add(line.strip("/"))
-        except FileNotFoundError:
-            pass
+def scan_directory(root: str, gitignore_path: str = None, max_bytes: int = MAX_SCAN_BYTES,
+                   cache_path: Path = None) -> list:
+    """Recursively scan directory for secrets/PII.
 
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        # Filter directories
-        dirnames[:] = [
-            d for d in dirnames
-            if not should_skip_dir(d) and d not in gitignore_patterns
-        ]
+    With cache_path set, files whose mtime, size and inode match the cache
+    reuse their stored findings instead of being rescanned.
+    """
+    all_findings = []
 
-        for filename in filenames:
-            filepath = Path(dirpath) / filename
-            if should_skip_file(filepath):
-                continue
-            if filename in gitignore_patterns:
-                continue
+    filepaths = list(_walk(str(Path(root)), _gitignore_matcher(gitignore_path)))
 
-            findings = scan_file(filepath)
-            all_findings.extend(findings)
+    if cache_path is None:
+        results = _scan_files(filepaths, max_bytes)
+    else:
+        version = _cache_version(max_bytes)
+        cache = _load_cache(cache_path, version)
+        results = [None] * len(filepaths)
+        stale = {}
+        for i, filepath in enumerate(filepaths):
+            key = os.path.abspath(filepath)
+            try:
+                stamp = _file_stamp(filepath)
+            except OSError:
+                results[i] = []
+                continue
+            entry = cache.get(key)
+            if entry and entry.get("stamp") == stamp:
+                results[i] = [replace(Finding(*row), file=str(filepath)) for row in entry["findings"]]
+            else:
+                stale[i] = (key, stamp)
+        misses = list(stale)
+        for i, findings in zip(misses, _scan_files([filepaths[i] for i in misses], max_bytes)):
+            results[i] = findings
+            key, stamp = stale[i]
+            cache[key] = {"stamp": stamp, "findings": [astuple(f) for f in findings]}
+        if misses:
+            _save_cache(cache_path, version, cache)
+
+    for findings in results:
+        all_findings.extend(findings)
 
     return all_findings
 
@@ -225,7 +637,11 @@ SEVERITY_MAP = {
     "High-Entropy String": "MEDIUM",
 }
 
+# Sort/filter rank stored on each Finding; unknown severities sort last
+SEVERITY_ORDER = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
+
 
+@lru_cache(maxsize=None)
 def get_severity(pattern_name: str) -> str:
     for key, sev in SEVERITY_MAP.items():
         if key in pattern_name:
@@ -239,13 +655,12 @@ def print_report(findings: list, root: str):
         return
 
     # Sort by severity
-    severity_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
-    findings.sort(key=lambda f: severity_order.get(get_severity(f["pattern"]), 4))
+    findings.sort(key=attrgetter("rank"))
 
     # Summary
     by_severity = defaultdict(int)
     for f in findings:
-        by_severity[get_severity(f["pattern"])] += 1
+        by_severity[f.severity] += 1
 
     print(f"\n{'='*60}")
     print(f"  SANITIZATION AUDIT REPORT — {root}")
@@ -260,18 +675,20 @@ def print_report(findings: list, root: str):
     # Details
     current_sev = None
     for f in findings:
-        sev = get_severity(f["pattern"])
+        sev = f.severity
         if sev != current_sev:
             current_sev = sev
             print(f"\n── {sev} ──")
 
-        rel_path = f["file"]
+        rel_path = f.file
         if rel_path.startswith(root):
             rel_path = rel_path[len(root):].lstrip("/")
 
-        print(f"  {rel_path}:{f['line']}")
-        print(f"    Pattern: {f['pattern']}")
-        print(f"    Match:   {f['match']}")
+        print(f"  {rel_path}:{f.line}")
+        print(f"    Pattern: {f.pattern}")
+        print(f"    Match:   {f.match}")
+        if f.count > 1:
+            print(f"    Count:   {f.count} in this file")
         print()
 
     print(f"{'='*60}")
@@ -279,6 +696,23 @@ def print_report(findings: list, root: str):
     print(f"{'='*60}")
 
 
+def print_json(findings: list, ndjson: bool = False):
+    """Write findings as an indented JSON array, or as one JSON object per
+    line (NDJSON) so output is written record by record."""
+    records = (f.to_dict() for f in findings)
+    if ndjson:
+        if orjson is not None:
+            for rec in records:
+                sys.stdout.buffer.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            for rec in records:
+                sys.stdout.write(json.dumps(rec) + "\n")
+    elif orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(list(records), option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        print(json.dumps(list(records), indent=2))
+
+
 # ── Main ─────────────────────────────────────────────────────────────
 
 def main():
@@ -286,27 +720,29 @@ def main():
     parser.add_argument("directory", help="Directory to scan")
     parser.add_argument("--ignore", help="Path to .gitignore file for exclusions")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--ndjson", action="store_true", help="Output as newline-delimited JSON, one finding per line")
     parser.add_argument("--severity", default="LOW",
                        choices=["CRITICAL", "HIGH", "MEDIUM", "LOW"],
                        help="Minimum severity to report (default: LOW)")
+    parser.add_argument("--max-bytes", type=int, default=MAX_SCAN_BYTES,
+                       help="Skip files larger than this many bytes, 0 for no limit (default: 10 MB)")
+    parser.add_argument("--cache", action="store_true",
+                       help=f"Reuse findings for unchanged files across runs (stored in {CACHE_PATH})")
     args = parser.parse_args()
 
     if not os.path.isdir(args.directory):
         print(f"Error: {args.directory} is not a directory", file=sys.stderr)
         sys.exit(1)
 
-    findings = scan_directory(args.directory, args.ignore)
+    findings = scan_directory(args.directory, args.ignore, args.max_bytes,
+                              CACHE_PATH if args.cache else None)
 
     # Filter by severity
-    severity_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
-    min_sev = severity_order[args.severity]
-    findings = [f for f in findings if severity_order.get(get_severity(f["pattern"]), 4) <= min_sev]
-
-    if args.json:
-        import json
-        for f in findings:
-            f["severity"] = get_severity(f["pattern"])
-        print(json.dumps(findings, indent=2))
+    min_sev = SEVERITY_ORDER[args.severity]
+    findings = [f for f in findings if f.rank <= min_sev]
+
+    if args.json or args.ndjson:
+        print_json(findings, ndjson=args.ndjson)
     else:
         print_report(findings, args.directory)
 